@@ -11,6 +11,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+from scipy.linalg import solve_banded
+from scipy.sparse import csr_matrix
+
 from yield_curve.common.curve.curve_interpolator import CurveException, CurveInterpolator
 
 
@@ -24,39 +28,72 @@ class CubicInterpolator(CurveInterpolator):
         self.x = None
         self.y = None
         self.second_deriv = None
+        self.banded = None
+        self.rhs_scale = None
+        self.second_deriv_sensitivity = None
 
     def initialize(self):
         """
         Prepare any transformations or setup required for cubic interpolation.
-        This method initializes the x, y, and second_deriv arrays based on the given curve.
-        """
-        self.x = self.curve.get_x()
-        self.y = self.curve.get_y()
-        n = len(self.x)
-        self.second_deriv = [0.0] * n
-        u = [0.0] * n
-
-        # Forward pass to compute second derivatives
-        for i in range(1, n - 1):
-            sig = (self.x[i] - self.x[i - 1]) / (self.x[i + 1] - self.x[i - 1])
-            p = sig * self.second_deriv[i - 1] + 2.0
-            self.second_deriv[i] = (sig - 1.0) / p
-            u[i] = (
-                (self.y[i + 1] - self.y[i]) / (self.x[i + 1] - self.x[i])
-                - (self.y[i] - self.y[i - 1]) / (self.x[i] - self.x[i - 1])
-            )
-            u[i] = (
-                (6.0 * u[i] / (self.x[i + 1] - self.x[i - 1]))
-                - sig * u[i - 1]
-            ) / p
-
-        # Boundary conditions
-        self.second_deriv[0] = 0.0
-        self.second_deriv[n - 1] = 0.0
-
-        # Back substitution to finalize second derivatives
-        for i in range(n - 2, -1, -1):
-            self.second_deriv[i] = self.second_deriv[i] * self.second_deriv[i + 1] + u[i]
+        The natural spline system only depends on x, so its banded matrix is built here
+        once and the second derivatives are solved for the current y values.
+        """
+        self.x = np.asarray(self.curve.get_x(), dtype=float)
+        self.y = np.asarray(self.curve.get_y(), dtype=float)
+        self.second_deriv_sensitivity = None
+        self.banded, self.rhs_scale = self.build_system(self.x)
+        self.solve()
+
+    def update(self, changed_indices):
+        """
+        Re-solve the spline after some y values changed.
+        The banded matrix is reused; only the right-hand side is rebuilt.
+        :param changed_indices: Iterable of node indices whose y values changed.
+        """
+        self.y = np.asarray(self.curve.get_y(), dtype=float)
+        self.solve()
+
+    def solve(self):
+        """
+        Solve the tridiagonal system for the second derivatives with natural boundary conditions.
+        """
+        self.second_deriv = self.solve_second_derivatives(self.x, self.y, self.banded, self.rhs_scale)
+
+    @staticmethod
+    def build_system(x):
+        """
+        Banded matrix of the natural spline system on the grid x, and the scale of its right-hand side.
+        Row i of the interior system is sig * sd[i - 1] + 2 * sd[i] + (1 - sig) * sd[i + 1].
+        :param x: Node values.
+        :return: Tuple (banded matrix for solve_banded, right-hand side scale).
+        """
+        n = len(x)
+        sig = (x[1:-1] - x[:-2]) / (x[2:] - x[:-2])
+        banded = np.zeros((3, max(n - 2, 0)))
+        banded[0, 1:] = 1.0 - sig[:-1]
+        banded[1, :] = 2.0
+        banded[2, :-1] = sig[1:]
+        return banded, 6.0 / (x[2:] - x[:-2])
+
+    @staticmethod
+    def solve_second_derivatives(x, y, banded, rhs_scale):
+        """
+        Second derivatives of natural splines through node values with a trailing node axis.
+        All rows are solved with one banded solve.
+        :param x: Node values.
+        :param y: Node values to fit, (..., len(x)).
+        :param banded: Banded matrix from build_system().
+        :param rhs_scale: Right-hand side scale from build_system().
+        :return: Second derivatives with the shape of y.
+        """
+        second_deriv = np.zeros(np.shape(y))
+        if len(x) < 3 or second_deriv.size == 0:
+            return second_deriv
+
+        slopes = np.diff(y, axis=-1) / np.diff(x)
+        rhs = rhs_scale * (slopes[..., 1:] - slopes[..., :-1])
+        second_deriv[..., 1:-1] = solve_banded((1, 1), banded, rhs.T).T
+        return second_deriv
 
     def interpolate(self, low_index: int, ax: float) -> float:
         """
@@ -90,3 +127,141 @@ class CubicInterpolator(CurveInterpolator):
             + ((a ** 3 - a) * sd1 + (b ** 3 - b) * sd2) * (h ** 2) / 6.0
         )
         return ay
+
+    def interpolate_many(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values using the cubic interpolation method.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values as a NumPy array.
+        :raises CurveException: If any value is not bracketed or invalid.
+        """
+        x1 = self.x[low_indices]
+        x2 = self.x[low_indices + 1]
+        if weights is None:
+            if not np.all((x1 <= ax) & (ax <= x2)):
+                raise CurveException("Not bracketed")
+            if np.any(x2 == x1):
+                raise CurveException("X inputs must be distinct")
+
+        return self.interpolate_nodes(self.x, self.y, self.second_deriv, low_indices, ax, weights)
+
+    @staticmethod
+    def interpolate_nodes(x, y, second_deriv, low_indices, ax, weights=None):
+        """
+        Cubic spline interpolation with a trailing node axis, e.g. one row per scenario.
+        :param x: Node values.
+        :param y: Node values to interpolate, (..., len(x)).
+        :param second_deriv: Second derivatives from solve_second_derivatives(), shaped like y.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values inside their brackets.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values, (..., len(ax)).
+        """
+        x1 = x[low_indices]
+        x2 = x[low_indices + 1]
+        h = x2 - x1
+        if weights is not None:
+            a = 1.0 - weights
+            b = weights
+        else:
+            a = (x2 - ax) / h
+            b = (ax - x1) / h
+
+        return (
+            a * y[..., low_indices]
+            + b * y[..., low_indices + 1]
+            + ((a * a * a - a) * second_deriv[..., low_indices]
+               + (b * b * b - b) * second_deriv[..., low_indices + 1]) * (h * h) / 6.0
+        )
+
+    def get_second_deriv_sensitivity(self) -> np.ndarray:
+        """
+        Dense matrix d second_deriv / d y. The spline is linear in y, so the matrix
+        only depends on x and is cached until the next initialize().
+        :return: (n x n) NumPy array.
+        """
+        if self.second_deriv_sensitivity is None:
+            n = len(self.x)
+            sensitivity = np.zeros((n, n))
+            if n >= 3:
+                h = np.diff(self.x)
+                rows = np.arange(n - 2)
+                slope_change = np.zeros((n - 2, n))
+                slope_change[rows, rows] = 1.0 / h[:-1]
+                slope_change[rows, rows + 1] = -1.0 / h[1:] - 1.0 / h[:-1]
+                slope_change[rows, rows + 2] = 1.0 / h[1:]
+                sensitivity[1:-1] = solve_banded((1, 1), self.banded, self.rhs_scale[:, None] * slope_change)
+            self.second_deriv_sensitivity = sensitivity
+
+        return self.second_deriv_sensitivity
+
+    def first_derivative_many(self, low_indices, ax):
+        """
+        First derivative of the spline with respect to x.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Derivatives as a NumPy array.
+        """
+        x1 = self.x[low_indices]
+        x2 = self.x[low_indices + 1]
+        h = x2 - x1
+        a = (x2 - ax) / h
+        b = (ax - x1) / h
+
+        return (
+            (self.y[low_indices + 1] - self.y[low_indices]) / h
+            - (3.0 * a * a - 1.0) / 6.0 * h * self.second_deriv[low_indices]
+            + (3.0 * b * b - 1.0) / 6.0 * h * self.second_deriv[low_indices + 1]
+        )
+
+    def second_derivative_many(self, low_indices, ax):
+        """
+        Second derivative of the spline with respect to x.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Derivatives as a NumPy array.
+        """
+        x1 = self.x[low_indices]
+        x2 = self.x[low_indices + 1]
+        h = x2 - x1
+        a = (x2 - ax) / h
+        b = (ax - x1) / h
+
+        return a * self.second_deriv[low_indices] + b * self.second_deriv[low_indices + 1]
+
+    def instantaneous_forwards_many(self, low_indices, ax):
+        """
+        Instantaneous forwards of the spline zero curve, rate + t * d rate / dt.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Forwards as a NumPy array.
+        """
+        x1 = self.x[low_indices]
+        weights = (ax - x1) / (self.x[low_indices + 1] - x1)
+        rates = self.interpolate_many(low_indices, ax, weights)
+        return rates + (ax - self.x[0]) * self.first_derivative_many(low_indices, ax)
+
+    def node_sensitivities(self, low_indices, ax):
+        """
+        Derivatives of the spline values with respect to the node rates.
+        Every row is dense because the second derivatives depend on all nodes.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        x = np.asarray(self.x)
+        x1 = x[low_indices]
+        x2 = x[low_indices + 1]
+        h = x2 - x1
+        a = (x2 - ax) / h
+        b = (ax - x1) / h
+
+        sensitivity = self.get_second_deriv_sensitivity()
+        weights = ((a * a * a - a) * h * h / 6.0)[:, None] * sensitivity[low_indices] \
+            + ((b * b * b - b) * h * h / 6.0)[:, None] * sensitivity[low_indices + 1]
+        rows = np.arange(len(ax))
+        weights[rows, low_indices] += a
+        weights[rows, low_indices + 1] += b
+        return csr_matrix(weights)
@@ -11,9 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 from abc import ABC, abstractmethod
 from math import exp
 
+import numpy as np
+
 from yield_curve.common.util.date_convert import DateConvert
 
 
@@ -25,6 +28,9 @@ class CurveException(Exception):
 class Curve(ABC):
     """Abstract Base Class representing a curve."""
 
+    # Digest of the x-grid, set on first use by grid_key()
+    grid_digest = None
+
     @abstractmethod
     def get_x(self):
         """Get the X values (must be in ascending order)."""
@@ -72,6 +78,33 @@ class Curve(ABC):
         # return array of double
         pass
 
+    @abstractmethod
+    def get_interpolator(self):
+        """Get the interpolator evaluating the curve between its nodes."""
+        pass
+
+    @abstractmethod
+    def locate(self, ax):
+        """
+        Find the brackets of an array of values.
+        :param ax: Array of values to locate.
+        :return: Tuple (index, exact, low_index) where exact marks values on a node,
+            index is the node index for those and low_index the lower bracket for the others.
+        """
+        pass
+
+    def grid_key(self) -> bytes:
+        """
+        Identity of the x-grid: curves on equal grids have equal keys.
+        The digest is computed on first use and kept until the curve resets grid_digest, which
+        implementations do when their x values may have changed.
+        :return: Digest of the x values.
+        """
+        if self.grid_digest is None:
+            self.grid_digest = hashlib.blake2b(np.asarray(self.get_x(), dtype=float).tobytes(),
+                                               digest_size=16).digest()
+        return self.grid_digest
+
     def interpolate_local_date(self, local_date):
         """
         Interpolate a value based on a LocalDate.
@@ -106,3 +139,37 @@ class Curve(ABC):
         """
         return exp(
             -1.0 * self.interpolate_local_date(local_date) * self.year_fraction(local_date))
+
+    def discount_factors(self, dates) -> np.ndarray:
+        """
+        Discount factors for an array of serial dates, exp(-rate * (date - x[0]) / 365).
+        :param dates: Array of serial dates (floats).
+        :return: Discount factors as a NumPy array.
+        """
+        dates = np.asarray(dates, dtype=float)
+        return np.exp(-self.interpolate_array(dates) * (dates - self.get_x()[0]) / 365.0)
+
+    def forward_rates(self, start_dates, end_dates, accruals) -> np.ndarray:
+        """
+        Simple forward rates (df(start) / df(end) - 1) / accrual for arrays of periods.
+        :param start_dates: Array of period start serial dates.
+        :param end_dates: Array of period end serial dates.
+        :param accruals: Array of accrual factors.
+        :return: Forward rates as a NumPy array.
+        """
+        start_dates = np.asarray(start_dates, dtype=float)
+        discount_factors = self.discount_factors(np.concatenate([start_dates, np.asarray(end_dates, dtype=float)]))
+        n = len(start_dates)
+        return (discount_factors[:n] / discount_factors[n:] - 1.0) / np.asarray(accruals, dtype=float)
+
+    def instantaneous_forwards(self, dates) -> np.ndarray:
+        """
+        Instantaneous forwards d(rate * t) / dt for an array of serial dates.
+        Dates on a node use the segment to their right, except the last node.
+        :param dates: Array of serial dates (floats).
+        :return: Forwards as a NumPy array.
+        """
+        dates = np.asarray(dates, dtype=float)
+        index, exact, low_index = self.locate(dates)
+        low_index = np.where(exact, np.minimum(index, len(self.get_x()) - 2), low_index)
+        return self.get_interpolator().instantaneous_forwards_many(low_index, dates)
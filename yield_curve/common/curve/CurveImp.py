@@ -15,6 +15,7 @@ from yield_curve.common.curve.Exception.CurveException import CurveException
 from yield_curve.common.curve.Exception.CurveExtrapolationException import CurveExtrapolationException
 from yield_curve.common.curve import Curve, curve_interpolator
 from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.curve.curve_interpolator import locate_brackets, node_sensitivity_matrix
 from yield_curve.common.curve.interpolation_method import InterpolationMethod
 from yield_curve.common.curve import flat_forward_interpolator
 from yield_curve.common.curve.linear_discount_factor_interpolator import LinearDiscountFactorInterpolator
@@ -22,9 +23,13 @@ from yield_curve.common.curve.linear_zero_interpolator import LinearZeroInterpol
 from yield_curve.common.curve.CubicInterpolator import CubicInterpolator
 from yield_curve.common.curve.monotone_convex_interpolator import MonotoneConvexInterpolator
 from yield_curve.common.curve.flat_forward_interpolator import FlatForwardInterpolator
+from math import exp
+
 import numpy as np  # For copying arrays
+from scipy.sparse import csr_matrix
 
 from yield_curve.common.util.functions import binary_search
+from yield_curve.common.util.lru_cache import LruCache
 
 
 class CurveImpl(Curve):
@@ -52,11 +57,13 @@ class CurveImpl(Curve):
         self.y = y
         self.interp_method = interp_method
         self.interpolator = self.build_interpolator()
+        # Incremented on every update() so cached results of older states never match
+        self.version = 0
+        self.rate_cache = None
+        self.discount_cache = None
 
     def interpolate_array2(self, ax):
-        result = np.zeros_like(len(ax))
-        self.interpolate_array(ax, result)
-        return result
+        return self.interpolate_array(ax)
 
     def get_x(self) -> np.ndarray:
         """Return the x values."""
@@ -70,12 +77,61 @@ class CurveImpl(Curve):
         """Return the interpolation method."""
         return self.interp_method
 
+    def get_interpolator(self):
+        """Return the interpolator."""
+        return self.interpolator
+
+    def enable_cache(self, max_size: int = 4096):
+        """
+        Memoize scalar interpolate() and discount() results keyed by (version, value).
+        :param max_size: Maximum number of entries kept in each cache.
+        """
+        self.rate_cache = LruCache(max_size)
+        self.discount_cache = LruCache(max_size)
+
+    def disable_cache(self):
+        """Stop memoizing scalar lookups and drop the cached results."""
+        self.rate_cache = None
+        self.discount_cache = None
+
     def interpolate(self, ax: float) -> float:
         """
         Interpolate a single value.
         :param ax: The value to interpolate.
         :return: The interpolated value.
         """
+        if self.rate_cache is None:
+            return self.interpolate_uncached(ax)
+
+        key = (self.version, ax)
+        rate = self.rate_cache.get(key)
+        if rate is None:
+            rate = self.interpolate_uncached(ax)
+            self.rate_cache.put(key, rate)
+        return rate
+
+    def discount(self, ax: float) -> float:
+        """
+        Discount factor at a single value, exp(-rate * (ax - x[0]) / 365).
+        :param ax: The value to discount to.
+        :return: The discount factor.
+        """
+        if self.discount_cache is None:
+            return exp(-self.interpolate(ax) * (ax - self.x[0]) / 365.0)
+
+        key = (self.version, ax)
+        discount_factor = self.discount_cache.get(key)
+        if discount_factor is None:
+            discount_factor = exp(-self.interpolate(ax) * (ax - self.x[0]) / 365.0)
+            self.discount_cache.put(key, discount_factor)
+        return discount_factor
+
+    def interpolate_uncached(self, ax: float) -> float:
+        """
+        Interpolate a single value without consulting the cache.
+        :param ax: The value to interpolate.
+        :return: The interpolated value.
+        """
         index = binary_search(self.x, ax)
         if index >= 0:
             return self.y[index]
@@ -88,26 +144,48 @@ class CurveImpl(Curve):
 
         return self.interpolator.interpolate(index, ax)
 
+    def locate(self, ax: np.ndarray):
+        """
+        Find the brackets of an array of values with a single search.
+        :param ax: Array of values to locate.
+        :return: Tuple (index, exact, low_index) where exact marks values on a node,
+            index is the node index for those and low_index the lower bracket for the others.
+        :raises CurveExtrapolationException: If any value is outside the curve.
+        """
+        return locate_brackets(self.x, ax)
+
     def interpolate_array(self, ax: np.ndarray, result: np.ndarray = None) -> np.ndarray:
         """
         Interpolate an array of values.
+        The brackets for all values are found with a single search and the
+        interpolator evaluates every value in one vectorized pass.
         :param ax: Array of values to interpolate.
         :param result: Optional array to store the results.
         :return: The interpolated results.
         """
+        ax = np.asarray(ax, dtype=float)
         if result is None:
-            result = np.zeros_like(ax)
+            result = np.zeros(len(ax))
 
-        for i, val in enumerate(ax):
-            if val < self.x[0]:
-                raise CurveExtrapolationException(f"Extrapolation beyond the short end of the curve: {val}")
-            if val > self.x[-1]:
-                raise CurveExtrapolationException(f"Extrapolation beyond the long end of the curve: {val}")
+        index, exact, low_index = self.locate(ax)
 
-            result[i] = self.interpolate(val)
+        result[exact] = self.y[index[exact]]
+        inside = ~exact
+        if np.any(inside):
+            result[inside] = self.interpolator.interpolate_many(low_index[inside], ax[inside])
 
         return result
 
+    def node_sensitivities(self, ax: np.ndarray) -> csr_matrix:
+        """
+        Derivatives of the interpolated values with respect to each node value y_i.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x len(x)) matrix of weights d interpolate(ax[k]) / d y[i].
+        """
+        ax = np.asarray(ax, dtype=float)
+        index, exact, low_index = self.locate(ax)
+        return node_sensitivity_matrix(self.interpolator, len(self.x), ax, index, exact, low_index)
+
     def build_interpolator(self):
         """
         Build the interpolator based on the interpolation method.
@@ -129,11 +207,19 @@ class CurveImpl(Curve):
         interpolator.initialize()
         return interpolator
 
-    def update(self):
+    def update(self, changed_indices=None):
         """
         Reinitialize the interpolator after modifying x or y values.
+        :param changed_indices: Optional node indices whose y values were modified in place.
+            When given, x must be unchanged and only the affected segments are recomputed.
         """
-        self.interpolator.initialize()
+        if changed_indices is None:
+            # x may have been rewritten in place, so the grid digest is recomputed on next use
+            self.grid_digest = None
+            self.interpolator.initialize()
+        else:
+            self.interpolator.update(changed_indices)
+        self.version += 1
 
     def copy(self):
         """
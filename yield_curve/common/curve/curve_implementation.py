@@ -12,15 +12,15 @@
 # limitations under the License.
 
 from yield_curve.common.curve.Exception.CurveExtrapolationException import CurveExtrapolationException
-from yield_curve.common.curve import Curve, curve_interpolator
+from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.curve.curve_interpolator import CurveInterpolator, locate_brackets, node_sensitivity_matrix
 from yield_curve.common.curve.interpolation_method import InterpolationMethod
-from yield_curve.common.curve import flat_forward_interpolator
 from yield_curve.common.curve.linear_discount_factor_interpolator import LinearDiscountFactorInterpolator
 from yield_curve.common.curve.linear_zero_interpolator import LinearZeroInterpolator
 from yield_curve.common.curve.CubicInterpolator import CubicInterpolator
 from yield_curve.common.curve.monotone_convex_interpolator import MonotoneConvexInterpolator
 from yield_curve.common.curve.flat_forward_interpolator import FlatForwardInterpolator
-import numpy as np  # For copying arrays
+import numpy as np
 
 from yield_curve.common.util.functions import binary_search
 
@@ -52,26 +52,32 @@ class CurveImplementation(Curve):
         if interpolation_method is None:
             raise ValueError("null interpolation method")
 
-        # Copy the data to ensure immutability
-        self.x = np.copy(x)
-        self.y = np.copy(y)
+        # Copy the data once and write-protect it to ensure immutability
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        self.x.flags.writeable = False
+        self.y.flags.writeable = False
         self.interpolation_method = interpolation_method
 
         # Build the interpolator
         self.interpolator = self.build_interpolator(self.interpolation_method)
 
     def get_x(self):
-        """Return a copy of x values."""
-        return np.copy(self.x)
+        """Return a read-only view of x values."""
+        return self.x.view()
 
     def get_y(self):
-        """Return a copy of y values."""
-        return np.copy(self.y)
+        """Return a read-only view of y values."""
+        return self.y.view()
 
     def get_interpolation_method(self):
         """Return the interpolation method."""
         return self.interpolation_method
 
+    def get_interpolator(self):
+        """Return the interpolator."""
+        return self.interpolator
+
     def interpolate(self, ax: float) -> float:
         """
         Interpolate a single value.
@@ -90,6 +96,15 @@ class CurveImplementation(Curve):
 
         return self.interpolator.interpolate(index, ax)
 
+    def locate(self, ax: np.ndarray):
+        """
+        Find the brackets of an array of values with a single search.
+        :param ax: Array of values to locate.
+        :return: Tuple (index, exact, low_index) where exact marks values on a node,
+            index is the node index for those and low_index the lower bracket for the others.
+        """
+        return locate_brackets(self.x, ax)
+
     def interpolate_array(self, ax: list, result: list = None):
         """
         Interpolate an array of values.
@@ -97,24 +112,38 @@ class CurveImplementation(Curve):
         :param result: Optional list to store the results.
         :return: Result list with interpolated values.
         """
+        ax = np.asarray(ax, dtype=float)
         if result is None:
-            result = [0] * len(ax)
+            result = np.zeros(len(ax))
 
-        for i, val in enumerate(ax):
-            if val < self.x[0]:
-                raise CurveExtrapolationException("Extrapolation beyond short end")
-            if val > self.x[-1]:
-                raise CurveExtrapolationException("Extrapolation beyond long end")
+        index, exact, low_index = self.locate(ax)
 
-            result[i] = self.interpolate(val)
+        values = np.empty(len(ax))
+        values[exact] = self.y[index[exact]]
+        inside = ~exact
+        if np.any(inside):
+            values[inside] = self.interpolator.interpolate_many(low_index[inside], ax[inside])
 
+        result[:] = values
         return result
 
+    def node_sensitivities(self, ax):
+        """
+        Derivatives of the interpolated values with respect to each node value y_i.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x len(x)) matrix of weights.
+        """
+        ax = np.asarray(ax, dtype=float)
+        index, exact, low_index = self.locate(ax)
+        return node_sensitivity_matrix(self.interpolator, len(self.x), ax, index, exact, low_index)
+
+    def interpolate_array2(self, ax):
+        return self.interpolate_array(ax)
+
     def build_interpolator(self, interpolation_method: InterpolationMethod) -> CurveInterpolator:
         """
         Build an interpolator based on the interpolation method.
         """
-        self.interpolator: CurveInterpolator
         if interpolation_method == InterpolationMethod.LINEAR_DF:
             interpolator = LinearDiscountFactorInterpolator(self)
         elif interpolation_method == InterpolationMethod.LINEAR_ZERO:
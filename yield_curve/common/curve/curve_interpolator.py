@@ -13,6 +13,12 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from yield_curve.common.curve.Exception.CurveExtrapolationException import CurveExtrapolationException
+from yield_curve.common.util.functions import binary_search_array
+
 
 class CurveException(Exception):
     """Custom exception for curve-related errors."""
@@ -33,9 +39,120 @@ class CurveInterpolator(ABC):
         """
         pass
 
+    @abstractmethod
+    def interpolate_many(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values in one pass.
+        :param low_indices: Array of lower indices for interpolation, one per value.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value, as cached by an
+            InterpolationPlan; the bracket check is skipped when they are given.
+        :return: Interpolated values as a NumPy array.
+        :raises CurveException: If an error occurs during interpolation.
+        """
+        pass
+
+    @abstractmethod
+    def node_sensitivities(self, low_indices, ax) -> csr_matrix:
+        """
+        Derivatives of the interpolated values with respect to each node value y_i.
+        :param low_indices: Array of lower indices for interpolation, one per value.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        pass
+
+    @abstractmethod
+    def instantaneous_forwards_many(self, low_indices, ax):
+        """
+        Instantaneous forwards d(rate * t) / dt, with t in years, on the bracket given by low_indices.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Forwards as a NumPy array.
+        """
+        pass
+
     @abstractmethod
     def initialize(self):
         """
         Prepare any transformations or setup required for interpolation.
         """
         pass
+
+    def update(self, changed_indices):
+        """
+        Refresh the interpolator after the y values at changed_indices were modified in place.
+        The x values must be unchanged. Interpolators whose setup is local override this to
+        recompute only the affected entries; the default runs a full initialize().
+        :param changed_indices: Iterable of node indices whose y values changed.
+        """
+        self.initialize()
+
+
+def locate_brackets(x, ax):
+    """
+    Find the brackets of an array of values on the grid x with a single search.
+    :param x: Node values, in ascending order.
+    :param ax: Array of values to locate.
+    :return: Tuple (index, exact, low_index) where exact marks values on a node,
+        index is the node index for those and low_index the lower bracket for the others.
+    :raises CurveExtrapolationException: If any value is outside the grid.
+    """
+    index = binary_search_array(x, ax)
+    exact = index >= 0
+    low_index = -index - 2
+
+    outside = ~exact & (low_index == -1)
+    if np.any(outside):
+        raise CurveExtrapolationException(
+            f"Extrapolation beyond the short end of the curve: {ax[outside][0]}")
+    outside = ~exact & (low_index == len(x) - 1)
+    if np.any(outside):
+        raise CurveExtrapolationException(
+            f"Extrapolation beyond the long end of the curve: {ax[outside][0]}")
+
+    return index, exact, low_index
+
+
+def bracket_weights(low_indices, lower, upper, num_nodes: int) -> csr_matrix:
+    """
+    Build a sensitivity matrix whose rows only depend on the two bracketing nodes.
+    :param low_indices: Array of lower indices, one per row.
+    :param lower: Weights on the lower nodes.
+    :param upper: Weights on the upper nodes.
+    :param num_nodes: Number of curve nodes (columns).
+    :return: Sparse (len(low_indices) x num_nodes) matrix.
+    """
+    rows = np.arange(len(low_indices))
+    return csr_matrix(
+        (np.concatenate([lower, upper]),
+         (np.concatenate([rows, rows]), np.concatenate([low_indices, low_indices + 1]))),
+        shape=(len(low_indices), num_nodes))
+
+
+def node_sensitivity_matrix(interpolator: CurveInterpolator, num_nodes: int, ax, index, exact,
+                            low_indices) -> csr_matrix:
+    """
+    Assemble the node sensitivities of located values.
+    Values on a node have a unit weight on that node; the others come from the interpolator.
+    :param interpolator: Interpolator of the curve.
+    :param num_nodes: Number of curve nodes (columns).
+    :param ax: Array of values.
+    :param index: Node index of each exact value.
+    :param exact: Mask of the values sitting on a node.
+    :param low_indices: Lower bracket index of each other value.
+    :return: Sparse (len(ax) x num_nodes) matrix.
+    """
+    inside = ~exact
+    on_node = np.flatnonzero(exact)
+    rows = [on_node]
+    cols = [index[exact]]
+    data = [np.ones(len(on_node))]
+    if np.any(inside):
+        weights = interpolator.node_sensitivities(low_indices[inside], ax[inside]).tocoo()
+        rows.append(np.flatnonzero(inside)[weights.row])
+        cols.append(weights.col)
+        data.append(weights.data)
+
+    return csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                      shape=(len(ax), num_nodes))
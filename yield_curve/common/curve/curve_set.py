@@ -0,0 +1,141 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from yield_curve.common.curve.CubicInterpolator import CubicInterpolator
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.Exception.CurveException import CurveException
+from yield_curve.common.curve.curve_interpolator import locate_brackets
+from yield_curve.common.curve.flat_forward_interpolator import FlatForwardInterpolator
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.common.curve.linear_discount_factor_interpolator import LinearDiscountFactorInterpolator
+from yield_curve.common.curve.linear_zero_interpolator import LinearZeroInterpolator
+from yield_curve.common.curve.monotone_convex_interpolator import MonotoneConvexInterpolator
+
+
+class CurveSet:
+    """
+    Many scenarios of one curve sharing a single x-grid.
+    The y values are stored as an (n_scenarios x n_nodes) array and every interpolation
+    method is evaluated for all scenarios at once, without per-scenario curve objects.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, interp_method: InterpolationMethod):
+        """
+        Initialize the CurveSet with a shared x-grid and one row of y values per scenario.
+        :param x: Node dates, in ascending order.
+        :param y: (n_scenarios x len(x)) array of node values.
+        :param interp_method: Interpolation method used by every scenario.
+        """
+        if x is None:
+            raise ValueError("x cannot be None")
+        if y is None:
+            raise ValueError("y cannot be None")
+        if interp_method is None:
+            raise ValueError("interp_method cannot be None")
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        if self.y.ndim != 2:
+            raise CurveException(f"y must be a 2-D array of scenarios: {self.y.shape}")
+        if self.y.shape[1] != len(self.x):
+            raise CurveException(f"y rows and x must have the same length: {self.y.shape[1]} != {len(self.x)}")
+        if not np.all(np.diff(self.x) > 0):
+            raise CurveException("x values must be in ascending order and not duplicated")
+        if interp_method not in (InterpolationMethod.LINEAR_DF, InterpolationMethod.LINEAR_ZERO,
+                                 InterpolationMethod.FLAT_FORWARD, InterpolationMethod.CUBIC_SPLINE,
+                                 InterpolationMethod.MONOTONE_CONVEX):
+            raise CurveException(f"Unsupported interpolation method: {interp_method}")
+
+        self.interp_method = interp_method
+        self.terms = (self.x - self.x[0]) / 365.0
+        self.spline_system = None
+        self.derived = None
+        self.update()
+
+    def get_x(self) -> np.ndarray:
+        """Return the shared x values."""
+        return self.x
+
+    def get_y(self) -> np.ndarray:
+        """Return the (n_scenarios x n_nodes) y values."""
+        return self.y
+
+    def get_interpolation_method(self) -> InterpolationMethod:
+        """Return the interpolation method."""
+        return self.interp_method
+
+    def get_num_scenarios(self) -> int:
+        """Return the number of scenarios."""
+        return self.y.shape[0]
+
+    def get_curve(self, scenario: int) -> CurveImpl:
+        """
+        Build a standalone curve for one scenario.
+        :param scenario: Scenario row.
+        :return: A new CurveImpl with copies of the data.
+        """
+        return CurveImpl(np.copy(self.x), np.copy(self.y[scenario]), self.interp_method)
+
+    def update(self):
+        """
+        Recompute the method-specific node arrays after modifying y in place.
+        """
+        if self.interp_method == InterpolationMethod.LINEAR_DF:
+            self.derived = LinearDiscountFactorInterpolator.node_discount_factors(self.x, self.y)
+        elif self.interp_method == InterpolationMethod.FLAT_FORWARD:
+            self.derived = FlatForwardInterpolator.node_rate_times(self.x, self.y)
+        elif self.interp_method == InterpolationMethod.CUBIC_SPLINE:
+            if self.spline_system is None:
+                self.spline_system = CubicInterpolator.build_system(self.x)
+            self.derived = CubicInterpolator.solve_second_derivatives(self.x, self.y, *self.spline_system)
+        elif self.interp_method == InterpolationMethod.MONOTONE_CONVEX:
+            self.derived = MonotoneConvexInterpolator.build_forwards(self.terms, self.y)
+
+    def interpolate_array(self, ax) -> np.ndarray:
+        """
+        Interpolate a vector of values across all scenarios.
+        :param ax: Array of values to interpolate.
+        :return: (n_scenarios x len(ax)) array of interpolated values.
+        :raises CurveExtrapolationException: If any value is outside the curve.
+        """
+        ax = np.asarray(ax, dtype=float)
+        index, exact, low_index = locate_brackets(self.x, ax)
+
+        result = np.zeros((self.get_num_scenarios(), len(ax)))
+        result[:, exact] = self.y[:, index[exact]]
+        inside = ~exact
+        if np.any(inside):
+            result[:, inside] = self.interpolate_many(low_index[inside], ax[inside])
+        return result
+
+    def interpolate_many(self, low_indices, ax) -> np.ndarray:
+        """
+        Interpolate bracketed values across all scenarios with the interpolators' node helpers.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values strictly inside their brackets.
+        :return: (n_scenarios x len(ax)) array.
+        """
+        if self.interp_method == InterpolationMethod.LINEAR_ZERO:
+            return LinearZeroInterpolator.interpolate_nodes(self.x, self.y, low_indices, ax)
+        if self.interp_method == InterpolationMethod.LINEAR_DF:
+            return LinearDiscountFactorInterpolator.interpolate_nodes(self.x, self.y, self.derived, low_indices, ax)
+        if self.interp_method == InterpolationMethod.FLAT_FORWARD:
+            return FlatForwardInterpolator.interpolate_nodes(self.x, self.y, self.derived, low_indices, ax)
+        if self.interp_method == InterpolationMethod.CUBIC_SPLINE:
+            return CubicInterpolator.interpolate_nodes(self.x, self.y, self.derived, low_indices, ax)
+
+        fdiscrete, f = self.derived
+        return MonotoneConvexInterpolator.evaluate_nodes(self.x[0], self.terms, self.y, fdiscrete, f, low_indices,
+                                                         ax, None, False)[0]
@@ -11,7 +11,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from yield_curve.common.curve.curve_interpolator import CurveInterpolator, CurveException
+import numpy as np
+
+from yield_curve.common.curve.curve_interpolator import CurveInterpolator, CurveException, bracket_weights
 
 
 class FlatForwardInterpolator(CurveInterpolator):
@@ -32,11 +34,16 @@ class FlatForwardInterpolator(CurveInterpolator):
         """
         self.x = self.curve.get_x()
         self.y = self.curve.get_y()
-        self.rt = [0] * len(self.x)
+        self.rt = self.node_rate_times(np.asarray(self.x), np.asarray(self.y))
 
-        for i in range(len(self.x)):
-            t = self.x[i] - self.x[0]
-            self.rt[i] = self.y[i] * t
+    def update(self, changed_indices):
+        """
+        Recompute rt of the changed nodes only.
+        :param changed_indices: Iterable of node indices whose y values changed.
+        """
+        changed = np.fromiter(changed_indices, dtype=int)
+        x = np.asarray(self.x)
+        self.rt[changed] = np.asarray(self.y)[changed] * (x[changed] - x[0])
 
     def interpolate(self, low_index: int, ax: float) -> float:
         """
@@ -62,3 +69,82 @@ class FlatForwardInterpolator(CurveInterpolator):
 
         ay = y1 + (ax - x1) * ((y2 - y1) / (x2 - x1))
         return ay / t
+
+    def interpolate_many(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values using the flat forward method.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values as a NumPy array.
+        :raises CurveException: If any value is not bracketed.
+        """
+        x = np.asarray(self.x)
+        if weights is None and not np.all((x[low_indices] <= ax) & (ax <= x[low_indices + 1])):
+            raise CurveException("Not bracketed")
+
+        return self.interpolate_nodes(x, np.asarray(self.y), self.rt, low_indices, ax, weights)
+
+    @staticmethod
+    def node_rate_times(x, y):
+        """
+        Products y * (x - x[0]) of node rates with a trailing node axis.
+        :param x: Node values.
+        :param y: Node rates, (..., len(x)).
+        :return: Rate times with the shape of y.
+        """
+        return y * (x - x[0])
+
+    @staticmethod
+    def interpolate_nodes(x, y, rt, low_indices, ax, weights=None):
+        """
+        Flat forward interpolation with a trailing node axis, e.g. one row per scenario.
+        :param x: Node values.
+        :param y: Node rates, (..., len(x)); the first one is returned at the origin.
+        :param rt: Node rate times from node_rate_times(), shaped like y.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values inside their brackets.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values, (..., len(ax)).
+        """
+        x1 = x[low_indices]
+        y1 = rt[..., low_indices]
+        y2 = rt[..., low_indices + 1]
+        t = ax - x[0]
+
+        if weights is not None:
+            ay = y1 + weights * (y2 - y1)
+        else:
+            ay = y1 + (ax - x1) * ((y2 - y1) / (x[low_indices + 1] - x1))
+        at_origin = t == 0
+        return np.where(at_origin, y[..., :1], ay / np.where(at_origin, 1.0, t))
+
+    def instantaneous_forwards_many(self, low_indices, ax):
+        """
+        Instantaneous forwards of the flat forward curve, constant on each segment.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Forwards as a NumPy array.
+        """
+        x = np.asarray(self.x)
+        return (self.rt[low_indices + 1] - self.rt[low_indices]) / (x[low_indices + 1] - x[low_indices])
+
+    def node_sensitivities(self, low_indices, ax):
+        """
+        Derivatives of the flat forward zero rates with respect to the node rates.
+        With rt_k = y_k * (x_k - x0), the weights are (1 - w) * (x1 - x0) / t and w * (x2 - x0) / t.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        x = np.asarray(self.x)
+        x1 = x[low_indices]
+        x2 = x[low_indices + 1]
+        t = ax - x[0]
+        w = (ax - x1) / (x2 - x1)
+
+        at_origin = t == 0
+        scale = 1.0 / np.where(at_origin, 1.0, t)
+        lower = np.where(at_origin, 1.0, (1.0 - w) * (x1 - x[0]) * scale)
+        upper = np.where(at_origin, 0.0, w * (x2 - x[0]) * scale)
+        return bracket_weights(low_indices, lower, upper, len(x))
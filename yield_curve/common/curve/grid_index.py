@@ -0,0 +1,104 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.curve.interpolation_plan import InterpolationPlan
+from yield_curve.common.util.lru_cache import LruCache
+
+
+class GridIndex:
+    """
+    Registry of interpolation plans keyed by the x-grid of the curve and the query values.
+    Plans are not tied to a curve object, so curves that share a grid (for example an anchor
+    curve and a basis curve built on its nodes) reuse the same bracket search and weights.
+    The registry is bounded and evicts the least recently used plan.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        :param max_size: Maximum number of plans kept.
+        """
+        self.plans = LruCache(max_size)
+
+    @property
+    def hits(self) -> int:
+        return self.plans.hits
+
+    @property
+    def misses(self) -> int:
+        return self.plans.misses
+
+    @staticmethod
+    def key(curve: Curve, ax: np.ndarray) -> tuple:
+        """
+        Lookup key of a curve grid and a set of query values.
+        :param curve: Curve providing the x-grid.
+        :param ax: Query values as a float array.
+        :return: Hashable key.
+        """
+        return curve.grid_key(), ax.tobytes()
+
+    def get_plan(self, curve: Curve, ax) -> InterpolationPlan:
+        """
+        Get the plan for the given curve grid and query values, building it on first use.
+        :param curve: Curve providing the x-grid; must implement locate().
+        :param ax: Values to interpolate.
+        :return: InterpolationPlan usable with any curve on the same grid.
+        :raises CurveExtrapolationException: If any value is outside the curve.
+        """
+        ax = np.asarray(ax, dtype=float)
+        key = self.key(curve, ax)
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = InterpolationPlan(curve, ax)
+            self.plans.put(key, plan)
+        return plan
+
+    def interpolate(self, curve: Curve, ax, result: np.ndarray = None) -> np.ndarray:
+        """
+        Interpolate the values on the current state of the curve using a shared plan.
+        :param curve: Curve to evaluate.
+        :param ax: Values to interpolate.
+        :param result: Optional array to store the results.
+        :return: Interpolated values.
+        """
+        return self.get_plan(curve, ax).evaluate(curve, result)
+
+    def node_sensitivities(self, curve: Curve, ax):
+        """
+        Node sensitivities of the values on the current state of the curve using a shared plan.
+        :param curve: Curve to evaluate.
+        :param ax: Values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        return self.get_plan(curve, ax).node_sensitivities(curve)
+
+    def fork(self) -> 'GridIndex':
+        """
+        Independent registry for concurrent use, starting with the plans built so far.
+        Plans are read-only and shared; the registries are not.
+        """
+        forked = GridIndex(self.plans.max_size)
+        forked.plans.entries.update(self.plans.entries)
+        return forked
+
+    def clear(self):
+        """
+        Drop all plans.
+        """
+        self.plans.clear()
+
+    def __len__(self):
+        return len(self.plans)
@@ -0,0 +1,88 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.curve.Exception.CurveException import CurveException
+from yield_curve.common.curve.curve_interpolator import node_sensitivity_matrix
+
+
+class InterpolationPlan:
+    """
+    Precomputed lookup of a fixed set of query dates against a fixed curve x-grid.
+    The bracket search and the x-weights are computed once; evaluate() then only reads
+    the current y-dependent state of the curve, so a plan can be reused every time the
+    curve values are adjusted in place.
+    """
+
+    def __init__(self, curve: Curve, ax):
+        """
+        Build the plan for the given curve grid and query values.
+        :param curve: Curve providing the x-grid; must implement locate().
+        :param ax: Values to interpolate.
+        :raises CurveExtrapolationException: If any value is outside the curve.
+        """
+        self.x = np.array(curve.get_x(), dtype=float)
+        self.ax = np.array(ax, dtype=float)
+        self.index, self.exact, low_index = curve.locate(self.ax)
+        self.inside = ~self.exact
+        self.low_indices = low_index[self.inside]
+        self.inside_ax = self.ax[self.inside]
+
+        x1 = self.x[self.low_indices]
+        x2 = self.x[self.low_indices + 1]
+        self.weights = (self.inside_ax - x1) / (x2 - x1)
+
+    def matches(self, curve: Curve) -> bool:
+        """
+        Check whether the plan was built on the x-grid of the given curve.
+        :param curve: Curve to check.
+        :return: True if the curve has the same x values.
+        """
+        x = curve.get_x()
+        return len(x) == len(self.x) and np.array_equal(x, self.x)
+
+    def evaluate(self, curve: Curve, result: np.ndarray = None) -> np.ndarray:
+        """
+        Interpolate the planned values on the current state of the curve.
+        :param curve: Curve with the same x-grid as the plan.
+        :param result: Optional array to store the results.
+        :return: Interpolated values.
+        :raises CurveException: If the curve grid differs from the plan.
+        """
+        if not self.matches(curve):
+            raise CurveException("Interpolation plan does not match the curve x values")
+        if result is None:
+            result = np.zeros(len(self.ax))
+
+        result[self.exact] = curve.get_y()[self.index[self.exact]]
+        if len(self.low_indices) > 0:
+            result[self.inside] = curve.interpolator.interpolate_many(self.low_indices, self.inside_ax,
+                                                                      self.weights)
+        return result
+
+    def node_sensitivities(self, curve: Curve):
+        """
+        Node sensitivities of the planned values on the current state of the curve.
+        :param curve: Curve with the same x-grid as the plan.
+        :return: Sparse (len(ax) x len(x)) matrix of weights.
+        :raises CurveException: If the curve grid differs from the plan.
+        """
+        if not self.matches(curve):
+            raise CurveException("Interpolation plan does not match the curve x values")
+
+        low_indices = np.zeros(len(self.ax), dtype=int)
+        low_indices[self.inside] = self.low_indices
+        return node_sensitivity_matrix(curve.interpolator, len(self.x), self.ax, self.index, self.exact,
+                                       low_indices)
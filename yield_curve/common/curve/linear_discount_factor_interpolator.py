@@ -11,9 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from math import exp, log
+from math import log
 
-from yield_curve.common.curve.curve_interpolator import CurveInterpolator, CurveException
+import numpy as np
+
+from yield_curve.common.curve.curve_interpolator import CurveInterpolator, CurveException, bracket_weights
 
 
 class LinearDiscountFactorInterpolator(CurveInterpolator):
@@ -34,11 +36,16 @@ class LinearDiscountFactorInterpolator(CurveInterpolator):
         """
         self.x = self.curve.get_x()
         self.y = self.curve.get_y()
-        self.df = [0] * len(self.x)
+        self.df = self.node_discount_factors(np.asarray(self.x), np.asarray(self.y))
 
-        for i in range(len(self.x)):
-            t = (self.x[i] - self.x[0]) / 365.0
-            self.df[i] = exp(-self.y[i] * t)
+    def update(self, changed_indices):
+        """
+        Recompute the discount factors of the changed nodes only.
+        :param changed_indices: Iterable of node indices whose y values changed.
+        """
+        changed = np.fromiter(changed_indices, dtype=int)
+        x = np.asarray(self.x)
+        self.df[changed] = np.exp(-np.asarray(self.y)[changed] * ((x[changed] - x[0]) / 365.0))
 
     def interpolate(self, low_index: int, ax: float) -> float:
         """
@@ -64,3 +71,90 @@ class LinearDiscountFactorInterpolator(CurveInterpolator):
 
         ay = y1 + (ax - x1) * ((y2 - y1) / (x2 - x1))
         return -log(ay) / t
+
+    def interpolate_many(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values using the linear discount factor method.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values as a NumPy array.
+        :raises CurveException: If any value is not bracketed.
+        """
+        x = np.asarray(self.x)
+        if weights is None and not np.all((x[low_indices] <= ax) & (ax <= x[low_indices + 1])):
+            raise CurveException("Not bracketed")
+
+        return self.interpolate_nodes(x, np.asarray(self.y), self.df, low_indices, ax, weights)
+
+    @staticmethod
+    def node_discount_factors(x, y):
+        """
+        Discount factors exp(-y * t) of node rates with a trailing node axis, t in years from x[0].
+        :param x: Node values.
+        :param y: Node rates, (..., len(x)).
+        :return: Discount factors with the shape of y.
+        """
+        return np.exp(-y * ((x - x[0]) / 365.0))
+
+    @staticmethod
+    def interpolate_nodes(x, y, df, low_indices, ax, weights=None):
+        """
+        Linear discount factor interpolation with a trailing node axis, e.g. one row per scenario.
+        :param x: Node values.
+        :param y: Node rates, (..., len(x)); the first one is returned at the origin.
+        :param df: Node discount factors from node_discount_factors(), shaped like y.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values inside their brackets.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values, (..., len(ax)).
+        """
+        x1 = x[low_indices]
+        y1 = df[..., low_indices]
+        y2 = df[..., low_indices + 1]
+        t = (ax - x[0]) / 365.0
+
+        if weights is not None:
+            ay = y1 + weights * (y2 - y1)
+        else:
+            ay = y1 + (ax - x1) * ((y2 - y1) / (x[low_indices + 1] - x1))
+        at_origin = t == 0
+        return np.where(at_origin, y[..., :1], -np.log(ay) / np.where(at_origin, 1.0, t))
+
+    def instantaneous_forwards_many(self, low_indices, ax):
+        """
+        Instantaneous forwards of the linear discount factor curve, -d log(df) / dt.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Forwards as a NumPy array.
+        """
+        x = np.asarray(self.x)
+        x1 = x[low_indices]
+        y1 = self.df[low_indices]
+        slope = (self.df[low_indices + 1] - y1) / (x[low_indices + 1] - x1)
+        return -365.0 * slope / (y1 + (ax - x1) * slope)
+
+    def node_sensitivities(self, low_indices, ax):
+        """
+        Derivatives of the zero rates with respect to the node rates.
+        With ay = (1 - w) * df1 + w * df2 and d df_k / d y_k = -t_k * df_k, the
+        rate -log(ay) / t has weights (1 - w) * t1 * df1 / (t * ay) and w * t2 * df2 / (t * ay).
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        x = np.asarray(self.x)
+        df = np.asarray(self.df)
+        x1 = x[low_indices]
+        x2 = x[low_indices + 1]
+        y1 = df[low_indices]
+        y2 = df[low_indices + 1]
+        t = (ax - x[0]) / 365.0
+        w = (ax - x1) / (x2 - x1)
+        ay = y1 + (ax - x1) * ((y2 - y1) / (x2 - x1))
+
+        at_origin = t == 0
+        scale = 1.0 / np.where(at_origin, 1.0, t * ay)
+        lower = np.where(at_origin, 1.0, (1.0 - w) * (x1 - x[0]) / 365.0 * y1 * scale)
+        upper = np.where(at_origin, 0.0, w * (x2 - x[0]) / 365.0 * y2 * scale)
+        return bracket_weights(low_indices, lower, upper, len(x))
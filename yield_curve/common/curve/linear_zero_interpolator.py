@@ -11,7 +11,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from yield_curve.common.curve.curve_interpolator import CurveInterpolator, CurveException
+import numpy as np
+
+from yield_curve.common.curve.curve_interpolator import CurveInterpolator, CurveException, bracket_weights
 
 
 class LinearZeroInterpolator(CurveInterpolator):
@@ -32,6 +34,13 @@ class LinearZeroInterpolator(CurveInterpolator):
         self.x = self.curve.get_x()
         self.y = self.curve.get_y()
 
+    def update(self, changed_indices):
+        """
+        Nothing is derived from the y values, so only the binding is refreshed.
+        :param changed_indices: Iterable of node indices whose y values changed.
+        """
+        self.y = self.curve.get_y()
+
     def interpolate(self, low_index: int, ax: float) -> float:
         """
         Interpolate a value using the linear zero method.
@@ -50,3 +59,62 @@ class LinearZeroInterpolator(CurveInterpolator):
 
         ay = y1 + (ax - x1) * (y2 - y1) / (x2 - x1)
         return ay
+
+    def interpolate_many(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values using the linear zero method.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values as a NumPy array.
+        :raises CurveException: If any value is not bracketed.
+        """
+        x = np.asarray(self.x)
+        if weights is None and not np.all((x[low_indices] <= ax) & (ax <= x[low_indices + 1])):
+            raise CurveException("Not bracketed")
+
+        return self.interpolate_nodes(x, np.asarray(self.y), low_indices, ax, weights)
+
+    @staticmethod
+    def interpolate_nodes(x, y, low_indices, ax, weights=None):
+        """
+        Linear zero interpolation of node values with a trailing node axis, e.g. one row per scenario.
+        :param x: Node values.
+        :param y: Node rates, (..., len(x)).
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values inside their brackets.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values, (..., len(ax)).
+        """
+        y1 = y[..., low_indices]
+        y2 = y[..., low_indices + 1]
+        if weights is not None:
+            return y1 + weights * (y2 - y1)
+
+        x1 = x[low_indices]
+        return y1 + (ax - x1) * (y2 - y1) / (x[low_indices + 1] - x1)
+
+    def instantaneous_forwards_many(self, low_indices, ax):
+        """
+        Instantaneous forwards of the linear zero curve, rate + t * d rate / dt.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Forwards as a NumPy array.
+        """
+        x = np.asarray(self.x)
+        y = np.asarray(self.y)
+        x1 = x[low_indices]
+        slope = (y[low_indices + 1] - y[low_indices]) / (x[low_indices + 1] - x1)
+        return y[low_indices] + (ax - x1) * slope + (ax - x[0]) * slope
+
+    def node_sensitivities(self, low_indices, ax):
+        """
+        Derivatives of the linear zero rates with respect to the node rates.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        x = np.asarray(self.x)
+        x1 = x[low_indices]
+        w = (ax - x1) / (x[low_indices + 1] - x1)
+        return bracket_weights(low_indices, 1.0 - w, w, len(x))
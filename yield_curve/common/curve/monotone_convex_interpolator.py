@@ -13,6 +13,9 @@
 
 from math import exp, log, pow
 
+import numpy as np
+from scipy.sparse import csr_matrix, diags, vstack
+
 from yield_curve.common.curve.curve_interpolator import CurveInterpolator
 
 
@@ -26,6 +29,7 @@ class MonotoneConvexInterpolator(CurveInterpolator):
         :param curve: Instance of a class implementing the Curve interface.
         """
         self.curve = curve
+        self.x = None
         self.terms = None
         self.values = None
         self.f = None
@@ -36,37 +40,87 @@ class MonotoneConvexInterpolator(CurveInterpolator):
         Prepare any transformations or setup required for interpolation.
         This method initializes the terms, values, f, and fdiscrete arrays based on the given curve.
         """
-        n = len(self.curve.get_x()) - 1
-        self.values = self.curve.get_y()
-        self.terms = [0.0] * (n + 1)
-        self.f = [0.0] * (n + 1)
-        self.fdiscrete = [0.0] * (n + 1)
+        self.x = np.asarray(self.curve.get_x(), dtype=float)
+        self.values = np.asarray(self.curve.get_y(), dtype=float)
 
         # Convert x values to years
-        for i in range(1, n + 1):
-            self.terms[i] = (self.curve.get_x()[i] - self.curve.get_x()[0]) / 365.0
+        self.terms = (self.x - self.x[0]) / 365.0
+        self.fdiscrete, self.f = self.build_forwards(self.terms, self.values)
+
+    @staticmethod
+    def build_forwards(terms, values):
+        """
+        Discrete and collared instantaneous forwards of node values with a trailing node axis.
+        :param terms: Node terms in years.
+        :param values: Node rates, (..., len(terms)).
+        :return: Tuple (fdiscrete, f), both shaped like values.
+        """
+        n = len(terms) - 1
+        fdiscrete = np.zeros(np.shape(values))
+        f = np.zeros(np.shape(values))
 
         # Calculate discrete forward rates
-        for i in range(1, n + 1):
-            self.fdiscrete[i] = (self.terms[i] * self.values[i] - self.terms[i - 1] * self.values[i - 1]) / (
-                    self.terms[i] - self.terms[i - 1])
+        fdiscrete[..., 1:] = (terms[1:] * values[..., 1:] - terms[:-1] * values[..., :-1]) / (terms[1:] - terms[:-1])
 
         # Calculate continuous forward rates
-        for i in range(1, n):
-            self.f[i] = (self.terms[i] - self.terms[i - 1]) / (
-                    self.terms[i + 1] - self.terms[i - 1]) * self.fdiscrete[i + 1] + (
-                                self.terms[i + 1] - self.terms[i]) / (
-                                self.terms[i + 1] - self.terms[i - 1]) * self.fdiscrete[i]
-
-        # Boundary conditions for f[0] and f[n]
-        self.f[0] = self.collar(0.0, self.fdiscrete[1] - 0.5 * (self.f[1] - self.fdiscrete[1]),
-                                2.0 * self.fdiscrete[1])
-        self.f[n] = self.collar(0.0, self.fdiscrete[n] - 0.5 * (self.f[n - 1] - self.fdiscrete[n]),
-                                2.0 * self.fdiscrete[n])
+        span = terms[2:] - terms[:-2]
+        f[..., 1:n] = (terms[1:n] - terms[:n - 1]) / span * fdiscrete[..., 2:] + (
+                terms[2:] - terms[1:n]) / span * fdiscrete[..., 1:n]
+
+        # Boundary conditions for f[0] and f[n], collared to [0, 2 * fdiscrete]
+        f[..., 0] = np.maximum(0.0, np.minimum(fdiscrete[..., 1] - 0.5 * (f[..., 1] - fdiscrete[..., 1]),
+                                               2.0 * fdiscrete[..., 1]))
+        f[..., n] = np.maximum(0.0, np.minimum(fdiscrete[..., n] - 0.5 * (f[..., n - 1] - fdiscrete[..., n]),
+                                               2.0 * fdiscrete[..., n]))
 
         # Final adjustments for f[i]
-        for i in range(1, n):
-            self.f[i] = self.collar(0.0, self.f[i], 2.0 * min(self.fdiscrete[i], self.fdiscrete[i + 1]))
+        f[..., 1:n] = np.maximum(0.0, np.minimum(f[..., 1:n], 2.0 * np.minimum(fdiscrete[..., 1:n],
+                                                                                fdiscrete[..., 2:])))
+        return fdiscrete, f
+
+    def update(self, changed_indices):
+        """
+        Recompute the discrete and instantaneous forwards next to the changed nodes.
+        A changed value at node j moves fdiscrete[j] and fdiscrete[j + 1], hence f[j - 1]
+        through f[j + 1], and the boundary forwards when those touch the ends.
+        :param changed_indices: Iterable of node indices whose y values changed.
+        """
+        n = len(self.x) - 1
+        if n < 2:
+            self.initialize()
+            return
+
+        changed_fdiscrete = set()
+        for j in changed_indices:
+            changed_fdiscrete.update(k for k in (j, j + 1) if 1 <= k <= n)
+        for i in changed_fdiscrete:
+            self.fdiscrete[i] = (self.terms[i] * self.values[i] - self.terms[i - 1] * self.values[i - 1]) / (
+                    self.terms[i] - self.terms[i - 1])
+
+        changed_f = set()
+        for k in changed_fdiscrete:
+            changed_f.update(i for i in (k - 1, k) if 0 <= i <= n)
+        if 1 in changed_f:
+            changed_f.add(0)
+        if n - 1 in changed_f:
+            changed_f.add(n)
+
+        for i in changed_f:
+            if i == 0:
+                self.f[0] = self.collar(0.0, self.fdiscrete[1] - 0.5 * (self.raw_forward(1) - self.fdiscrete[1]),
+                                        2.0 * self.fdiscrete[1])
+            elif i == n:
+                self.f[n] = self.collar(0.0, self.fdiscrete[n] - 0.5 * (self.raw_forward(n - 1) - self.fdiscrete[n]),
+                                        2.0 * self.fdiscrete[n])
+            else:
+                self.f[i] = self.collar(0.0, self.raw_forward(i), 2.0 * min(self.fdiscrete[i], self.fdiscrete[i + 1]))
+
+    def raw_forward(self, i: int) -> float:
+        """Return the uncollared instantaneous forward at interior node i."""
+        return (self.terms[i] - self.terms[i - 1]) / (
+                self.terms[i + 1] - self.terms[i - 1]) * self.fdiscrete[i + 1] + (
+                       self.terms[i + 1] - self.terms[i]) / (
+                       self.terms[i + 1] - self.terms[i - 1]) * self.fdiscrete[i]
 
     def interpolate(self, low_index: int, ax: float) -> float:
         """
@@ -78,7 +132,7 @@ class MonotoneConvexInterpolator(CurveInterpolator):
         """
         i = low_index
         L = self.terms[i + 1] - self.terms[i]
-        term = (ax - self.curve.get_x()[0]) / 365.0
+        term = (ax - self.x[0]) / 365.0
         x = (term - self.terms[i]) / L
         g0 = self.f[i] - self.fdiscrete[i + 1]
         g1 = self.f[i + 1] - self.fdiscrete[i + 1]
@@ -113,6 +167,249 @@ class MonotoneConvexInterpolator(CurveInterpolator):
 
         return 1.0 / term * (G + self.terms[i] * self.values[i] + term * (self.fdiscrete[i + 1] - self.f[i]))
 
+    def interpolate_many(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values using the monotone convex method.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Interpolated values as a NumPy array.
+        """
+        return self.evaluate(low_indices, ax, weights, False)[0]
+
+    def interpolate_with_forwards(self, low_indices, ax, weights=None):
+        """
+        Interpolate an array of values and return the instantaneous forwards with them.
+        The forwards are d(rate * term) / d(term) of the returned zero rates.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :return: Tuple of NumPy arrays (zero rates, instantaneous forwards).
+        """
+        return self.evaluate(low_indices, ax, weights, True)
+
+    def evaluate(self, low_indices, ax, weights, with_forwards: bool):
+        """
+        Batch evaluation shared by interpolate_many and interpolate_with_forwards.
+        :return: Tuple (zero rates, instantaneous forwards or None).
+        """
+        return self.evaluate_nodes(self.x[0], self.terms, self.values, self.fdiscrete, self.f, low_indices, ax,
+                                   weights, with_forwards)
+
+    @staticmethod
+    def evaluate_nodes(origin, terms, values, fdiscrete, f, low_indices, ax, weights, with_forwards: bool):
+        """
+        Monotone convex evaluation of node values with a trailing node axis, e.g. one row per scenario.
+        The zone of each value is classified with boolean masks and each zone's formula is
+        evaluated over its own subset.
+        :param origin: First node value, the origin of the terms.
+        :param terms: Node terms in years.
+        :param values: Node rates, (..., len(terms)).
+        :param fdiscrete: Discrete forwards from build_forwards(), shaped like values.
+        :param f: Instantaneous node forwards from build_forwards(), shaped like values.
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values inside their brackets.
+        :param weights: Optional precomputed (ax - x1) / (x2 - x1) for each value.
+        :param with_forwards: Also return the instantaneous forwards.
+        :return: Tuple (zero rates, instantaneous forwards or None), each (..., len(ax)).
+        """
+        i = low_indices
+        g0 = f[..., i] - fdiscrete[..., i + 1]
+        g1 = f[..., i + 1] - fdiscrete[..., i + 1]
+        shape = g0.shape
+        L = np.broadcast_to(terms[i + 1] - terms[i], shape)
+        term = (ax - origin) / 365.0
+        elapsed = np.broadcast_to(term - terms[i], shape)
+        x = np.broadcast_to(elapsed / L if weights is None else weights, shape)
+        G = np.zeros(shape)
+        dG = np.zeros(shape) if with_forwards else None
+        # Values on a node take the zone of the segment so that their forwards are its one-sided limits
+        zone1, zone2, zone4 = MonotoneConvexInterpolator.classify_zones(x, g0, g1, include_nodes=True)
+
+        k = zone1
+        G[k] = L[k] * (g0[k] * MonotoneConvexInterpolator.cubic_eval_array(x[k], 1.0, -2.0, 1.0) + g1[k] * 0.0)
+        if with_forwards:
+            dG[k] = g0[k] * (3.0 * x[k] * x[k] - 4.0 * x[k] + 1.0)
+
+        k = zone2
+        eta = g1[k] / (g1[k] - g0[k])
+        linear = g0[k] * elapsed[k]
+        beyond = x[k] > eta
+        curved = linear[beyond] + (g1[k][beyond] - g0[k][beyond]) * np.power(x[k][beyond] - eta[beyond], 3) \
+            / np.power(eta[beyond] - x[k][beyond], 2)
+        linear[beyond] = curved
+        G[k] = linear
+        if with_forwards:
+            dG[k] = g0[k] + np.where(beyond, (g1[k] - g0[k]) / L[k], 0.0)
+
+        k = zone4
+        eta = g1[k] / (g1[k] + g0[k])
+        beyond = x[k] > eta
+        G[k] = L[k] * (g0[k] * np.where(beyond,
+                                        MonotoneConvexInterpolator.cubic_eval_array(x[k], 1.0, -1.0, 1.0),
+                                        MonotoneConvexInterpolator.cubic_eval_array(x[k], 1.0, -2.0, 1.0))
+                       + g1[k] * 0.0)
+        if with_forwards:
+            dG[k] = g0[k] * np.where(beyond,
+                                     3.0 * x[k] * x[k] - 2.0 * x[k] + 1.0,
+                                     3.0 * x[k] * x[k] - 4.0 * x[k] + 1.0)
+
+        # The rate on a node is the node value, as in interpolate()
+        G[(x == 0.0) | (x == 1.0)] = 0.0
+
+        at_origin = term <= 0.0
+        term = np.where(at_origin, 1.0, term)
+        result = 1.0 / term * (G + terms[i] * values[..., i] + term * (fdiscrete[..., i + 1] - f[..., i]))
+        result = np.where(at_origin, f[..., :1], result)
+        if not with_forwards:
+            return result, None
+
+        # Forwards use the segment formula on every node, the origin included
+        return result, dG + fdiscrete[..., i + 1] - f[..., i]
+
+    @staticmethod
+    def classify_zones(x, g0, g1, include_nodes: bool = False):
+        """
+        Classify each value into the zones tested by interpolate(), in the same order.
+        Zone 3 (g0 == g1 == 0) belongs to none of the masks, nor do values with x equal to 0 or 1
+        unless include_nodes is set.
+        :return: Tuple of boolean masks (zone 1, zone 2, zone 4).
+        """
+        pending = np.ones(np.shape(x), dtype=bool) if include_nodes else ~((x == 0.0) | (x == 1.0))
+        zone1 = pending & (((g0 <= 0.0) & (-0.5 * g0 <= g1) & (g1 <= -2.0 * g0))
+                           | ((g0 > 0.0) & (-0.5 * g0 >= g1) & (g1 >= -2.0 * g0)))
+        pending &= ~zone1
+        zone2 = pending & (((g0 <= 0.0) & (-2.0 * g0 < g1) & (g1 <= -0.5 * g0))
+                           | ((g0 > 0.0) & (-2.0 * g0 > g1) & (g1 >= -0.5 * g0)))
+        pending &= ~zone2
+        zone4 = pending & ~((g0 == 0.0) & (g1 == 0.0))
+        return zone1, zone2, zone4
+
+    def forward_sensitivities(self):
+        """
+        Derivatives of the discrete and instantaneous forwards with respect to the node values.
+        The collars are piecewise linear, so each forward follows the branch it took in initialize().
+        :return: Tuple of sparse (n + 1 x n + 1) matrices (d fdiscrete / d y, d f / d y).
+        """
+        terms = np.asarray(self.terms)
+        fdiscrete = np.asarray(self.fdiscrete)
+        n = len(terms) - 1
+
+        k = np.arange(1, n + 1)
+        dt = terms[k] - terms[k - 1]
+        d_fdiscrete = csr_matrix((np.concatenate([terms[k] / dt, -terms[k - 1] / dt]),
+                                  (np.concatenate([k, k]), np.concatenate([k, k - 1]))), shape=(n + 1, n + 1))
+
+        first = d_fdiscrete[[1]]
+        last = d_fdiscrete[[n]]
+        if n == 1:
+            d_f0 = self.collar_sensitivity(np.array([1.5 * fdiscrete[1]]), 1.5 * first,
+                                           np.array([2.0 * fdiscrete[1]]), 2.0 * first)
+            return d_fdiscrete, vstack([d_f0, self.collar_sensitivity(
+                np.array([fdiscrete[1] - 0.5 * (self.f[0] - fdiscrete[1])]), 1.5 * last - 0.5 * d_f0,
+                np.array([2.0 * fdiscrete[1]]), 2.0 * last)]).tocsr()
+
+        i = np.arange(1, n)
+        span = terms[i + 1] - terms[i - 1]
+        a = (terms[i] - terms[i - 1]) / span
+        b = (terms[i + 1] - terms[i]) / span
+        raw = a * fdiscrete[i + 1] + b * fdiscrete[i]
+        d_raw = diags(a) @ d_fdiscrete[i + 1] + diags(b) @ d_fdiscrete[i]
+
+        lower_cap = fdiscrete[i] <= fdiscrete[i + 1]
+        d_cap = 2.0 * (diags(lower_cap.astype(float)) @ d_fdiscrete[i]
+                       + diags((~lower_cap).astype(float)) @ d_fdiscrete[i + 1])
+        d_interior = self.collar_sensitivity(raw, d_raw, 2.0 * np.minimum(fdiscrete[i], fdiscrete[i + 1]), d_cap)
+
+        d_f0 = self.collar_sensitivity(np.array([fdiscrete[1] - 0.5 * (raw[0] - fdiscrete[1])]),
+                                       1.5 * first - 0.5 * d_raw[[0]],
+                                       np.array([2.0 * fdiscrete[1]]), 2.0 * first)
+        d_fn = self.collar_sensitivity(np.array([fdiscrete[n] - 0.5 * (raw[-1] - fdiscrete[n])]),
+                                       1.5 * last - 0.5 * d_raw[[n - 2]],
+                                       np.array([2.0 * fdiscrete[n]]), 2.0 * last)
+
+        return d_fdiscrete, vstack([d_f0, d_interior, d_fn]).tocsr()
+
+    @staticmethod
+    def collar_sensitivity(value, d_value, cap, d_cap):
+        """
+        Derivative of collar(0, value, cap) row by row, following the branch taken by collar().
+        :param value: Array of collared values.
+        :param d_value: Sparse derivative rows of value.
+        :param cap: Array of caps.
+        :param d_cap: Sparse derivative rows of cap.
+        :return: Sparse derivative rows of the collared values.
+        """
+        capped = value > cap
+        floored = 0.0 >= np.where(capped, cap, value)
+        return (diags((~capped & ~floored).astype(float)) @ d_value
+                + diags((capped & ~floored).astype(float)) @ d_cap).tocsr()
+
+    def instantaneous_forwards_many(self, low_indices, ax):
+        """
+        Instantaneous forwards of the monotone convex curve.
+        :param low_indices: Array of lower indices, one per value.
+        :param ax: Array of values.
+        :return: Forwards as a NumPy array.
+        """
+        return self.evaluate(low_indices, ax, None, True)[1]
+
+    def node_sensitivities(self, low_indices, ax):
+        """
+        Derivatives of the monotone convex zero rates with respect to the node values.
+        The rate is (G + terms[i] * values[i] + term * (fdiscrete[i + 1] - f[i])) / term, where
+        G depends on g0 = f[i] - fdiscrete[i + 1] and g1 = f[i + 1] - fdiscrete[i + 1] through
+        the zone formula used by interpolate().
+        :param low_indices: Array of lower indices for interpolation.
+        :param ax: Array of values to interpolate.
+        :return: Sparse (len(ax) x number of nodes) matrix of weights.
+        """
+        terms = np.asarray(self.terms)
+        f = np.asarray(self.f)
+        fdiscrete = np.asarray(self.fdiscrete)
+        num_nodes = len(terms)
+
+        i = low_indices
+        L = terms[i + 1] - terms[i]
+        term = (ax - self.x[0]) / 365.0
+        x = (term - terms[i]) / L
+        g0 = f[i] - fdiscrete[i + 1]
+        g1 = f[i + 1] - fdiscrete[i + 1]
+        dG_dg0 = np.zeros(len(ax))
+        dG_dg1 = np.zeros(len(ax))
+        zone1, zone2, zone4 = self.classify_zones(x, g0, g1)
+
+        k = zone1
+        dG_dg0[k] = L[k] * self.cubic_eval_array(x[k], 1.0, -2.0, 1.0)
+
+        # Beyond eta the zone 2 formula reduces to g0 * (term - terms[i]) + (g1 - g0) * x - g1
+        k = zone2
+        beyond = x[k] > g1[k] / (g1[k] - g0[k])
+        dG_dg0[k] = term[k] - terms[i[k]] - np.where(beyond, x[k], 0.0)
+        dG_dg1[k] = np.where(beyond, x[k] - 1.0, 0.0)
+
+        k = zone4
+        beyond = x[k] > g1[k] / (g1[k] + g0[k])
+        dG_dg0[k] = L[k] * np.where(beyond,
+                                    self.cubic_eval_array(x[k], 1.0, -1.0, 1.0),
+                                    self.cubic_eval_array(x[k], 1.0, -2.0, 1.0))
+
+        at_origin = term <= 0.0
+        inverse_term = np.where(at_origin, 0.0, 1.0 / np.where(at_origin, 1.0, term))
+        d_fdiscrete, d_f = self.forward_sensitivities()
+        rows = np.arange(len(ax))
+
+        return (diags((dG_dg0 - term) * inverse_term) @ d_f[i]
+                + diags(dG_dg1 * inverse_term) @ d_f[i + 1]
+                + diags((term - dG_dg0 - dG_dg1) * inverse_term) @ d_fdiscrete[i + 1]
+                + csr_matrix((terms[i] * inverse_term, (rows, i)), shape=(len(ax), num_nodes))
+                + diags(at_origin.astype(float)) @ d_f[np.zeros(len(ax), dtype=int)]).tocsr()
+
+    @staticmethod
+    def cubic_eval_array(x, a, b, c):
+        """Evaluate ax^3 + bx^2 + cx over an array."""
+        return a * np.power(x, 3) + b * np.power(x, 2) + c * x
+
     @staticmethod
     def collar(a, b, c):
         """Return max(a, min(b, c))."""
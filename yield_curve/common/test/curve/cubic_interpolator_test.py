@@ -0,0 +1,48 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from scipy.interpolate import CubicSpline
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestCubicInterpolator(unittest.TestCase):
+    def setUp(self):
+        self.dates = np.array([
+            44287.0, 44317.0, 44348.0, 44378.0,
+            44470.0, 44652.0, 45017.0, 45383.0, 46113.0,
+            47939.0, 49766.0, 51592.0, 53418.0, 54879.0
+        ])
+        self.rates = np.array([
+            0.02, 0.01, 0.011, 0.012, 0.015,
+            0.022, 0.025, 0.027, 0.026, 0.025, 0.024,
+            0.0235, 0.0235, 0.024
+        ])
+        self.curve = CurveImpl(self.dates, self.rates, InterpolationMethod.CUBIC_SPLINE)
+        self.test_dates = np.linspace(self.dates[0] + 0.5, self.dates[-1] - 0.5, 400)
+        self.low_indices = np.searchsorted(self.dates, self.test_dates) - 1
+
+    def test_natural_spline(self):
+        expected = CubicSpline(self.dates, self.rates, bc_type="natural")
+        np.testing.assert_allclose(self.curve.interpolate_array(self.test_dates), expected(self.test_dates),
+                                   rtol=0.0, atol=1e-14)
+
+    def test_derivatives(self):
+        expected = CubicSpline(self.dates, self.rates, bc_type="natural")
+        interpolator = self.curve.interpolator
+        np.testing.assert_allclose(interpolator.first_derivative_many(self.low_indices, self.test_dates),
+                                   expected(self.test_dates, 1), rtol=0.0, atol=1e-15)
+        np.testing.assert_allclose(interpolator.second_derivative_many(self.low_indices, self.test_dates),
+                                   expected(self.test_dates, 2), rtol=0.0, atol=1e-15)
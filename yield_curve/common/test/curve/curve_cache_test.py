@@ -0,0 +1,50 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from math import exp
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestCurveCache(unittest.TestCase):
+    def setUp(self):
+        dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0])
+        rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022])
+        self.curve = CurveImpl(dates, rates, InterpolationMethod.MONOTONE_CONVEX)
+
+    def test_cached_lookups(self):
+        expected = self.curve.interpolate(44400.0)
+        self.curve.enable_cache(max_size=2)
+        self.assertEqual(expected, self.curve.interpolate(44400.0))
+        self.assertEqual(expected, self.curve.interpolate(44400.0))
+        self.assertEqual(1, self.curve.rate_cache.hits)
+        self.assertAlmostEqual(exp(-expected * (44400.0 - 44287.0) / 365.0), self.curve.discount(44400.0),
+                               delta=1e-15)
+
+    def test_update_invalidates(self):
+        self.curve.enable_cache()
+        before = self.curve.interpolate(44400.0)
+        version = self.curve.version
+        self.curve.get_y()[3] += 0.001
+        self.curve.update([3])
+        self.assertEqual(version + 1, self.curve.version)
+        self.assertNotEqual(before, self.curve.interpolate(44400.0))
+        self.assertEqual(self.curve.interpolate_uncached(44400.0), self.curve.interpolate(44400.0))
+
+    def test_bounded_size(self):
+        self.curve.enable_cache(max_size=3)
+        for test_date in np.linspace(44300.0, 44600.0, 10):
+            self.curve.interpolate(test_date)
+        self.assertEqual(3, len(self.curve.rate_cache))
@@ -0,0 +1,47 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.curve_implementation import CurveImplementation
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestCurveImplementation(unittest.TestCase):
+    def setUp(self):
+        dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0, 45017.0])
+        rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022, 0.025])
+        self.source = CurveImpl(dates, rates, InterpolationMethod.MONOTONE_CONVEX)
+        self.curve = CurveImplementation(self.source)
+
+    def test_read_only_views(self):
+        x = self.curve.get_x()
+        y = self.curve.get_y()
+        self.assertFalse(x.flags.writeable)
+        self.assertFalse(y.flags.writeable)
+        self.assertTrue(np.shares_memory(x, self.curve.get_x()))
+        with self.assertRaises(ValueError):
+            y[0] = 1.0
+
+    def test_independent_of_source(self):
+        expected = self.curve.interpolate(44400.0)
+        self.source.get_y()[4] += 0.01
+        self.source.update()
+        self.assertEqual(expected, self.curve.interpolate(44400.0))
+
+    def test_interpolate_array(self):
+        test_dates = np.linspace(44287.0, 45017.0, 101)
+        result = self.curve.interpolate_array(test_dates)
+        for i, test_date in enumerate(test_dates):
+            self.assertAlmostEqual(self.source.interpolate(test_date), result[i], delta=1e-14)
@@ -0,0 +1,65 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.curve_set import CurveSet
+from yield_curve.common.curve.Exception.CurveException import CurveException
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestCurveSet(unittest.TestCase):
+    dates = np.array([
+        44287.0, 44317.0, 44348.0, 44378.0,
+        44470.0, 44652.0, 45017.0, 45383.0, 46113.0,
+        47939.0, 49766.0, 51592.0, 53418.0, 54879.0
+    ])
+    methods = [
+        InterpolationMethod.LINEAR_DF, InterpolationMethod.LINEAR_ZERO, InterpolationMethod.FLAT_FORWARD,
+        InterpolationMethod.CUBIC_SPLINE, InterpolationMethod.MONOTONE_CONVEX
+    ]
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.scenarios = 0.02 + 0.005 * rng.standard_normal((25, len(self.dates)))
+        self.test_dates = np.concatenate([self.dates, np.linspace(self.dates[0], self.dates[-1], 211)])
+
+    def test_matches_single_curves(self):
+        for method in self.methods:
+            curve_set = CurveSet(self.dates, self.scenarios, method)
+            result = curve_set.interpolate_array(self.test_dates)
+            self.assertEqual((25, len(self.test_dates)), result.shape)
+            for k in range(len(self.scenarios)):
+                expected = curve_set.get_curve(k).interpolate_array(self.test_dates)
+                np.testing.assert_allclose(result[k], expected, rtol=0.0, atol=1e-14, err_msg=method)
+
+    def test_update_after_shock(self):
+        curve_set = CurveSet(self.dates, np.copy(self.scenarios), InterpolationMethod.CUBIC_SPLINE)
+        curve_set.get_y()[3] += 0.001
+        curve_set.update()
+        expected = CurveImpl(self.dates, self.scenarios[3] + 0.001, InterpolationMethod.CUBIC_SPLINE)
+        np.testing.assert_allclose(curve_set.interpolate_array(self.test_dates)[3],
+                                   expected.interpolate_array(self.test_dates), rtol=0.0, atol=1e-14)
+
+    def test_no_scenarios(self):
+        for method in self.methods:
+            curve_set = CurveSet(self.dates, np.zeros((0, len(self.dates))), method)
+            self.assertEqual(0, curve_set.get_num_scenarios())
+            self.assertEqual((0, len(self.test_dates)), curve_set.interpolate_array(self.test_dates).shape)
+
+    def test_shape_validation(self):
+        with self.assertRaises(CurveException):
+            CurveSet(self.dates, self.scenarios[:, :-1], InterpolationMethod.LINEAR_ZERO)
+        with self.assertRaises(CurveException):
+            CurveSet(self.dates, self.scenarios[0], InterpolationMethod.LINEAR_ZERO)
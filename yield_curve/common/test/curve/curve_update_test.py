@@ -0,0 +1,48 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestIncrementalUpdate(unittest.TestCase):
+    dates = np.array([
+        44287.0, 44317.0, 44348.0, 44378.0,
+        44470.0, 44652.0, 45017.0, 45383.0, 46113.0,
+        47939.0, 49766.0, 51592.0, 53418.0, 54879.0
+    ])
+    rates = np.array([
+        0.02, 0.01, 0.011, 0.012, 0.015,
+        0.022, 0.025, 0.027, 0.026, 0.025, 0.024,
+        0.0235, 0.0235, 0.024
+    ])
+    methods = [
+        InterpolationMethod.LINEAR_DF, InterpolationMethod.LINEAR_ZERO, InterpolationMethod.FLAT_FORWARD,
+        InterpolationMethod.CUBIC_SPLINE, InterpolationMethod.MONOTONE_CONVEX
+    ]
+
+    def test_update_matches_rebuild(self):
+        test_dates = np.linspace(self.dates[0], self.dates[-1], 501)
+        for method in self.methods:
+            for changed in ([0], [1], [6], [12], [13], [2, 9]):
+                curve = CurveImpl(np.copy(self.dates), np.copy(self.rates), method)
+                for i in changed:
+                    curve.get_y()[i] += 0.0025
+                curve.update(changed)
+
+                rebuilt = CurveImpl(np.copy(self.dates), np.copy(curve.get_y()), method)
+                np.testing.assert_array_equal(curve.interpolate_array(test_dates),
+                                              rebuilt.interpolate_array(test_dates),
+                                              err_msg=f"{method} {changed}")
@@ -0,0 +1,78 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+METHODS = [
+    InterpolationMethod.LINEAR_DF,
+    InterpolationMethod.LINEAR_ZERO,
+    InterpolationMethod.FLAT_FORWARD,
+    InterpolationMethod.CUBIC_SPLINE,
+    InterpolationMethod.MONOTONE_CONVEX,
+]
+
+
+class TestForwardRates(unittest.TestCase):
+    def setUp(self):
+        self.dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0, 45017.0, 45383.0, 46113.0])
+        self.rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022, 0.025, 0.027, 0.026])
+        self.query = np.linspace(44290.3, 46110.7, 201)
+
+    def test_discount_factors(self):
+        for method in METHODS:
+            curve = CurveImpl(self.dates, self.rates, method)
+            expected = [curve.discount(d) for d in self.query]
+            np.testing.assert_allclose(curve.discount_factors(self.query), expected, rtol=1e-14)
+
+    def test_forward_rates(self):
+        curve = CurveImpl(self.dates, self.rates, InterpolationMethod.LINEAR_ZERO)
+        start = self.query[:-1]
+        end = self.query[1:]
+        accruals = (end - start) / 360.0
+        expected = [(curve.discount(s) / curve.discount(e) - 1.0) / a for s, e, a in zip(start, end, accruals)]
+        np.testing.assert_allclose(curve.forward_rates(start, end, accruals), expected, rtol=1e-12)
+
+    def test_instantaneous_forwards(self):
+        bump = 1e-3
+        for method in METHODS:
+            curve = CurveImpl(self.dates, self.rates, method)
+            log_df_up = np.log(curve.discount_factors(self.query + bump))
+            log_df_down = np.log(curve.discount_factors(self.query - bump))
+            expected = -(log_df_up - log_df_down) / (2.0 * bump / 365.0)
+            np.testing.assert_allclose(curve.instantaneous_forwards(self.query), expected, atol=1e-8)
+
+    def test_forwards_on_nodes(self):
+        curve = CurveImpl(self.dates, self.rates, InterpolationMethod.FLAT_FORWARD)
+        forwards = curve.instantaneous_forwards(self.dates)
+        rt = self.rates * (self.dates - self.dates[0])
+        expected = np.diff(rt) / np.diff(self.dates)
+        np.testing.assert_allclose(forwards[:-1], expected, rtol=1e-14)
+        self.assertEqual(forwards[-2], forwards[-1])
+
+    def test_forwards_on_nodes_are_one_sided_limits(self):
+        eps = 1e-6
+        for method in METHODS:
+            curve = CurveImpl(self.dates, self.rates, method)
+            forwards = curve.instantaneous_forwards(self.dates)
+            right = curve.instantaneous_forwards(self.dates[:-1] + eps)
+            np.testing.assert_allclose(forwards[:-1], right, atol=1e-8, err_msg=method)
+            left = curve.instantaneous_forwards(self.dates[-1:] - eps)
+            np.testing.assert_allclose(forwards[-1:], left, atol=1e-8, err_msg=method)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.grid_index import GridIndex
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestGridIndex(unittest.TestCase):
+    def setUp(self):
+        self.dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0, 45017.0])
+        self.rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022, 0.025])
+        self.query = np.array([44290.0, 44317.0, 44400.0, 44999.5])
+
+    def test_shared_grid(self):
+        grid_index = GridIndex()
+        anchor = CurveImpl(self.dates, self.rates, InterpolationMethod.MONOTONE_CONVEX)
+        basis = CurveImpl(np.copy(self.dates), self.rates + 0.001, InterpolationMethod.LINEAR_ZERO)
+
+        np.testing.assert_allclose(grid_index.interpolate(anchor, self.query), anchor.interpolate_array(self.query),
+                                   rtol=1e-14)
+        np.testing.assert_allclose(grid_index.interpolate(basis, self.query), basis.interpolate_array(self.query), rtol=1e-14)
+        self.assertEqual(1, len(grid_index))
+        self.assertEqual(1, grid_index.hits)
+        self.assertEqual(1, grid_index.misses)
+
+    def test_distinct_grids(self):
+        grid_index = GridIndex()
+        anchor = CurveImpl(self.dates, self.rates, InterpolationMethod.LINEAR_ZERO)
+        diff = CurveImpl(self.dates[::2], self.rates[::2], InterpolationMethod.LINEAR_DF)
+
+        np.testing.assert_allclose(grid_index.interpolate(diff, self.query), diff.interpolate_array(self.query), rtol=1e-14)
+        grid_index.interpolate(anchor, self.query)
+        self.assertEqual(2, len(grid_index))
+        self.assertEqual(0, grid_index.hits)
+
+    def test_values_follow_curve_updates(self):
+        grid_index = GridIndex()
+        curve = CurveImpl(self.dates, self.rates, InterpolationMethod.CUBIC_SPLINE)
+        grid_index.interpolate(curve, self.query)
+        curve.get_y()[3] += 0.002
+        curve.update([3])
+        np.testing.assert_allclose(grid_index.interpolate(curve, self.query), curve.interpolate_array(self.query), rtol=1e-14)
+        self.assertEqual(1, grid_index.hits)
+
+    def test_grid_key_is_cached(self):
+        anchor = CurveImpl(self.dates, self.rates, InterpolationMethod.LINEAR_ZERO)
+        basis = CurveImpl(np.copy(self.dates), self.rates, InterpolationMethod.LINEAR_DF)
+        key = anchor.grid_key()
+        self.assertIs(key, anchor.grid_key())
+        self.assertEqual(key, basis.grid_key())
+        self.assertNotEqual(key, CurveImpl(self.dates[::2], self.rates[::2], InterpolationMethod.LINEAR_ZERO).grid_key())
+
+    def test_grid_changed_in_place(self):
+        grid_index = GridIndex()
+        curve = CurveImpl(np.copy(self.dates), self.rates, InterpolationMethod.LINEAR_ZERO)
+        grid_index.interpolate(curve, self.query)
+        np.copyto(curve.get_x(), self.dates + 3.0)
+        curve.update()
+        np.testing.assert_allclose(grid_index.interpolate(curve, self.query), curve.interpolate_array(self.query),
+                                   rtol=1e-14)
+        self.assertEqual(2, grid_index.misses)
+
+    def test_bounded_plans(self):
+        grid_index = GridIndex(max_size=2)
+        curve = CurveImpl(self.dates, self.rates, InterpolationMethod.LINEAR_ZERO)
+        for shift in (0.0, 1.0, 2.0, 0.0):
+            grid_index.interpolate(curve, self.query + shift)
+        self.assertEqual(2, len(grid_index))
+        self.assertEqual(4, grid_index.misses)
+
+    def test_fork(self):
+        grid_index = GridIndex()
+        curve = CurveImpl(self.dates, self.rates, InterpolationMethod.LINEAR_ZERO)
+        grid_index.interpolate(curve, self.query)
+        forked = grid_index.fork()
+        forked.interpolate(curve, self.query)
+        forked.interpolate(curve, self.query + 1.0)
+        self.assertEqual(1, forked.hits)
+        self.assertEqual(2, len(forked))
+        self.assertEqual(1, len(grid_index))
+
+
+if __name__ == '__main__':
+    unittest.main()
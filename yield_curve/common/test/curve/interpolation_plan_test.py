@@ -0,0 +1,52 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.Exception.CurveException import CurveException
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.common.curve.interpolation_plan import InterpolationPlan
+
+
+class TestInterpolationPlan(unittest.TestCase):
+    dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0, 45017.0, 45383.0, 46113.0])
+    rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022, 0.025, 0.027, 0.026])
+    methods = [
+        InterpolationMethod.LINEAR_DF, InterpolationMethod.LINEAR_ZERO, InterpolationMethod.FLAT_FORWARD,
+        InterpolationMethod.CUBIC_SPLINE, InterpolationMethod.MONOTONE_CONVEX
+    ]
+
+    def test_plan_tracks_curve_updates(self):
+        payment_dates = [44383.0, 44474.0, 44566.0, 44652.0, 45000.0]
+        for method in self.methods:
+            curve = CurveImpl(np.copy(self.dates), np.copy(self.rates), method)
+            plan = InterpolationPlan(curve, payment_dates)
+            np.testing.assert_allclose(plan.evaluate(curve), curve.interpolate_array(payment_dates),
+                                       rtol=0.0, atol=1e-14, err_msg=method)
+
+            curve.get_y()[3] += 0.001
+            curve.update()
+            np.testing.assert_allclose(plan.evaluate(curve), curve.interpolate_array(payment_dates),
+                                       rtol=0.0, atol=1e-14, err_msg=method)
+            np.testing.assert_allclose(plan.node_sensitivities(curve).toarray(),
+                                       curve.node_sensitivities(payment_dates).toarray(),
+                                       rtol=0.0, atol=1e-14, err_msg=method)
+
+    def test_plan_rejects_other_grid(self):
+        curve = CurveImpl(np.copy(self.dates), np.copy(self.rates), InterpolationMethod.LINEAR_ZERO)
+        plan = InterpolationPlan(curve, [44400.0])
+        other = CurveImpl(self.dates[:-1], self.rates[:-1], InterpolationMethod.LINEAR_ZERO)
+        self.assertFalse(plan.matches(other))
+        with self.assertRaises(CurveException):
+            plan.evaluate(other)
@@ -0,0 +1,46 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestMonotoneConvexInterpolator(unittest.TestCase):
+    def setUp(self):
+        self.dates = np.array([
+            44287.0, 44317.0, 44348.0, 44378.0,
+            44470.0, 44652.0, 45017.0, 45383.0, 46113.0,
+            47939.0, 49766.0, 51592.0, 53418.0, 54879.0
+        ])
+        rates = np.array([
+            0.02, 0.01, 0.011, 0.012, 0.015,
+            0.022, 0.025, 0.027, 0.026, 0.025, 0.024,
+            0.0235, 0.0235, 0.024
+        ])
+        self.curve = CurveImpl(self.dates, rates, InterpolationMethod.MONOTONE_CONVEX)
+        self.test_dates = np.linspace(self.dates[0] + 1.25, self.dates[-1] - 1.25, 500)
+        self.low_indices = np.searchsorted(self.dates, self.test_dates) - 1
+
+    def test_rates_with_forwards(self):
+        rates, forwards = self.curve.interpolator.interpolate_with_forwards(self.low_indices, self.test_dates)
+        np.testing.assert_array_equal(rates, self.curve.interpolate_array(self.test_dates))
+
+        # The forward is the derivative of rate * term
+        bump = 1e-4
+        up = self.test_dates + bump
+        down = self.test_dates - bump
+        expected = (self.curve.interpolate_array(up) * (up - self.dates[0])
+                    - self.curve.interpolate_array(down) * (down - self.dates[0])) / (2.0 * bump)
+        np.testing.assert_allclose(forwards, expected, rtol=0.0, atol=1e-8)
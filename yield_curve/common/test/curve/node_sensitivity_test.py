@@ -0,0 +1,64 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+class TestNodeSensitivities(unittest.TestCase):
+    dates = np.array([
+        44287.0, 44317.0, 44348.0, 44378.0,
+        44470.0, 44652.0, 45017.0, 45383.0, 46113.0,
+        47939.0, 49766.0, 51592.0, 53418.0, 54879.0
+    ])
+    rates = np.array([
+        0.02, 0.021, 0.022, 0.021, 0.018,
+        0.022, 0.025, 0.027, 0.026, 0.028, 0.024,
+        0.03, 0.0235, 0.024
+    ])
+    methods = [
+        InterpolationMethod.LINEAR_DF, InterpolationMethod.LINEAR_ZERO, InterpolationMethod.FLAT_FORWARD,
+        InterpolationMethod.CUBIC_SPLINE, InterpolationMethod.MONOTONE_CONVEX
+    ]
+
+    def bumped(self, method, index, bump):
+        curve = CurveImpl(np.copy(self.dates), np.copy(self.rates), method)
+        curve.get_y()[index] += bump
+        curve.update()
+        return curve
+
+    def test_matches_finite_differences(self):
+        test_dates = np.concatenate([self.dates, np.linspace(self.dates[0] + 0.5, self.dates[-1] - 0.5, 301)])
+        bump = 1e-8
+        for method in self.methods:
+            curve = CurveImpl(np.copy(self.dates), np.copy(self.rates), method)
+            sensitivities = curve.node_sensitivities(test_dates)
+            self.assertEqual((len(test_dates), len(self.dates)), sensitivities.shape)
+
+            expected = np.zeros(sensitivities.shape)
+            for i in range(len(self.dates)):
+                up = self.bumped(method, i, bump).interpolate_array(test_dates)
+                down = self.bumped(method, i, -bump).interpolate_array(test_dates)
+                expected[:, i] = (up - down) / (2.0 * bump)
+            np.testing.assert_allclose(sensitivities.toarray(), expected, rtol=0.0, atol=1e-6, err_msg=method)
+
+    def test_local_methods_are_sparse(self):
+        test_dates = np.array([44300.0, 44378.0, 50000.0])
+        for method in [InterpolationMethod.LINEAR_DF, InterpolationMethod.LINEAR_ZERO,
+                       InterpolationMethod.FLAT_FORWARD]:
+            curve = CurveImpl(np.copy(self.dates), np.copy(self.rates), method)
+            sensitivities = curve.node_sensitivities(test_dates)
+            self.assertLessEqual(sensitivities.nnz, 5)
+            self.assertEqual(1.0, sensitivities[1, 3])
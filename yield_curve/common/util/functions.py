@@ -20,3 +20,16 @@ def binary_search(arr, val):
         return index
     else:
         return -index-1
+
+
+def binary_search_array(arr, values):
+    """
+    Vectorized binary_search over an array of values.
+    Uses the same encoding as binary_search: the index when the value is found,
+    otherwise -(insertion point) - 1.
+    """
+    values = np.asarray(values, dtype=float)
+    index = np.searchsorted(arr, values)
+    found = index < len(arr)
+    found[found] = arr[index[found]] == values[found]
+    return np.where(found, index, -index - 1)
@@ -0,0 +1,234 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+import numpy as np
+
+from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.grid_index import GridIndex
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.common.curve.interpolation_plan import InterpolationPlan
+from yield_curve.engine.curve_adjustment.curve_adjuster_parameters import CurveAdjusterParams
+
+
+class BaseCurveAdjuster:
+    """Curve construction and lookup shared by the curve adjusters."""
+
+    class StubType:
+        FLAT = "FLAT"
+        LINEAR = "LINEAR"
+
+    def __init__(self, valuation_date: float, curve_max_date: float):
+        self.valuation_date = valuation_date
+        self.curve_max_date = curve_max_date
+        self.grid_index = GridIndex()
+
+    def build_curves(self, initial_curve: Curve, params: CurveAdjusterParams, is_basis: bool) -> List[CurveImpl]:
+        curve_dates = params.get_curve_dates(self.valuation_date, self.curve_max_date)
+        # ToDo
+        curve_dates = [date for date in curve_dates if date != 0]
+        curve_rates = np.zeros(len(curve_dates))  # Initialize with zeros
+
+        result = [CurveImpl] * 3  # Predefine a list for 3 CurveImpl instances
+
+        # Special case: no curve points
+        if len(curve_dates) == 2:
+            # Copy the input curve
+            result[0] = CurveImpl(
+                np.array(initial_curve.get_x()),
+                np.array(initial_curve.get_y()),
+                params.get_interpolation_method()
+            )
+            if is_basis:
+                # For a basis curve, mark it as flat
+                result[0] = CurveImpl(
+                    np.array([self.valuation_date, self.curve_max_date]),
+                    np.array([0.0, 0.0]),
+                    InterpolationMethod.LINEAR_ZERO
+                )
+            # Flat overlap basis curves, so that restore and update work on every curve
+            result[1] = CurveImpl(
+                np.array([self.valuation_date, self.curve_max_date]),
+                np.array([0.0, 0.0]),
+                InterpolationMethod.LINEAR_ZERO
+            )
+            result[2] = CurveImpl(
+                np.array([self.valuation_date, self.curve_max_date]),
+                np.array([0.0, 0.0]),
+                InterpolationMethod.LINEAR_ZERO
+            )
+            return result
+
+        # Fill curve_rates for intermediate dates
+        for i in range(1, len(curve_dates) - 1):
+            curve_rates[i] = initial_curve.interpolate(curve_dates[i])
+
+        # Plug in a rate for t=0
+        curve_rates[0] = curve_rates[1]
+
+        # Handle extrapolation for the last rate
+        if params.get_long_dates() and params.get_long_dates()[-1] == self.curve_max_date:
+            curve_rates[-1] = initial_curve.interpolate(curve_dates[-1])
+        else:
+            self.extrapolate(curve_dates, curve_rates, params)
+
+        # Create the primary curve
+        result[0] = CurveImpl(
+            np.array(curve_dates),
+            np.array(curve_rates),
+            params.get_interpolation_method()
+        )
+
+        # Handle overlaps
+        overlap_dates = params.get_short_mid_overlap_dates(self.valuation_date)
+        overlap_rates = np.zeros(len(overlap_dates))
+        result[1] = CurveImpl(
+            np.array(overlap_dates),
+            np.array(overlap_rates),
+            InterpolationMethod.LINEAR_ZERO
+        )
+
+        overlap_dates = params.get_mid_long_overlap_dates(self.valuation_date)
+        overlap_rates = np.zeros(len(overlap_dates))
+        result[2] = CurveImpl(
+            np.array(overlap_dates),
+            np.array(overlap_rates),
+            InterpolationMethod.LINEAR_ZERO
+        )
+
+        return result
+
+    def curve_diff(self, a: Curve, b: Curve) -> CurveImpl:
+        curve_dates = np.array(a.get_x(), dtype=float)
+        curve_rates = np.asarray(b.interpolate_array(curve_dates), dtype=float) - a.get_y()
+        return CurveImpl(curve_dates, curve_rates, InterpolationMethod.LINEAR_DF)
+
+    def extrapolate(self, curve_dates: np.ndarray, curve_rates: np.ndarray, params: CurveAdjusterParams):
+        if len(params.get_long_dates()) == 0 or params.get_long_dates()[-1] == self.curve_max_date:
+            return
+        else:
+            i = len(curve_rates) - 3
+            if i >= 0:
+                # Flat forward extrapolation
+                t1 = curve_dates[i] / 365.0
+                t2 = curve_dates[i + 1] / 365.0
+                t3 = curve_dates[i + 2] / 365.0
+
+                fwd = ((curve_rates[i + 1] * t2) - (curve_rates[i] * t1)) / (t2 - t1)
+
+                curve_rates[i + 2] = (curve_rates[i + 1] * t2 + fwd * (t3 - t2)) / t3
+            else:
+                curve_rates[-1] = curve_rates[-2]
+
+    def extrapolate_diff(self, curve_rates: np.ndarray, params: CurveAdjusterParams):
+        if len(params.get_long_dates()) == 0 or params.get_long_dates()[-1] == self.curve_max_date:
+            return
+        else:
+            # Flat extrapolation
+            curve_rates[-1] = curve_rates[-2]
+
+    @staticmethod
+    def merge_nodes(a_nodes: np.ndarray, b_nodes: np.ndarray, tolerance: float = 0.5) -> np.ndarray:
+        # Union of two sorted node arrays; a `b_nodes` date within tolerance of an `a_nodes` date is dropped
+        a_nodes = np.asarray(a_nodes, dtype=float)
+        b_nodes = np.asarray(b_nodes, dtype=float)
+        if len(a_nodes) == 0 or len(b_nodes) == 0:
+            return np.concatenate((a_nodes, b_nodes))
+
+        # Same pairing as merge_nodes_sequential. The `a_nodes` within tolerance of b_nodes[j] are
+        # lo[j]..hi[j]; when b_nodes[j] is the head of its queue the `a_nodes` head is lo[j] + e[j], the
+        # excess e[j] counting window nodes already taken, and the two pair up if e[j] < hi[j] - lo[j] + 1.
+        # The excess never exceeds the widest window, so each step is a small table over its values and
+        # the excess of every b node follows from a prefix composition of the tables by doubling.
+        n = len(a_nodes)
+        lo = np.searchsorted(a_nodes, b_nodes - tolerance)
+        hi = np.searchsorted(a_nodes, b_nodes + tolerance, side="right") - 1
+        # Align the windows with the comparisons of the sequential merge where rounding shifts the search
+        lo -= (lo > 0) & ~(b_nodes - a_nodes[np.maximum(lo - 1, 0)] > tolerance)
+        lo += (lo < n) & (b_nodes - a_nodes[np.minimum(lo, n - 1)] > tolerance)
+        hi += (hi < n - 1) & ~(a_nodes[np.minimum(hi + 1, n - 1)] - b_nodes > tolerance)
+        hi -= (hi >= 0) & (a_nodes[np.maximum(hi, 0)] - b_nodes > tolerance)
+        width = np.maximum(hi - lo + 1, 0)
+
+        excess = np.arange(width.max() + 1)
+        step = np.concatenate((lo[:-1] - lo[1:], [0]))
+        steps = np.maximum(step[:, None] + excess + (excess < width[:, None]), 0)
+        shift = 1
+        while shift < len(steps):
+            steps[shift:] = np.take_along_axis(steps[shift:], steps[:-shift], axis=1)
+            shift *= 2
+        excess = np.concatenate(([0], steps[:-1, 0]))
+
+        head = lo + excess
+        matched = excess < width
+        # An unmatched b node is emitted just before the `a_nodes` head it was compared with
+        return np.insert(a_nodes, head[~matched], b_nodes[~matched])
+
+    @staticmethod
+    def merge_nodes_sequential(a_nodes: np.ndarray, b_nodes: np.ndarray, tolerance: float = 0.5) -> np.ndarray:
+        merged = np.zeros(len(a_nodes) + len(b_nodes))
+        merged_idx = 0
+        call_idx = 0
+        cpn_idx = 0
+
+        while call_idx < len(b_nodes) or cpn_idx < len(a_nodes):
+            if call_idx == len(b_nodes) or (cpn_idx < len(a_nodes) and (b_nodes[call_idx] - a_nodes[cpn_idx]) > tolerance):
+                # `a_nodes` before `b_nodes`
+                merged[merged_idx] = a_nodes[cpn_idx]
+                cpn_idx += 1
+            elif cpn_idx == len(a_nodes) or (call_idx < len(b_nodes) and (a_nodes[cpn_idx] - b_nodes[call_idx]) > tolerance):
+                # `b_nodes` before `a_nodes`
+                merged[merged_idx] = b_nodes[call_idx]
+                call_idx += 1
+            else:
+                # Equal within tolerance
+                merged[merged_idx] = a_nodes[cpn_idx]
+                cpn_idx += 1
+                call_idx += 1
+
+            merged_idx += 1
+
+        # Resize the merged array to the actual number of elements
+        return merged[:merged_idx]
+
+    @staticmethod
+    def set_curve_stub_rate(curve: CurveImpl, stub_type: str):
+        if stub_type == BaseCurveAdjuster.StubType.FLAT:
+            curve.get_y()[0] = curve.get_y()[1]
+        else:
+            x1, x2 = curve.get_x()[:2]
+            y1, y2 = curve.get_y()[:2]
+            slope = (y2 - y1) / (x2 - x1)
+            curve.get_y()[0] = y1 - slope * (x1 - curve.get_x()[0])
+
+    @staticmethod
+    def apply_segment(curves: List[CurveImpl], segment, adj_vect: np.ndarray, offset: int):
+        # Segments of the current layout may hit a node more than once, so accumulate with add.at
+        np.add.at(curves[segment.curve_id].get_y(), segment.nodes,
+                  adj_vect[offset + segment.start:offset + segment.stop])
+
+    @staticmethod
+    def fork_curve(curve: CurveImpl) -> CurveImpl:
+        forked = CurveImpl(curve.get_x(), np.copy(curve.get_y()), curve.get_interpolation_method())
+        # Same grid, so the digest carries over
+        forked.grid_digest = curve.grid_digest
+        return forked
+
+    def get_interpolation_plan(self, curve: Curve, dates) -> InterpolationPlan:
+        # Plans are keyed by curve grid and dates, so curves sharing the anchor nodes share one plan
+        return self.grid_index.get_plan(curve, dates)
+
+    def interpolate_dates(self, curve: Curve, dates) -> np.ndarray:
+        return self.grid_index.interpolate(curve, dates)
@@ -0,0 +1,176 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from yield_curve.engine.curve_adjustment.broyden_solver import LUDecomposition, RealMatrix
+from yield_curve.engine.curve_adjustment.vector_function import BatchVectorFunction
+from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
+
+
+class BatchBroydenSolver:
+    """
+    Solves k independent systems of the same dimension n in lock step, e.g. the recalibrations of
+    one curve under many scenarios. The states are a (k x n) stack and every system keeps its own
+    Jacobian and inverse in (k x n x n) stacks, all started from one shared base Jacobian. Each
+    iteration evaluates the active systems with a single call of the objective and systems are
+    retired as soon as they converge.
+    """
+
+    def __init__(self, objective: BatchVectorFunction, jacobian: RealMatrix, tolerance: float, bump: float,
+                 max_iterations: int, refactor_interval: int = 20):
+        """
+        Initializes the batch solver.
+        When no base Jacobian is given it is built by finite differences at the first guess.
+        The inverses are updated with Sherman-Morrison and refactorized every refactor_interval steps.
+        """
+        self.objective = objective
+        self.jacobian = jacobian
+        self.tolerance = tolerance
+        self.bump = bump
+        self.max_iter = max_iterations
+        self.refactor_interval = refactor_interval
+        self.solutions = None
+        self.converged = None
+        self.iterations = None
+        self.num_objective_calls = 0
+        self.num_system_evaluations = 0
+        self.num_factorizations = 0
+
+    def build_jacobian(self, x: np.ndarray):
+        """
+        Builds the base Jacobian at x by forward differences, all bumped vectors in one call.
+        """
+        x = np.asarray(x, dtype=float)
+        n = len(x)
+        args = np.vstack([x, x + self.bump * np.eye(n)])
+        values = self.evaluate(args, np.zeros(n + 1, dtype=int))
+        self.jacobian = RealMatrix(((values[1:] - values[0]) / self.bump).T)
+
+    def evaluate(self, x: np.ndarray, systems: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the objective for the given systems and counts the call.
+        """
+        self.num_objective_calls += 1
+        self.num_system_evaluations += len(systems)
+        return np.asarray(self.objective.values(x, systems), dtype=float)
+
+    @staticmethod
+    def invert(jacobian: np.ndarray):
+        """
+        Inverts the Jacobian of one system by LU decomposition.
+        :return: The inverse, or None if the Jacobian is not finite or numerically singular.
+        """
+        if not np.all(np.isfinite(jacobian)):
+            return None
+        decomposition = LUDecomposition(RealMatrix(jacobian))
+        if decomposition.is_singular():
+            return None
+        return decomposition.get_inverse()
+
+    def solve(self, guesses: np.ndarray) -> np.ndarray:
+        """
+        Solves all systems.
+        :param guesses: (k x n) initial guesses, row i for system i.
+        :return: (k x n) solutions.
+        :raises ConvergenceException: If some systems did not converge; the states reached are
+            still available in solutions and converged marks the systems that did.
+        """
+        x = np.array(guesses, dtype=float, ndmin=2)
+        k, n = x.shape
+        if self.jacobian is None:
+            self.build_jacobian(x[0])
+
+        # Every system starts from the shared base Jacobian, factorized once
+        self.num_factorizations += 1
+        base_inverse = LUDecomposition(self.jacobian).get_inverse()
+        jacobians = np.broadcast_to(self.jacobian.data, (k, n, n)).copy()
+        inverses = np.broadcast_to(base_inverse, (k, n, n)).copy()
+
+        systems = np.arange(k)
+        err_vects = self.evaluate(x, systems)
+        self.converged = np.max(np.abs(err_vects), axis=1) <= self.tolerance
+        failed = np.zeros(k, dtype=bool)
+        self.iterations = np.zeros(k, dtype=int)
+        steps_since_factorization = 0
+
+        active = np.flatnonzero(~self.converged)
+        while len(active) > 0:
+            inverse = inverses[active]
+            jacobian = jacobians[active]
+            err_vect = err_vects[active]
+
+            delta_x = -np.einsum("kij,kj->ki", inverse, err_vect)
+            x[active] += delta_x
+            next_err_vect = self.evaluate(x[active], active)
+            delta_f = next_err_vect - err_vect
+
+            # Broyden rank-one updates of the Jacobians
+            diff = delta_f - np.einsum("kij,kj->ki", jacobian, delta_x)
+            factor = 1.0 / np.einsum("ki,ki->k", delta_x, delta_x)
+            jacobian += np.einsum("ki,kj->kij", diff * factor[:, None], delta_x)
+            jacobians[active] = jacobian
+
+            # Sherman-Morrison updates of the inverses, degenerate ones are refactorized one system at a
+            # time and a system whose Jacobian is singular fails without stopping the others
+            inverse_delta_f = np.einsum("kij,kj->ki", inverse, delta_f)
+            delta_x_inverse = np.einsum("ki,kij->kj", delta_x, inverse)
+            denominator = np.einsum("ki,ki->k", delta_x_inverse, delta_f)
+            steps_since_factorization += 1
+            if steps_since_factorization >= self.refactor_interval:
+                refactor = np.ones(len(active), dtype=bool)
+                steps_since_factorization = 0
+            else:
+                refactor = ~(np.abs(denominator) > 1e-12 * np.linalg.norm(delta_x_inverse, axis=1)
+                             * np.linalg.norm(delta_f, axis=1))
+            update = ~refactor
+            inverse[update] += np.einsum("ki,kj->kij", (delta_x[update] - inverse_delta_f[update])
+                                         / denominator[update, None], delta_x_inverse[update])
+            singular = np.zeros(len(active), dtype=bool)
+            for row in np.flatnonzero(refactor):
+                self.num_factorizations += 1
+                system_inverse = self.invert(jacobian[row])
+                if system_inverse is None:
+                    singular[row] = True
+                else:
+                    inverse[row] = system_inverse
+            inverses[active] = inverse
+
+            err_vects[active] = next_err_vect
+            self.iterations[active] += 1
+
+            # Retire converged systems and the ones that can no longer converge
+            finite = np.all(np.isfinite(next_err_vect), axis=1)
+            self.converged[active] = finite & (np.max(np.abs(next_err_vect), axis=1) <= self.tolerance)
+            failed[active] = ~finite | singular | (self.iterations[active] > self.max_iter)
+            active = active[~(self.converged[active] | failed[active])]
+
+        self.solutions = x
+        if np.any(failed):
+            raise ConvergenceException(
+                f"{np.count_nonzero(failed)} of {k} systems did not converge: {np.flatnonzero(failed)[:10]}")
+        return x
+
+    def get_statistics(self) -> dict:
+        """
+        Statistics of the last solve; objective_calls counts batched calls and system_evaluations
+        the rows evaluated by them.
+        """
+        iterations = self.iterations if self.iterations is not None else np.zeros(0, dtype=int)
+        return {"systems": len(iterations),
+                "converged": int(np.count_nonzero(self.converged)) if self.converged is not None else 0,
+                "max_iterations": int(iterations.max(initial=0)),
+                "mean_iterations": float(iterations.mean()) if len(iterations) else 0.0,
+                "objective_calls": self.num_objective_calls,
+                "system_evaluations": self.num_system_evaluations,
+                "factorizations": self.num_factorizations}
@@ -0,0 +1,201 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional
+
+import numpy as np
+
+from yield_curve.engine.curve_adjustment.broyden_solver import BroydenSolver
+from yield_curve.engine.curve_adjustment.calibration_objective import CalibrationObjective
+from yield_curve.engine.curve_adjustment.curve_adjuster import CurveAdjuster
+from yield_curve.engine.curve_adjustment.jacobian_sparsity import basis_sparsity, interpolation_reach
+from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
+from yield_curve.engine.pricing_functions.abs_pricing_function import PricingFunction
+
+
+class CalibrationMode:
+    BOOTSTRAP = "BOOTSTRAP"
+    BROYDEN = "BROYDEN"
+
+
+class BootstrapCalibrator:
+    """
+    Calibrates a CurveAdjuster to one pricing function per element of the adjustment vector.
+    When instrument k only depends on the nodes up to its curve_date(), the instruments are solved
+    one node at a time in maturity order, each with a 1-D safeguarded Newton iteration on
+    CurveAdjuster.apply_delta. Otherwise the system is solved globally with BroydenSolver.
+    """
+
+    def __init__(self, adjuster: CurveAdjuster, pricing_functions: List[PricingFunction], tolerance: float,
+                 bump: float, max_iterations: int):
+        """
+        :param adjuster: Adjuster to calibrate; it is left in the calibrated state.
+        :param pricing_functions: Pricing functions, as many as adjustment vector elements.
+        :param tolerance: Absolute tolerance on each pricing error.
+        :param bump: Bump of the finite-difference derivatives.
+        :param max_iterations: Iteration limit per node, or of the global solve.
+        """
+        self.adjuster = adjuster
+        self.pricing_functions = pricing_functions
+        self.tolerance = tolerance
+        self.bump = bump
+        self.max_iter = max_iterations
+        self.instrument_order = None
+        self.node_order = None
+        self.mode = CalibrationMode.BOOTSTRAP if self.find_bootstrap_order() else CalibrationMode.BROYDEN
+        self.solver = None
+        self.num_evaluations = 0
+        self.node_iterations = []
+
+    def get_sparsity(self) -> np.ndarray:
+        """
+        Structural dependency of each instrument on each adjustment vector element. Any instrument
+        may be valued on the basis curve, so the anchor and diff dependencies of the basis curve are
+        included for all of them.
+        """
+        anchor_params = self.adjuster.get_anchor_params()
+        basis_params = self.adjuster.get_basis_params()
+        dates = self.adjuster.get_adjustment_dates()
+        num_anchor = anchor_params.get_num_total_points()
+
+        maturities = [pricing_function.curve_date() for pricing_function in self.pricing_functions]
+        return basis_sparsity(maturities, dates[:num_anchor], dates[num_anchor:],
+                              interpolation_reach(anchor_params.get_interpolation_method()),
+                              interpolation_reach(basis_params.get_interpolation_method()))
+
+    def find_bootstrap_order(self) -> bool:
+        """
+        Pair instruments and nodes in maturity and date order, and check that the dependency
+        structure is lower triangular in that order so that the nodes can be solved one at a time.
+        """
+        sparsity = self.get_sparsity()
+        if sparsity.shape[0] != sparsity.shape[1]:
+            return False
+
+        maturities = [pricing_function.curve_date() for pricing_function in self.pricing_functions]
+        instrument_order = np.argsort(maturities, kind="stable")
+        node_order = np.argsort(self.adjuster.get_adjustment_dates(), kind="stable")
+        ordered = sparsity[instrument_order][:, node_order]
+        if np.any(np.triu(ordered, 1)) or not np.all(np.diag(ordered)):
+            return False
+
+        self.instrument_order = instrument_order
+        self.node_order = node_order
+        return True
+
+    def calibrate(self, guess: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calibrate the adjuster. After a bootstrap all pricing errors are checked again, and if a later
+        node moved an earlier instrument off its target, e.g. because its dependence reaches past its
+        curve_date(), the system is finished globally with BroydenSolver from the bootstrapped vector,
+        using a dense Jacobian.
+        :param guess: Initial adjustment vector; zeros by default.
+        :return: The calibrated adjustment vector.
+        :raises ConvergenceException: If a node or the global solve does not converge.
+        """
+        size = len(self.adjuster.get_adjustment_targets())
+        x = np.zeros(size) if guess is None else np.array(guess, dtype=float)
+        self.solver = None
+
+        if self.mode == CalibrationMode.BOOTSTRAP:
+            self.adjuster.adjust_curves(x)
+            self.node_iterations = []
+            for instrument, node in zip(self.instrument_order, self.node_order):
+                x[node] += self.solve_node(self.pricing_functions[instrument], node)
+
+            errors = [self.value(pricing_function) for pricing_function in self.pricing_functions]
+            if np.max(np.abs(errors)) <= self.tolerance:
+                return x
+
+        # A failed bootstrap check means the pattern missed a dependence, so its Jacobian is dense
+        sparsity = self.get_sparsity() if self.mode == CalibrationMode.BROYDEN else None
+        self.solver = BroydenSolver(CalibrationObjective(self.adjuster, self.pricing_functions), None,
+                                    self.tolerance, self.bump, self.max_iter, sparsity=sparsity)
+        x = self.solver.solve(x)
+        self.adjuster.adjust_curves(x)
+        return x
+
+    def solve_node(self, pricing_function: PricingFunction, node: int) -> float:
+        """
+        Zero one pricing error by moving one adjustment vector element. Newton steps use a bumped
+        derivative, then secant updates; once the root is bracketed a step leaving the bracket is
+        replaced by bisection.
+        :return: Total move of the element; the adjuster is left at the root.
+        """
+        error = self.value(pricing_function)
+        if abs(error) <= self.tolerance:
+            self.node_iterations.append(0)
+            return 0.0
+
+        # The bumped point is the first iterate
+        self.adjuster.apply_delta(node, self.bump)
+        position, next_error = self.bump, self.value(pricing_function)
+        derivative = (next_error - error) / self.bump
+        bracket = ((0.0, error), (position, next_error)) if np.sign(next_error) != np.sign(error) else None
+        error = next_error
+
+        for iteration in range(1, self.max_iter + 1):
+            if abs(error) <= self.tolerance:
+                self.node_iterations.append(iteration)
+                return position
+
+            target = position - error / derivative if derivative != 0.0 else np.nan
+            if bracket is not None:
+                (a, _), (b, _) = bracket
+                if not min(a, b) < target < max(a, b):
+                    target = 0.5 * (a + b)
+            elif not np.isfinite(target):
+                break
+
+            self.adjuster.apply_delta(node, target - position)
+            next_error = self.value(pricing_function)
+            if not np.isfinite(next_error):
+                break
+
+            # Keep two points with pricing errors of opposite sign around the root
+            if np.sign(next_error) != np.sign(error):
+                bracket = ((position, error), (target, next_error))
+            elif bracket is not None:
+                if np.sign(next_error) == np.sign(bracket[0][1]):
+                    bracket = ((target, next_error), bracket[1])
+                else:
+                    bracket = (bracket[0], (target, next_error))
+
+            derivative = (next_error - error) / (target - position)
+            position, error = target, next_error
+
+        raise ConvergenceException(f"Bootstrap failed to converge on adjustment vector index {node}")
+
+    def value(self, pricing_function: PricingFunction) -> float:
+        self.num_evaluations += 1
+        return pricing_function.value(self.adjuster)
+
+    def get_statistics(self) -> dict:
+        """
+        Calibration mode and counters of the last calibration, with the solver and adjuster statistics.
+        After a Broyden fallback from a bootstrap the solver counters are prefixed with broyden_.
+        """
+        if self.mode == CalibrationMode.BROYDEN:
+            statistics = {"mode": self.mode}
+            if self.solver is not None:
+                statistics.update(self.solver.get_statistics())
+            return statistics
+
+        statistics = {"mode": self.mode, "pricing_evaluations": self.num_evaluations,
+                      "iterations": int(sum(self.node_iterations)),
+                      "max_node_iterations": max(self.node_iterations, default=0),
+                      "broyden_fallback": self.solver is not None}
+        if self.solver is not None:
+            statistics.update({f"broyden_{name}": value for name, value in self.solver.get_statistics().items()})
+        statistics.update(self.adjuster.get_statistics())
+        return statistics
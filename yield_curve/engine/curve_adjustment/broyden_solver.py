@@ -11,9 +11,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
+
 import numpy as np
 from numpy.linalg import LinAlgError
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
 
+from yield_curve.engine.curve_adjustment.jacobian_sparsity import group_columns
+from yield_curve.engine.curve_adjustment.parallel_evaluator import ParallelEvaluator
 from yield_curve.engine.curve_adjustment.vector_function import VectorFunction
 from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
 
@@ -33,21 +38,35 @@ class RealMatrix:
         self.data[:, index] = column
 
 
-# LU Decomposition using NumPy
+# LU Decomposition using SciPy
 class LUDecomposition:
     def __init__(self, matrix: RealMatrix):
-        self.lu = np.linalg.inv(matrix.data)  # Compute inverse for solver
+        # Singular matrices are reported by is_singular() rather than by a warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LinAlgWarning)
+            self.lu = lu_factor(matrix.data)
+        self.scale = np.max(np.abs(matrix.data), initial=0.0)
+
+    def is_singular(self) -> bool:
+        """
+        True when a pivot is zero or below n * eps relative to the largest matrix element.
+        """
+        pivots = np.abs(np.diag(self.lu[0]))
+        return not pivots.min(initial=np.inf) > np.finfo(float).eps * len(pivots) * self.scale
 
     def get_solver(self) -> 'LUSolver':
         return LUSolver(self.lu)
 
+    def get_inverse(self) -> np.ndarray:
+        return lu_solve(self.lu, np.eye(len(self.lu[0])))
+
 
 class LUSolver:
-    def __init__(self, inverse_matrix: np.ndarray):
-        self.inverse_matrix = inverse_matrix
+    def __init__(self, lu):
+        self.lu = lu
 
     def solve(self, vector: np.ndarray) -> np.ndarray:
-        return self.inverse_matrix @ vector
+        return lu_solve(self.lu, vector)
 
 
 # QR Decomposition using NumPy
@@ -59,10 +78,28 @@ class QRDecomposition:
         return RealMatrix(self.q)
 
 
+class Globalization:
+    FULL_STEP = "FULL_STEP"
+    LINE_SEARCH = "LINE_SEARCH"
+    DOGLEG = "DOGLEG"
+
+
 class BroydenSolver:
-    def __init__(self, objective: VectorFunction, jacobian: RealMatrix, tolerance: float, bump: float, max_iterations: int):
+    def __init__(self, objective: VectorFunction, jacobian: RealMatrix, tolerance: float, bump: float, max_iterations: int,
+                 sparsity: np.ndarray = None, refactor_interval: int = 20, evaluator: ParallelEvaluator = None,
+                 polish_probes: int = 0, seed: int = 0, globalization: str = Globalization.FULL_STEP,
+                 armijo: float = 1e-4, backtrack_factor: float = 0.5, max_backtracks: int = 10):
         """
         Initializes the Broyden solver.
+        An optional boolean sparsity pattern of the Jacobian (see jacobian_sparsity) lets build_jacobian
+        bump structurally orthogonal columns together. The inverse Jacobian is updated with
+        Sherman-Morrison and refactorized from the Jacobian every refactor_interval steps. The bumped
+        evaluations of build_jacobian run on the optional evaluator (serial by default). Polishing
+        uses polish_probes orthogonal directions drawn once from the given seed, in addition to the
+        step of the previous solve.
+        With LINE_SEARCH globalization a step is backtracked by backtrack_factor until ||F|| decreases
+        by the Armijo fraction armijo of the step size; DOGLEG falls back to a dogleg trust-region
+        step when max_backtracks backtracks were not enough. FULL_STEP always takes the Broyden step.
         """
         self.objective = objective
         self.jacobian = jacobian
@@ -70,6 +107,26 @@ class BroydenSolver:
         self.bump = bump
         self.max_iter = max_iterations
         self.num_iter = 0
+        self.sparsity = None if sparsity is None else np.asarray(sparsity, dtype=bool)
+        self.column_groups = None if sparsity is None else group_columns(self.sparsity)
+        self.num_jacobian_evaluations = 0
+        self.refactor_interval = refactor_interval
+        self.num_factorizations = 0
+        self.evaluator = evaluator if evaluator is not None else ParallelEvaluator()
+        self.polish_probes = polish_probes
+        self.seed = seed
+        self.probe_directions = None
+        self.last_step = None
+        self.num_polish_evaluations = 0
+        self.globalization = globalization
+        self.armijo = armijo
+        self.backtrack_factor = backtrack_factor
+        self.max_backtracks = max_backtracks
+        self.trust_radius = None
+        self.num_function_evaluations = 0
+        self.num_backtracks = 0
+        self.num_trust_region_steps = 0
+        self.step_sizes = []
 
     def build_jacobian(self, x: np.ndarray):
         """
@@ -78,39 +135,63 @@ class BroydenSolver:
         dim = self.objective.dimension()
         self.jacobian = RealMatrix(np.zeros((dim, dim)))
 
-        base = self.objective.value(x)
-        for i in range(dim):
-            arg_vect = x.copy()
-            arg_vect[i] += self.bump
+        base = np.asarray(self.objective.value(x))
+        groups = self.column_groups if self.column_groups is not None else [np.array([i]) for i in range(dim)]
+        args = []
+        for group in groups:
+            arg_vect = np.array(x, dtype=float)
+            arg_vect[group] += self.bump
+            args.append(arg_vect)
 
-            result = self.objective.value(arg_vect)
-            result = (result - base) / self.bump
+        results = self.evaluator.evaluate(self.objective, args)
+        self.num_jacobian_evaluations += 1 + len(args)
 
-            self.jacobian.set_column(i, result)
+        for group, result in zip(groups, results):
+            result = (result - base) / self.bump
+            if self.sparsity is None:
+                self.jacobian.set_column(group[0], result)
+            else:
+                # Columns of a group share no row, so each row of the bumped result belongs to one column
+                self.jacobian.data[:, group] = np.where(self.sparsity[:, group], result[:, None], 0.0)
 
     def polish_jacobian(self, guess: np.ndarray):
         """
-        Polishes the Jacobian matrix using random perturbations.
+        Polishes a warm-start Jacobian with deterministic secant updates: one along the total step of
+        the previous solve (the all-ones direction before any solve), then one along each probe direction.
         """
-        dim = self.objective.dimension()
-        random_matrix = RealMatrix(np.random.rand(dim, dim))
+        guess = np.array(guess, dtype=float)
+        directions = [self.last_step if self.last_step is not None else np.ones(len(guess))]
+        if self.polish_probes > 0:
+            directions.extend(self.get_probe_directions(len(guess)).T)
+
+        f = np.asarray(self.objective.value(guess))
+        self.num_polish_evaluations += 1
+        for direction in directions:
+            direction_norm = np.linalg.norm(direction)
+            if direction_norm == 0.0:
+                continue
+
+            delta_x = direction * (self.bump / direction_norm)
+            delta_f = np.asarray(self.objective.value(guess + delta_x)) - f
+            self.num_polish_evaluations += 1
 
-        qr = QRDecomposition(random_matrix)
-        q = qr.get_q()
-        random_matrix = q
-
-        f = np.array(self.objective.value(guess))
-        f2 = np.array(self.objective.value(guess + self.bump))
-        delta_f = f2 - f
+            diff = delta_f - self.jacobian.operate(delta_x)
+            if np.linalg.norm(diff) < self.bump * 5.0:
+                continue
 
-        diff = delta_f - self.jacobian.operate(self.bump)
-        if np.linalg.norm(diff) < self.bump * 5.0:
-            return
+            factor = 1.0 / (delta_x @ delta_x)
+            self.jacobian = self.jacobian.add(RealMatrix(np.outer(diff * factor, delta_x)))
 
-        delta_x_norm = np.linalg.norm(self.bump)
-        factor = 1.0 / (delta_x_norm ** 2)
-        update = diff[:, None] @ self.bump[None, :] * factor
-        self.jacobian = self.jacobian.add(RealMatrix(update))
+    def get_probe_directions(self, dim: int) -> np.ndarray:
+        """
+        Orthonormal probe directions as the columns of a (dim x polish_probes) matrix, drawn from the
+        seed on first use and reused for every later polish.
+        """
+        if self.probe_directions is None or self.probe_directions.shape[0] != dim:
+            rng = np.random.default_rng(self.seed)
+            q, _ = np.linalg.qr(rng.standard_normal((dim, min(self.polish_probes, dim))))
+            self.probe_directions = q
+        return self.probe_directions
 
     def solve(self, guess: np.ndarray) -> np.ndarray:
         """
@@ -127,25 +208,38 @@ class BroydenSolver:
         elif polish:
             self.polish_jacobian(guess)
 
-        x = np.array(guess)
-        err_vect = self.objective.value(x)
+        # Work on a copy so that a Jacobian passed in by the caller is left untouched
+        self.jacobian = RealMatrix(np.array(self.jacobian.data, dtype=float))
+        inverse = self.factorize()
+        steps_since_factorization = 0
+
+        x = np.array(guess, dtype=float)
+        err_vect = self.evaluate(x)
         num_iterations = 0
+        self.trust_radius = None
+        self.step_sizes = []
 
         while np.linalg.norm(err_vect, ord=np.inf) > self.tolerance:
-            lu = LUDecomposition(self.jacobian)
-            solver = lu.get_solver()
-
-            delta_x = solver.solve(-err_vect)
-            x += delta_x
-
-            next_err_vect = self.objective.value(x)
+            x, next_err_vect, delta_x = self.take_step(x, err_vect, -(inverse @ err_vect))
             delta_f = next_err_vect - err_vect
             diff = delta_f - self.jacobian.operate(delta_x)
 
+            # Broyden rank-one update of the Jacobian
             delta_x_norm = np.linalg.norm(delta_x)
             factor = 1.0 / (delta_x_norm ** 2)
-            update = diff[:, None] @ delta_x[None, :] * factor
-            self.jacobian = self.jacobian.add(RealMatrix(update))
+            self.jacobian.data += np.outer(diff * factor, delta_x)
+
+            # Sherman-Morrison update of its inverse, O(n^2) instead of a new factorization
+            inverse_delta_f = inverse @ delta_f
+            delta_x_inverse = delta_x @ inverse
+            denominator = delta_x_inverse @ delta_f
+            steps_since_factorization += 1
+            if steps_since_factorization >= self.refactor_interval or \
+                    abs(denominator) <= 1e-12 * np.linalg.norm(delta_x_inverse) * np.linalg.norm(delta_f):
+                inverse = self.factorize()
+                steps_since_factorization = 0
+            else:
+                inverse += np.outer((delta_x - inverse_delta_f) / denominator, delta_x_inverse)
 
             err_vect = next_err_vect
             num_iterations += 1
@@ -155,4 +249,129 @@ class BroydenSolver:
                 raise ConvergenceException("Maximum number of iterations exceeded")
 
         self.num_iter = num_iterations
+        step = x - np.asarray(guess, dtype=float)
+        if np.any(step != 0.0):
+            self.last_step = step
         return x
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the objective inside the solve loop and counts the evaluation.
+        """
+        self.num_function_evaluations += 1
+        return np.asarray(self.objective.value(x))
+
+    def take_step(self, x: np.ndarray, err_vect: np.ndarray, newton_step: np.ndarray):
+        """
+        Steps from x along the Broyden step with the configured globalization.
+        :return: Tuple (new x, objective at new x, step taken).
+        """
+        if self.globalization == Globalization.FULL_STEP:
+            self.step_sizes.append(1.0)
+            return x + newton_step, self.evaluate(x + newton_step), newton_step
+
+        # Armijo backtracking on ||F||, a Broyden step is not guaranteed to be a descent direction
+        err_norm = np.linalg.norm(err_vect)
+        step_size = 1.0
+        for _ in range(self.max_backtracks + 1):
+            step = step_size * newton_step
+            next_err_vect = self.evaluate(x + step)
+            if np.linalg.norm(next_err_vect) <= (1.0 - self.armijo * step_size) * err_norm:
+                self.step_sizes.append(step_size)
+                return x + step, next_err_vect, step
+            self.num_backtracks += 1
+            step_size *= self.backtrack_factor
+
+        if self.globalization == Globalization.DOGLEG:
+            return self.take_dogleg_step(x, err_vect, newton_step)
+
+        # Take the shortest step anyway so that the Broyden update still learns from it
+        if not np.all(np.isfinite(next_err_vect)):
+            raise ConvergenceException("Objective is not finite along the Broyden step")
+        self.step_sizes.append(step_size / self.backtrack_factor)
+        return x + step, next_err_vect, step
+
+    def take_dogleg_step(self, x: np.ndarray, err_vect: np.ndarray, newton_step: np.ndarray):
+        """
+        Dogleg trust-region step on the linear model F + J s. The radius persists between iterations
+        of a solve and shrinks or grows with the ratio of actual to predicted reduction of ||F||^2.
+        :return: Tuple (new x, objective at new x, step taken).
+        """
+        jacobian = self.jacobian.data
+        gradient = jacobian.T @ err_vect
+        jacobian_gradient = jacobian @ gradient
+        curvature = jacobian_gradient @ jacobian_gradient
+        cauchy_step = -(gradient @ gradient) / curvature * gradient if curvature > 0.0 else newton_step
+
+        newton_norm = np.linalg.norm(newton_step)
+        if self.trust_radius is None:
+            self.trust_radius = self.backtrack_factor * newton_norm
+
+        err_norm_sq = err_vect @ err_vect
+        for _ in range(self.max_backtracks + 1):
+            step = self.dogleg(cauchy_step, newton_step, self.trust_radius)
+            step_norm = np.linalg.norm(step)
+            next_err_vect = self.evaluate(x + step)
+
+            model_vect = err_vect + jacobian @ step
+            predicted = err_norm_sq - model_vect @ model_vect
+            actual = err_norm_sq - next_err_vect @ next_err_vect
+            ratio = actual / predicted if predicted > 0.0 and np.isfinite(actual) else -1.0
+
+            if ratio < 0.25:
+                self.trust_radius = 0.25 * step_norm
+            elif ratio > 0.75 and step_norm >= 0.99 * self.trust_radius:
+                self.trust_radius = 2.0 * step_norm
+
+            if ratio > self.armijo:
+                break
+        else:
+            # Every trial step failed to reduce ||F|| enough; taking one would undo the globalization
+            raise ConvergenceException("No acceptable step within the trust region")
+
+        self.num_trust_region_steps += 1
+        self.step_sizes.append(step_norm / newton_norm)
+        return x + step, next_err_vect, step
+
+    @staticmethod
+    def dogleg(cauchy_step: np.ndarray, newton_step: np.ndarray, radius: float) -> np.ndarray:
+        """
+        Point where the dogleg path from the Cauchy step to the Newton step leaves the trust region.
+        """
+        if np.linalg.norm(newton_step) <= radius:
+            return newton_step
+        cauchy_norm = np.linalg.norm(cauchy_step)
+        if cauchy_norm >= radius:
+            return cauchy_step * (radius / cauchy_norm)
+
+        direction = newton_step - cauchy_step
+        a = direction @ direction
+        b = 2.0 * (cauchy_step @ direction)
+        c = cauchy_step @ cauchy_step - radius * radius
+        tau = (-b + np.sqrt(b * b - 4.0 * a * c)) / (2.0 * a)
+        return cauchy_step + tau * direction
+
+    def factorize(self) -> np.ndarray:
+        """
+        Factorize the current Jacobian and return its inverse.
+        :raises LinAlgError: If the Jacobian is numerically singular.
+        """
+        self.num_factorizations += 1
+        decomposition = LUDecomposition(self.jacobian)
+        if decomposition.is_singular():
+            raise LinAlgError("Singular Jacobian")
+        return decomposition.get_inverse()
+
+    def get_statistics(self) -> dict:
+        """
+        Solver statistics together with the counters of the objective. Iterations and step sizes, the
+        fraction of the Broyden step taken, are those of the last solve.
+        """
+        statistics = {"iterations": self.num_iter, "jacobian_evaluations": self.num_jacobian_evaluations,
+                      "factorizations": self.num_factorizations, "polish_evaluations": self.num_polish_evaluations,
+                      "function_evaluations": self.num_function_evaluations, "backtracks": self.num_backtracks,
+                      "trust_region_steps": self.num_trust_region_steps,
+                      "min_step_size": float(min(self.step_sizes, default=0.0)),
+                      "mean_step_size": float(np.mean(self.step_sizes)) if self.step_sizes else 0.0}
+        statistics.update(self.objective.get_statistics())
+        return statistics
@@ -0,0 +1,51 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from typing import List
+
+import numpy as np
+
+from yield_curve.engine.curve_adjustment.curve_adjuster import CurveAdjuster
+from yield_curve.engine.curve_adjustment.vector_function import VectorFunction
+from yield_curve.engine.pricing_functions.abs_pricing_function import PricingFunction
+
+
+class CalibrationObjective(VectorFunction):
+    """
+    Pricing errors of the calibration instruments as a function of the adjustment vector of a CurveAdjuster.
+    """
+
+    def __init__(self, adjuster: CurveAdjuster, pricing_functions: List[PricingFunction]):
+        """
+        :param adjuster: Adjuster whose curves are moved by the adjustment vector.
+        :param pricing_functions: One pricing function per element of the adjustment vector.
+        """
+        self.adjuster = adjuster
+        self.pricing_functions = pricing_functions
+
+    def dimension(self) -> int:
+        return len(self.pricing_functions)
+
+    def value(self, x) -> np.ndarray:
+        self.adjuster.adjust_curves(x)
+        return np.array([pricing_function.value(self.adjuster) for pricing_function in self.pricing_functions])
+
+    def get_statistics(self) -> dict:
+        return self.adjuster.get_statistics()
+
+    def fork(self) -> 'CalibrationObjective':
+        # Pricing functions are read-only and shared, the adjuster is forked
+        forked = copy.copy(self)
+        forked.adjuster = self.adjuster.fork()
+        return forked
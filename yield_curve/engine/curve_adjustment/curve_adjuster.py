@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from typing import List, Optional
 from abc import ABC, abstractmethod
 
@@ -19,22 +20,19 @@ import numpy as np
 from yield_curve.common.curve.Curve import Curve
 from yield_curve.common.curve.CurveImp import CurveImpl
 from yield_curve.common.curve.Exception.EngineException import EngineException
-from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.engine.curve_adjustment.base_curve_adjuster import BaseCurveAdjuster
 from yield_curve.engine.curve_adjustment.curve_adjuster_parameters import CurveAdjusterParams
 from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
 
 
-class CurveAdjuster:
+class CurveAdjuster(BaseCurveAdjuster):
     """Python translation of the CurveAdjuster class."""
 
-    class StubType:
-        FLAT = "FLAT"
-        LINEAR = "LINEAR"
-
     def __init__(self, valuation_date: float, curve_max_date: float,
                  initial_anchor_curve: Curve, initial_basis_curve: Curve,
                  input_discount_curve: Optional[Curve], anchor_is_discount: bool,
                  anchor_params: CurveAdjusterParams, basis_params: CurveAdjusterParams):
+        super().__init__(valuation_date, curve_max_date)
         self.basis_mid_long_basis_y = None
         self.basis_short_mid_basis_y = None
         self.diff_curve_y = None
@@ -42,21 +40,41 @@ class CurveAdjuster:
         self.anchor_short_mid_basis_y = None
         self.anchor_curve_y = None
         self.basis_curve = None
-        self.valuation_date = valuation_date
-        self.curve_max_date = curve_max_date
+        self.high_res_basis_curve = None
         self.input_discount_curve = input_discount_curve
         self.anchor_is_discount = anchor_is_discount
         self.anchor_params = anchor_params
         self.basis_params = basis_params
         self.stub_type = CurveAdjuster.StubType.FLAT
+        # Known fixing of the current anchor float period, used in place of the projected rate
+        self.anchor_fixing = None
+
+        # Derived curves are rebuilt on first use after the curves they depend on have changed
+        self.basis_curve_dirty = True
+        self.high_res_basis_curve_dirty = True
+        self.anchor_overlap_dirty = False
+        self.basis_overlap_dirty = False
+        self.recompute_counts = {
+            "basis_curve": 0,
+            "high_res_basis_curve": 0,
+            "anchor_overlap_curves": 0,
+            "basis_overlap_curves": 0,
+        }
+
+        # Checkpoints: each pushed state is a position in the undo log of (curve, node indices, old values)
+        self.state_stack = []
+        self.undo_log = []
+        self.adjustment_targets = None
 
         # Build curves for the anchor and basis
-        anchor_curves = self.build_curves(initial_anchor_curve, anchor_params)
+        anchor_curves = self.build_curves(initial_anchor_curve, anchor_params, False)
         self.anchor_curve = anchor_curves[0]
         self.anchor_short_mid_basis = anchor_curves[1]
         self.anchor_mid_long_basis = anchor_curves[2]
 
-        basis_curves = self.build_curves(self.curve_diff(initial_basis_curve, initial_anchor_curve), basis_params)
+        # The diff is basis - anchor on the anchor nodes, so that anchor + diff reproduces the basis curve
+        basis_curves = self.build_curves(self.curve_diff(initial_anchor_curve, initial_basis_curve), basis_params,
+                                         True)
         self.diff_curve = basis_curves[0]
         self.basis_short_mid_basis = basis_curves[1]
         self.basis_mid_long_basis = basis_curves[2]
@@ -70,9 +88,6 @@ class CurveAdjuster:
         self.basis_short_mid_basis_y = np.copy(self.basis_short_mid_basis.get_y())
         self.basis_mid_long_basis_y = np.copy(self.basis_mid_long_basis.get_y())
 
-        # Update basis curve
-        self.update_basis_curve()
-
     def update_anchor_curve(self, initial_anchor_curve: Curve):
         # Check if there are calibration instruments against the anchor curve
         if self.anchor_params.get_num_total_points() != 0:
@@ -89,6 +104,8 @@ class CurveAdjuster:
         # Copy the new values from the initialAnchorCurve to anchorCurve
         np.copyto(self.anchor_curve.get_y(), initial_anchor_curve.get_y())
         self.anchor_curve.update()
+        self.basis_curve_dirty = True
+        self.high_res_basis_curve_dirty = True
 
     def restore_curves(self):
         # Restore anchor curve and its basis curves
@@ -101,87 +118,6 @@ class CurveAdjuster:
         np.copyto(self.basis_short_mid_basis.get_y(), self.basis_short_mid_basis_y)
         np.copyto(self.basis_mid_long_basis.get_y(), self.basis_mid_long_basis_y)
 
-    def build_curves(self, initial_curve: Curve, params: CurveAdjusterParams) -> List[CurveImpl]:
-        curve_dates = params.get_curve_dates(self.valuation_date, self.curve_max_date)
-        # ToDo
-        curve_dates = [date for date in curve_dates if date != 0]
-        curve_rates = np.zeros(len(curve_dates))  # Initialize with zeros
-
-        result = [CurveImpl] * 3  # Predefine a list for 3 CurveImpl instances
-
-        # Special case: no curve points
-        if len(curve_dates) == 2:
-            # Copy the input curve
-            result[0] = CurveImpl(
-                np.array(initial_curve.get_x()),
-                np.array(initial_curve.get_y()),
-                params.get_interpolation_method()
-            )
-            if params == self.basis_params:
-                # For a basis curve, mark it as flat
-                result[0] = CurveImpl(
-                    np.array([self.valuation_date, self.curve_max_date]),
-                    np.array([0.0, 0.0]),
-                    InterpolationMethod.LINEAR_ZERO
-                )
-                result[1] = CurveImpl(
-                    np.array([self.valuation_date, self.curve_max_date]),
-                    np.array([0.0, 0.0]),
-                    InterpolationMethod.LINEAR_ZERO
-                )
-                result[2] = CurveImpl(
-                    np.array([self.valuation_date, self.curve_max_date]),
-                    np.array([0.0, 0.0]),
-                    InterpolationMethod.LINEAR_ZERO
-                )
-            return result
-
-        # Fill curve_rates for intermediate dates
-        for i in range(1, len(curve_dates) - 1):
-            curve_rates[i] = initial_curve.interpolate(curve_dates[i])
-
-        # Plug in a rate for t=0
-        curve_rates[0] = curve_rates[1]
-
-        # Handle extrapolation for the last rate
-        if params.get_long_dates() and params.get_long_dates()[-1] == self.curve_max_date:
-            curve_rates[-1] = initial_curve.interpolate(curve_dates[-1])
-        else:
-            self.extrapolate(curve_dates, curve_rates, params)
-
-        # Create the primary curve
-        result[0] = CurveImpl(
-            np.array(curve_dates),
-            np.array(curve_rates),
-            params.get_interpolation_method()
-        )
-
-        # Handle overlaps
-        overlap_dates = params.get_short_mid_overlap_dates(self.valuation_date)
-        overlap_rates = np.zeros(len(overlap_dates))
-        result[1] = CurveImpl(
-            np.array(overlap_dates),
-            np.array(overlap_rates),
-            InterpolationMethod.LINEAR_ZERO
-        )
-
-        overlap_dates = params.get_mid_long_overlap_dates(self.valuation_date)
-        overlap_rates = np.zeros(len(overlap_dates))
-        result[2] = CurveImpl(
-            np.array(overlap_dates),
-            np.array(overlap_rates),
-            InterpolationMethod.LINEAR_ZERO
-        )
-
-        return result
-
-    def curve_diff(self, a: Curve, b: Curve) -> CurveImpl:
-        curve_dates = np.copy(a.get_x())
-        curve_rates = np.zeros(len(curve_dates))
-        for i in range(len(curve_dates)):
-            curve_rates[i] = b.interpolate(curve_dates[i]) - a.get_y()[i]
-        return CurveImpl(curve_dates,curve_rates, InterpolationMethod.LINEAR_DF)
-
     def update_basis_curve(self):
         # The basis curve is a curve that is anchor + diff on the nodes of the anchor
         curve_dates = np.copy(self.anchor_curve.get_x())  # Copy the X values of anchorCurve
@@ -190,12 +126,11 @@ class CurveAdjuster:
         diff_max_date = self.diff_curve.get_x()[-1]
         diff_max_rate = self.diff_curve.get_y()[-1]
 
-        # Calculate curve rates based on anchorCurve and diffCurve
-        for i, date in enumerate(curve_dates):
-            if date > diff_max_date:
-                curve_rates[i] = self.anchor_curve.get_y()[i] + diff_max_rate
-            else:
-                curve_rates[i] = self.anchor_curve.get_y()[i] + self.diff_curve.interpolate(date)
+        # Calculate curve rates based on anchorCurve and diffCurve; beyond the diff max date use the last diff rate
+        inside = curve_dates <= diff_max_date
+        diff_rates = np.full(len(curve_dates), diff_max_rate)
+        diff_rates[inside] = self.grid_index.interpolate(self.diff_curve, curve_dates[inside])
+        curve_rates += self.anchor_curve.get_y() + diff_rates
 
         # Check if basisCurve needs to be created or updated
         if self.basis_curve is None or len(self.basis_curve.get_x()) != len(curve_dates):
@@ -210,73 +145,18 @@ class CurveAdjuster:
             np.copyto(self.basis_curve.get_y(), np.array(curve_rates))
             self.basis_curve.update()
 
-    def extrapolate(self, curve_dates: np.ndarray, curve_rates: np.ndarray, params: CurveAdjusterParams):
-        if len(params.get_long_dates()) == 0 or params.get_long_dates()[-1] == self.curve_max_date:
-            return
-        else:
-            i = len(curve_rates) - 3
-            if i >= 0:
-                # Flat forward extrapolation
-                t1 = curve_dates[i] / 365.0
-                t2 = curve_dates[i + 1] / 365.0
-                t3 = curve_dates[i + 2] / 365.0
-
-                fwd = ((curve_rates[i + 1] * t2) - (curve_rates[i] * t1)) / (t2 - t1)
-
-                curve_rates[i + 2] = (curve_rates[i + 1] * t2 + fwd * (t3 - t2)) / t3
-            else:
-                curve_rates[-1] = curve_rates[-2]
-
-    def extrapolate_diff(self, curve_rates: np.ndarray, params: CurveAdjusterParams):
-        if len(params.get_long_dates()) == 0 or params.get_long_dates()[-1] == self.curve_max_date:
-            return
-        else:
-            # Flat extrapolation
-            curve_rates[-1] = curve_rates[-2]
+        self.basis_curve_dirty = False
+        self.recompute_counts["basis_curve"] += 1
 
     def set_stub_rate(self, stub_type: str):
-        if stub_type == CurveAdjuster.StubType.FLAT:
-            self.anchor_curve.get_y()[0] = self.anchor_curve.get_y()[1]
-        else:
-            x1, x2 = self.anchor_curve.get_x()[:2]
-            y1, y2 = self.anchor_curve.get_y()[:2]
-            slope = (y2 - y1) / (x2 - x1)
-            self.anchor_curve.get_y()[0] = y1 - slope * (x1 - self.anchor_curve.get_x()[0])
-
-    def merge_nodes(self, a_nodes: np.ndarray, b_nodes: np.ndarray) -> np.ndarray:
-        merged = np.zeros(len(a_nodes) + len(b_nodes))
-        merged_idx = 0
-        call_idx = 0
-        cpn_idx = 0
-
-        while call_idx < len(b_nodes) or cpn_idx < len(a_nodes):
-            if call_idx == len(b_nodes) or (cpn_idx < len(a_nodes) and (b_nodes[call_idx] - a_nodes[cpn_idx]) > 0.5):
-                # `a_nodes` before `b_nodes`
-                merged[merged_idx] = a_nodes[cpn_idx]
-                cpn_idx += 1
-            elif cpn_idx == len(a_nodes) or (call_idx < len(b_nodes) and (a_nodes[cpn_idx] - b_nodes[call_idx]) > 0.5):
-                # `b_nodes` before `a_nodes`
-                merged[merged_idx] = b_nodes[call_idx]
-                call_idx += 1
-            else:
-                # Equal within tolerance
-                merged[merged_idx] = a_nodes[cpn_idx]
-                cpn_idx += 1
-                call_idx += 1
-
-            merged_idx += 1
-
-        # Resize the merged array to the actual number of elements
-        return merged[:merged_idx]
+        self.set_curve_stub_rate(self.anchor_curve, stub_type)
+
+    def set_anchor_fixing(self, anchor_fixing: Optional[float]):
+        self.anchor_fixing = anchor_fixing
 
     def update_high_res_basis_curve(self):
         nodes = self.merge_nodes(self.diff_curve.get_x(), self.anchor_curve.get_x())
-        diff_rates = self.diff_curve.interpolate_array2(nodes)
-        rates = self.anchor_curve.interpolate_array2(nodes)
-
-        # Add diffRates to rates
-        for i in range(len(rates)):
-            rates[i] += diff_rates[i]
+        rates = self.grid_index.interpolate(self.anchor_curve, nodes) + self.grid_index.interpolate(self.diff_curve, nodes)
 
         if self.high_res_basis_curve is None or len(self.high_res_basis_curve.get_x()) != len(nodes):
             self.high_res_basis_curve = CurveImpl(
@@ -290,64 +170,63 @@ class CurveAdjuster:
             np.copyto(self.high_res_basis_curve.get_y(), np.array(rates))
             self.high_res_basis_curve.update()
 
+        self.high_res_basis_curve_dirty = False
+        self.recompute_counts["high_res_basis_curve"] += 1
+
+    def update_anchor_overlap_curves(self):
+        self.anchor_short_mid_basis.update()
+        self.anchor_mid_long_basis.update()
+        self.anchor_overlap_dirty = False
+        self.recompute_counts["anchor_overlap_curves"] += 1
+
+    def update_basis_overlap_curves(self):
+        self.basis_short_mid_basis.update()
+        self.basis_mid_long_basis.update()
+        self.basis_overlap_dirty = False
+        self.recompute_counts["basis_overlap_curves"] += 1
+
     def adjust_curves(self, adj_vect: np.ndarray):
+        # Inside a checkpoint the full restore is logged so that pop_state can undo it
+        if self.state_stack:
+            for curve in self.get_adjusted_curves():
+                self.record_state(curve, np.arange(len(curve.get_y())))
+
         # Put curves back to initial conditions
         self.restore_curves()
 
         # Check for convergence failures
+        adj_vect = np.asarray(adj_vect, dtype=float)
         num_anchor_pts = self.anchor_params.get_num_total_points()
-        for i in range(num_anchor_pts):
-            if np.isnan(adj_vect[i]) or adj_vect[i] == float('inf') or adj_vect[i] == float('-inf'):
-                raise ConvergenceException(
-                    f"Convergence failure on anchor curve index {self.anchor_params.get_index()}"
-                )
-
-        for i in range(num_anchor_pts, len(adj_vect)):
-            if np.isnan(adj_vect[i]) or adj_vect[i] == float('inf') or adj_vect[i] == float('-inf'):
-                raise ConvergenceException(
-                    f"Convergence failure on basis curve index {self.basis_params.get_index()}"
-                )
+        if not np.all(np.isfinite(adj_vect[:num_anchor_pts])):
+            raise ConvergenceException(
+                f"Convergence failure on anchor curve index {self.anchor_params.get_index()}"
+            )
+        if not np.all(np.isfinite(adj_vect[num_anchor_pts:])):
+            raise ConvergenceException(
+                f"Convergence failure on basis curve index {self.basis_params.get_index()}"
+            )
 
         # Adjustments for anchor curve instruments in increasing maturity
-        i = 0  # Index into anchor curve
-        k = 0  # Index into adj_vect
+        anchor_curves = [self.anchor_curve, self.anchor_short_mid_basis, self.anchor_mid_long_basis]
+        anchor_layout = self.anchor_params.get_adjustment_layout(True)
         if self.anchor_params.get_num_total_points() != 0:
-            n_overlap = self.anchor_params.get_num_short_mid_overlap_points()
-            for i in range(len(self.anchor_params.get_short_dates()) - n_overlap):
-                self.anchor_curve.get_y()[i + 1] += adj_vect[k]
-                k += 1
-
-            self.set_stub_rate()
-
-            for i in range(len(self.anchor_params.get_mid_dates()) - n_overlap):
-                self.anchor_curve.get_y()[i + 1] += adj_vect[k]
-                k += 1
-
-            for i in range(len(self.anchor_params.get_long_dates())):
-                self.anchor_curve.get_y()[i + 1] += adj_vect[k]
-                k += 1
+            short, mid, long = anchor_layout
+            self.apply_segment(anchor_curves, short, adj_vect, 0)
+            self.set_stub_rate(self.stub_type)
+            self.apply_segment(anchor_curves, mid, adj_vect, 0)
+            self.apply_segment(anchor_curves, long, adj_vect, 0)
 
             # Update anchor curves
             self.extrapolate(self.anchor_curve.get_x(), self.anchor_curve.get_y(), self.anchor_params)
             self.anchor_curve.update()
-            self.anchor_short_mid_basis.update()
-            self.anchor_mid_long_basis.update()
+            self.anchor_overlap_dirty = True
 
         # Adjustments for basis curve instruments in increasing maturity
+        basis_curves = [self.diff_curve, self.basis_short_mid_basis, self.basis_mid_long_basis]
+        offset = anchor_layout[-1].stop
         if self.basis_params.get_num_total_points() != 0:
-            n_overlap = self.basis_params.get_num_short_mid_overlap_points()
-            for i in range(len(self.basis_params.get_short_dates()) - n_overlap):
-                self.basis_short_mid_basis.get_y()[i + 1] += adj_vect[k]
-                k += 1
-
-            n_overlap = self.basis_params.get_num_mid_long_overlap_points()
-            for i in range(len(self.basis_params.get_mid_dates()) - n_overlap):
-                self.basis_mid_long_basis.get_y()[i + 1] += adj_vect[k]
-                k += 1
-
-            for i in range(len(self.basis_params.get_long_dates())):
-                self.diff_curve.get_y()[i + 1] += adj_vect[k]
-                k += 1
+            for segment in self.basis_params.get_adjustment_layout(False):
+                self.apply_segment(basis_curves, segment, adj_vect, offset)
 
             # Set rate at t=0
             self.diff_curve.get_y()[0] = self.diff_curve.get_y()[1]
@@ -355,15 +234,175 @@ class CurveAdjuster:
             # Update basis curves
             self.extrapolate_diff(self.diff_curve.get_y(), self.basis_params)
             self.diff_curve.update()
-            self.basis_short_mid_basis.update()
-            self.basis_mid_long_basis.update()
-
-        # Update basis curve and high-resolution basis curve
-        self.update_basis_curve()
-        self.update_high_res_basis_curve()
+            self.basis_overlap_dirty = True
+
+        # Basis curve and high-resolution basis curve are rebuilt when next requested
+        self.basis_curve_dirty = True
+        self.high_res_basis_curve_dirty = True
+
+    def get_adjusted_curves(self) -> List[CurveImpl]:
+        return [self.anchor_curve, self.anchor_short_mid_basis, self.anchor_mid_long_basis,
+                self.diff_curve, self.basis_short_mid_basis, self.basis_mid_long_basis]
+
+    def get_adjustment_targets(self) -> list:
+        # (curve, node, is anchor short point) for each element of the adjustment vector, in adjust_curves order
+        if self.adjustment_targets is not None:
+            return self.adjustment_targets
+
+        targets = []
+        anchor_curves = [self.anchor_curve, self.anchor_short_mid_basis, self.anchor_mid_long_basis]
+        for n, segment in enumerate(self.anchor_params.get_adjustment_layout(True)):
+            targets.extend((anchor_curves[segment.curve_id], node, n == 0) for node in segment.nodes)
+
+        basis_curves = [self.diff_curve, self.basis_short_mid_basis, self.basis_mid_long_basis]
+        for segment in self.basis_params.get_adjustment_layout(False):
+            targets.extend((basis_curves[segment.curve_id], node, False) for node in segment.nodes)
+
+        self.adjustment_targets = targets
+        return targets
+
+    def get_adjustment_dates(self) -> np.ndarray:
+        # Date of the node moved by each element of the adjustment vector, for the Jacobian sparsity
+        return np.array([curve.get_x()[node] for curve, node, _ in self.get_adjustment_targets()])
+
+    def push_state(self):
+        # Checkpoint the current curve state; later changes are logged until the matching pop_state
+        self.state_stack.append(len(self.undo_log))
+
+    def pop_state(self):
+        # Roll the curves back to the last checkpoint, undoing only the logged changes
+        if not self.state_stack:
+            raise EngineException("No curve adjuster state to pop.")
+
+        start = self.state_stack.pop()
+        changed = {}
+        for curve, indices, values in reversed(self.undo_log[start:]):
+            curve.get_y()[indices] = values
+            changed.setdefault(id(curve), (curve, set()))[1].update(indices.tolist())
+        del self.undo_log[start:]
+
+        for curve, indices in changed.values():
+            self.mark_changed(curve, sorted(indices))
+
+    def record_state(self, curve: CurveImpl, indices: np.ndarray):
+        if self.state_stack:
+            self.undo_log.append((curve, indices, curve.get_y()[indices].copy()))
+
+    def apply_delta(self, index: int, bump: float):
+        # Same result as adjust_curves with adj_vect[index] += bump, but only the target node and the
+        # nodes derived from it (stub rate and extrapolated end) are changed and refreshed
+        if np.isnan(bump) or np.isinf(bump):
+            raise ConvergenceException(f"Convergence failure on adjustment vector index {index}")
+
+        curve, node, anchor_short = self.get_adjustment_targets()[index]
+        y = curve.get_y()
+        if curve is self.anchor_curve or curve is self.diff_curve:
+            indices = np.unique([0, node, len(y) - 1])
+        else:
+            indices = np.array([node])
+        self.record_state(curve, indices)
+
+        y[node] += bump
+        if curve is self.anchor_curve:
+            # The flat stub is set from the short points only, before the mid and long points are applied
+            if anchor_short and node == 1 and self.stub_type == CurveAdjuster.StubType.FLAT:
+                y[0] += bump
+            self.extrapolate(self.anchor_curve.get_x(), y, self.anchor_params)
+        elif curve is self.diff_curve:
+            y[0] = y[1]
+            self.extrapolate_diff(y, self.basis_params)
+
+        self.mark_changed(curve, indices)
+
+    def mark_changed(self, curve: CurveImpl, indices):
+        # Refresh a primary curve incrementally and mark the curves derived from it dirty
+        if curve is self.anchor_curve or curve is self.diff_curve:
+            curve.update(indices)
+        elif curve is self.anchor_short_mid_basis or curve is self.anchor_mid_long_basis:
+            self.anchor_overlap_dirty = True
+        else:
+            self.basis_overlap_dirty = True
+        self.basis_curve_dirty = True
+        self.high_res_basis_curve_dirty = True
+
+    def fork(self) -> 'CurveAdjuster':
+        # Independent adjuster for concurrent objective evaluation. Params, the saved initial y arrays and
+        # the x-grids are shared read-only; each adjusted curve gets its own y buffer and interpolator, and
+        # the fork gets its own grid index seeded with the plans built so far. The cost is one y copy and
+        # one interpolator build per curve, linear in the total node count. Derived curves are rebuilt
+        # lazily on first use in the fork.
+        forked = copy.copy(self)
+        forked.anchor_curve = self.fork_curve(self.anchor_curve)
+        forked.anchor_short_mid_basis = self.fork_curve(self.anchor_short_mid_basis)
+        forked.anchor_mid_long_basis = self.fork_curve(self.anchor_mid_long_basis)
+        forked.diff_curve = self.fork_curve(self.diff_curve)
+        forked.basis_short_mid_basis = self.fork_curve(self.basis_short_mid_basis)
+        forked.basis_mid_long_basis = self.fork_curve(self.basis_mid_long_basis)
+
+        forked.basis_curve = None
+        forked.high_res_basis_curve = None
+        forked.basis_curve_dirty = True
+        forked.high_res_basis_curve_dirty = True
+        forked.anchor_overlap_dirty = False
+        forked.basis_overlap_dirty = False
+        forked.recompute_counts = dict.fromkeys(self.recompute_counts, 0)
+        forked.state_stack = []
+        forked.undo_log = []
+        forked.adjustment_targets = None
+        forked.grid_index = self.grid_index.fork()
+        return forked
+
+    def get_anchor_params(self) -> CurveAdjusterParams:
+        return self.anchor_params
+
+    def get_basis_params(self) -> CurveAdjusterParams:
+        return self.basis_params
+
+    def get_anchor_fixing(self) -> Optional[float]:
+        return self.anchor_fixing
+
+    def get_anchor_curve(self) -> Curve:
+        return self.anchor_curve
+
+    def get_diff_curve(self) -> Curve:
+        return self.diff_curve
+
+    def get_basis_curve(self) -> Curve:
+        if self.basis_curve_dirty:
+            self.update_basis_curve()
+        return self.basis_curve
+
+    def get_high_res_basis_curve(self) -> Curve:
+        if self.high_res_basis_curve_dirty:
+            self.update_high_res_basis_curve()
+        return self.high_res_basis_curve
+
+    def get_anchor_short_mid_basis_curve(self) -> Curve:
+        if self.anchor_overlap_dirty:
+            self.update_anchor_overlap_curves()
+        return self.anchor_short_mid_basis
+
+    def get_anchor_mid_long_basis_curve(self) -> Curve:
+        if self.anchor_overlap_dirty:
+            self.update_anchor_overlap_curves()
+        return self.anchor_mid_long_basis
+
+    def get_basis_short_mid_basis_curve(self) -> Curve:
+        if self.basis_overlap_dirty:
+            self.update_basis_overlap_curves()
+        return self.basis_short_mid_basis
+
+    def get_basis_mid_long_basis_curve(self) -> Curve:
+        if self.basis_overlap_dirty:
+            self.update_basis_overlap_curves()
+        return self.basis_mid_long_basis
 
     def get_discount_curve(self) -> Curve:
         if self.anchor_is_discount:
             return self.anchor_curve
         else:
-            return self.basis_curve
+            return self.get_basis_curve()
+
+    def get_statistics(self) -> dict:
+        # Number of times each derived curve has been rebuilt
+        return dict(self.recompute_counts)
@@ -13,13 +13,32 @@
 
 from typing import List
 
+import numpy as np
+
 from yield_curve.common.curve.Exception.EngineException import EngineException
 from yield_curve.common.curve.interpolation_method import InterpolationMethod
 
 
+class AdjustmentSegment:
+    """
+    Contiguous slice [start, stop) of the adjustment vector added to the given nodes of one curve.
+    Curve ids follow the order of CurveAdjuster.build_curves: main curve, short/mid basis, mid/long basis.
+    """
+
+    def __init__(self, curve_id: int, start: int, nodes: np.ndarray):
+        self.curve_id = curve_id
+        self.start = start
+        self.stop = start + len(nodes)
+        self.nodes = nodes
+
+
 class CurveAdjusterParams:
     OVERLAP_THRESHOLD = 7  # One week
 
+    MAIN_CURVE = 0
+    SHORT_MID_CURVE = 1
+    MID_LONG_CURVE = 2
+
     def __init__(self, index: str, short_dates: List[float], mid_dates: List[float],
                  long_dates: List[float], interp_method: InterpolationMethod, high_res: bool):
         self.index = index
@@ -30,6 +49,7 @@ class CurveAdjusterParams:
         self.high_res = high_res
         self.num_short_mid_overlap_points = -1
         self.num_mid_long_overlap_points = -1
+        self.adjustment_layouts = {}
 
     def get_short_dates(self) -> List[float]:
         return self.short_dates
@@ -131,22 +151,59 @@ class CurveAdjusterParams:
 
         extrap_curve = len(self.long_dates) > 0 and self.long_dates[-1] < curve_max_date
 
-        curve_dates = [0] * (self.get_num_curve_points() + (1 if extrap_curve else 0))
-        i = 0
-        curve_dates[i] = valuation_date
-        i += 1
-
-        for date in self.short_dates[:-short_mid_overlap]:
-            curve_dates[i] = date
-            i += 1
-        for date in self.mid_dates[:-mid_long_overlap]:
-            curve_dates[i] = date
-            i += 1
-        for date in self.long_dates:
-            curve_dates[i] = date
-            i += 1
+        # Overlap points live on the overlap basis curves, the slices keep every point when there are none
+        curve_dates = [valuation_date]
+        curve_dates.extend(self.short_dates[:len(self.short_dates) - short_mid_overlap])
+        curve_dates.extend(self.mid_dates[:len(self.mid_dates) - mid_long_overlap])
+        curve_dates.extend(self.long_dates)
 
         if extrap_curve:
-            curve_dates[i] = curve_max_date
+            curve_dates.append(curve_max_date)
 
         return curve_dates
+
+    def get_adjustment_layout(self, anchor: bool) -> List[AdjustmentSegment]:
+        """
+        Compile where each element of the adjustment vector lands, in short, mid, long order.
+        An anchor curve takes all three segments on its main curve; a basis curve takes the short
+        and mid segments on its overlap basis curves and the long segment on its diff curve.
+        :param anchor: True for the anchor curve parameters.
+        :return: The three segments; empty when there are no calibration points.
+        """
+        layout = self.adjustment_layouts.get(anchor)
+        if layout is not None:
+            return layout
+
+        if self.get_num_total_points() == 0:
+            counts = [0, 0, 0]
+        elif anchor:
+            n_overlap = self.get_num_short_mid_overlap_points()
+            counts = [len(self.short_dates) - n_overlap, len(self.mid_dates) - n_overlap, len(self.long_dates)]
+        else:
+            counts = [len(self.short_dates) - self.get_num_short_mid_overlap_points(),
+                      len(self.mid_dates) - self.get_num_mid_long_overlap_points(),
+                      len(self.long_dates)]
+
+        if anchor:
+            curve_ids = [self.MAIN_CURVE, self.MAIN_CURVE, self.MAIN_CURVE]
+        else:
+            curve_ids = [self.SHORT_MID_CURVE, self.MID_LONG_CURVE, self.MAIN_CURVE]
+
+        # Every segment starts at node 1, node 0 being the valuation date
+        layout = []
+        start = 0
+        for curve_id, count in zip(curve_ids, counts):
+            segment = AdjustmentSegment(curve_id, start, np.arange(1, max(count, 0) + 1))
+            layout.append(segment)
+            start = segment.stop
+
+        self.adjustment_layouts[anchor] = layout
+        return layout
+
+    def get_adjustment_size(self, anchor: bool) -> int:
+        """
+        Number of adjustment vector elements consumed by these parameters.
+        :param anchor: True for the anchor curve parameters.
+        :return: The size of the compiled layout.
+        """
+        return self.get_adjustment_layout(anchor)[-1].stop
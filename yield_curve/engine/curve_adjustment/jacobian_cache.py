@@ -0,0 +1,106 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+from typing import Iterable, Optional
+
+import numpy as np
+
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.common.util.lru_cache import LruCache
+from yield_curve.engine.curve_adjustment.broyden_solver import BroydenSolver, RealMatrix
+
+
+class JacobianCache:
+    """
+    Converged Jacobians kept between calibrations, keyed by a fingerprint of the instrument set,
+    the node grid and the interpolation method. The most recently used entries are kept in memory
+    and, when a directory is given, every stored Jacobian is also written there as <key>.npy so
+    that a new process can warm start from the last run.
+    """
+
+    def __init__(self, max_size: int = 64, directory: Optional[str] = None):
+        """
+        :param max_size: Maximum number of Jacobians kept in memory.
+        :param directory: Optional directory for on-disk persistence.
+        """
+        self.entries = LruCache(max_size)
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(instruments: Iterable, node_dates, interp_method: InterpolationMethod) -> str:
+        """
+        Key of a calibration problem.
+        :param instruments: Instrument identifiers in objective order, e.g. instrument codes.
+        :param node_dates: Node dates of the adjustment vector.
+        :param interp_method: Interpolation method of the adjusted curve.
+        :return: Hex digest usable as a file name.
+        """
+        digest = hashlib.sha1()
+        digest.update("\x1f".join(str(instrument) for instrument in instruments).encode())
+        digest.update(np.asarray(node_dates, dtype=float).tobytes())
+        digest.update(str(interp_method).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Jacobian stored for the key, from memory or from disk.
+        :param key: Fingerprint of the problem.
+        :return: A copy of the Jacobian, or None.
+        """
+        jacobian = self.entries.get(key)
+        if jacobian is None and self.directory is not None:
+            path = self.path(key)
+            if os.path.exists(path):
+                jacobian = np.load(path)
+                self.entries.put(key, jacobian)
+        return None if jacobian is None else np.array(jacobian)
+
+    def put(self, key: str, jacobian: np.ndarray):
+        """
+        Store a Jacobian for the key.
+        :param key: Fingerprint of the problem.
+        :param jacobian: Jacobian matrix; a copy is stored.
+        """
+        jacobian = np.array(jacobian, dtype=float)
+        self.entries.put(key, jacobian)
+        if self.directory is not None:
+            np.save(self.path(key), jacobian)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npy")
+
+    def solve(self, solver: BroydenSolver, key: str, guess: np.ndarray, polish: bool = False) -> np.ndarray:
+        """
+        Solve starting from the cached Jacobian when there is one, then store the converged Jacobian.
+        :param solver: Solver of the problem; its Jacobian is replaced by the cached one on a hit.
+        :param key: Fingerprint of the problem.
+        :param guess: Initial guess.
+        :param polish: Polish a cached Jacobian before solving.
+        :return: The solution.
+        """
+        jacobian = self.get(key)
+        if jacobian is not None:
+            solver.jacobian = RealMatrix(jacobian)
+        x = solver.solve_with_polish(guess, polish and jacobian is not None)
+        self.put(key, solver.jacobian.data)
+        return x
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
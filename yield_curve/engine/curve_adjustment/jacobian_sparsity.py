@@ -0,0 +1,125 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional
+
+import numpy as np
+
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+
+
+def interpolation_reach(interp_method: InterpolationMethod) -> Optional[int]:
+    """
+    Number of nodes beyond the bracketing node that a value interpolated on the curve depends on.
+    :param interp_method: Interpolation method of the adjusted curve.
+    :return: The reach, or None when every node matters (cubic spline).
+    """
+    if interp_method == InterpolationMethod.CUBIC_SPLINE:
+        return None
+    if interp_method == InterpolationMethod.MONOTONE_CONVEX:
+        # Node forwards are averages of the neighbouring discrete forwards
+        return 1
+    return 0
+
+
+def maturity_sparsity(maturities, node_dates, reach: Optional[int] = 0, start_dates=None) -> np.ndarray:
+    """
+    Jacobian sparsity of instruments against adjusted curve nodes. An instrument maturing at T
+    depends on the nodes up to the first node on or after T, plus reach further nodes. With start
+    dates, nodes before the last node on or before the start, less reach nodes, are excluded too.
+    Swaps starting at the valuation date give a lower triangular pattern; FRAs, futures and
+    forward starting instruments give banded rows.
+    :param maturities: Curve date of each instrument (objective row), e.g. PricingFunction.curve_date().
+    :param node_dates: Date of the node moved by each element of the adjustment vector (column).
+    :param reach: Extra nodes beyond the bracketing nodes, see interpolation_reach(); None for dense.
+    :param start_dates: Optional first date each instrument depends on.
+    :return: Boolean (number of instruments x number of nodes) matrix.
+    """
+    maturities = np.asarray(maturities, dtype=float)
+    node_dates = np.asarray(node_dates, dtype=float)
+    if reach is None:
+        return np.ones((len(maturities), len(node_dates)), dtype=bool)
+
+    # Rank the nodes by date so that repeated or unsorted node dates are handled
+    unique_dates = np.unique(node_dates)
+    node_rank = np.searchsorted(unique_dates, node_dates)
+    last = np.minimum(np.searchsorted(unique_dates, maturities, side="left") + reach, len(unique_dates) - 1)
+    sparsity = node_rank[None, :] <= last[:, None]
+    if start_dates is not None:
+        first = np.searchsorted(unique_dates, np.asarray(start_dates, dtype=float), side="right") - 1 - reach
+        sparsity &= node_rank[None, :] >= first[:, None]
+    return sparsity
+
+
+def reach_dates(dates, node_dates, reach: Optional[int] = 0) -> np.ndarray:
+    """
+    Last node a value at each date depends on: the first node on or after the date plus reach
+    further nodes, capped at the last node.
+    :param dates: Dates of the values.
+    :param node_dates: Node dates of the curve, or a subset of them for a later bound.
+    :param reach: Extra nodes beyond the bracketing node, see interpolation_reach(); None for dense.
+    :return: Node date of each value, infinite when every node matters.
+    """
+    dates = np.asarray(dates, dtype=float)
+    unique_dates = np.unique(np.asarray(node_dates, dtype=float))
+    if reach is None or len(unique_dates) == 0:
+        return np.full(len(dates), np.inf)
+    return unique_dates[np.minimum(np.searchsorted(unique_dates, dates, side="left") + reach,
+                                   len(unique_dates) - 1)]
+
+
+def basis_sparsity(maturities, anchor_dates, diff_dates, anchor_reach: Optional[int] = 0,
+                   basis_reach: Optional[int] = 0) -> np.ndarray:
+    """
+    Jacobian sparsity of instruments that may be valued on the basis curve, against the anchor
+    and diff curve nodes. The basis curve is anchor plus diff on the anchor grid (or the merged grid),
+    so an instrument reaches the basis nodes up to its maturity bracket plus basis_reach, and each
+    of those reaches the anchor nodes around it on the anchor grid and the diff nodes around it
+    on the diff grid. Instruments valued on the anchor curve only depend on a subset of this pattern.
+    The adjusted nodes are a subset of the curve nodes, so bounds taken on them are conservative.
+    :param maturities: Curve date of each instrument (objective row).
+    :param anchor_dates: Dates of the adjusted anchor nodes, the first columns.
+    :param diff_dates: Dates of the adjusted diff nodes, the last columns.
+    :param anchor_reach: Reach of the anchor interpolation, see interpolation_reach().
+    :param basis_reach: Reach of the diff and basis interpolation, see interpolation_reach().
+    :return: Boolean (number of instruments x (anchor nodes + diff nodes)) matrix.
+    """
+    anchor_dates = np.asarray(anchor_dates, dtype=float)
+    diff_dates = np.asarray(diff_dates, dtype=float)
+    last_basis = reach_dates(maturities, anchor_dates, basis_reach)
+    anchor = anchor_dates[None, :] <= reach_dates(last_basis, anchor_dates, anchor_reach)[:, None]
+    diff = diff_dates[None, :] <= reach_dates(last_basis, diff_dates, basis_reach)[:, None]
+    return np.hstack([anchor, diff])
+
+
+def group_columns(sparsity: np.ndarray) -> List[np.ndarray]:
+    """
+    Group structurally orthogonal columns (Curtis-Powell-Reid). Columns of a group share no
+    non-zero row, so one bumped evaluation recovers all of them.
+    :param sparsity: Boolean (rows x columns) matrix of structural non-zeros.
+    :return: List of column index arrays, in increasing column order within each group.
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    groups = []
+    occupied = []
+    for column in range(sparsity.shape[1]):
+        rows = sparsity[:, column]
+        for group, used in zip(groups, occupied):
+            if not np.any(used & rows):
+                group.append(column)
+                used |= rows
+                break
+        else:
+            groups.append([column])
+            occupied.append(rows.copy())
+    return [np.array(group, dtype=int) for group in groups]
@@ -0,0 +1,207 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from typing import List, Optional
+
+import numpy as np
+
+from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.Exception.EngineException import EngineException
+from yield_curve.engine.curve_adjustment.base_curve_adjuster import BaseCurveAdjuster
+from yield_curve.engine.curve_adjustment.curve_adjuster_parameters import CurveAdjusterParams
+from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
+
+
+class MultiCurveAdjuster(BaseCurveAdjuster):
+    """
+    Simultaneous adjustment of any number of curves.
+
+    Curve i is described by params[i] and an optional parent index. A curve without a parent is
+    adjusted like the anchor curve of CurveAdjuster; a curve with a parent is held as a diff over
+    the parent, like the basis curve, and resolved as parent + diff on the parent nodes. The
+    adjustment vector has one block per curve, in the order the curves are given, and a block only
+    moves its own curve and the curves depending on it.
+    """
+
+    def __init__(self, valuation_date: float, curve_max_date: float, initial_curves: List[Curve],
+                 params: List[CurveAdjusterParams], parents: List[Optional[int]]):
+        super().__init__(valuation_date, curve_max_date)
+        if len(initial_curves) != len(params) or len(params) != len(parents):
+            raise EngineException("Need one initial curve, parameter set and parent per curve.")
+        for i, parent in enumerate(parents):
+            if parent is not None and not 0 <= parent < i:
+                raise EngineException(f"Curve {i} can only depend on an earlier curve.")
+
+        self.params = params
+        self.parents = parents
+        self.stub_type = MultiCurveAdjuster.StubType.FLAT
+
+        # Adjusted curves per curve: main (absolute or diff), short/mid basis, mid/long basis
+        self.adjusted_curves = []
+        for i, parent in enumerate(parents):
+            if parent is None:
+                built = self.build_curves(initial_curves[i], params[i], False)
+            else:
+                built = self.build_curves(self.curve_diff(initial_curves[parent], initial_curves[i]), params[i], True)
+            self.adjusted_curves.append(built)
+        self.saved_y = [[np.copy(curve.get_y()) for curve in built] for built in self.adjusted_curves]
+
+        sizes = [p.get_adjustment_size(parent is None) for p, parent in zip(params, parents)]
+        self.offsets = np.concatenate(([0], np.cumsum(sizes))).astype(int)
+
+        # Each curve with all the curves that depend on it, directly or through other curves
+        self.dependents = [[i] for i in range(len(params))]
+        for i in reversed(range(len(params))):
+            if parents[i] is not None:
+                self.dependents[parents[i]].extend(self.dependents[i])
+
+        # Resolved curves are rebuilt lazily after a block they depend on has moved
+        self.curves = [built[0] if parent is None else None for built, parent in zip(self.adjusted_curves, parents)]
+        self.curve_dirty = [parent is not None for parent in parents]
+        self.overlap_dirty = [False] * len(params)
+        self.recompute_counts = [0] * len(params)
+
+    def get_num_curves(self) -> int:
+        return len(self.params)
+
+    def get_params(self, i: int) -> CurveAdjusterParams:
+        return self.params[i]
+
+    def get_dimension(self) -> int:
+        return int(self.offsets[-1])
+
+    def get_block(self, i: int) -> slice:
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def adjust_curves(self, adj_vect: np.ndarray):
+        adj_vect = np.asarray(adj_vect, dtype=float)
+        if len(adj_vect) != self.get_dimension():
+            raise EngineException(f"Adjustment vector must have {self.get_dimension()} elements.")
+        for i in range(len(self.params)):
+            self.adjust_block(i, adj_vect[self.get_block(i)])
+
+    def adjust_block(self, i: int, block_vect: np.ndarray):
+        # Put curve i back to its initial conditions and apply its block of the adjustment vector
+        if not np.all(np.isfinite(block_vect)):
+            raise ConvergenceException(f"Convergence failure on curve index {self.params[i].get_index()}")
+
+        for curve, saved_y in zip(self.adjusted_curves[i], self.saved_y[i]):
+            np.copyto(curve.get_y(), saved_y)
+
+        params = self.params[i]
+        main_curve = self.adjusted_curves[i][0]
+        if params.get_num_total_points() != 0:
+            if self.parents[i] is None:
+                short, mid, long = params.get_adjustment_layout(True)
+                self.apply_segment(self.adjusted_curves[i], short, block_vect, 0)
+                self.set_curve_stub_rate(main_curve, self.stub_type)
+                self.apply_segment(self.adjusted_curves[i], mid, block_vect, 0)
+                self.apply_segment(self.adjusted_curves[i], long, block_vect, 0)
+                self.extrapolate(main_curve.get_x(), main_curve.get_y(), params)
+            else:
+                for segment in params.get_adjustment_layout(False):
+                    self.apply_segment(self.adjusted_curves[i], segment, block_vect, 0)
+                main_curve.get_y()[0] = main_curve.get_y()[1]
+                self.extrapolate_diff(main_curve.get_y(), params)
+
+        main_curve.update()
+        self.overlap_dirty[i] = True
+        for k in self.dependents[i]:
+            if self.parents[k] is not None:
+                self.curve_dirty[k] = True
+
+    def get_curve(self, i: int) -> Curve:
+        if self.curve_dirty[i]:
+            self.update_curve(i)
+        return self.curves[i]
+
+    def get_curve_for_index(self, index: str) -> Curve:
+        for i, params in enumerate(self.params):
+            if params.get_index() == index:
+                return self.get_curve(i)
+        raise EngineException("Cannot find curve for index")
+
+    def get_diff_curve(self, i: int) -> Curve:
+        return self.adjusted_curves[i][0]
+
+    def get_short_mid_basis_curve(self, i: int) -> Curve:
+        if self.overlap_dirty[i]:
+            self.update_overlap_curves(i)
+        return self.adjusted_curves[i][1]
+
+    def get_mid_long_basis_curve(self, i: int) -> Curve:
+        if self.overlap_dirty[i]:
+            self.update_overlap_curves(i)
+        return self.adjusted_curves[i][2]
+
+    def update_overlap_curves(self, i: int):
+        self.adjusted_curves[i][1].update()
+        self.adjusted_curves[i][2].update()
+        self.overlap_dirty[i] = False
+
+    def update_curve(self, i: int):
+        # Parent + diff on the nodes of the parent; beyond the diff max date use the last diff rate
+        parent_curve = self.get_curve(self.parents[i])
+        diff_curve = self.adjusted_curves[i][0]
+        curve_dates = np.copy(parent_curve.get_x())
+
+        inside = curve_dates <= diff_curve.get_x()[-1]
+        diff_rates = np.full(len(curve_dates), diff_curve.get_y()[-1])
+        diff_rates[inside] = self.grid_index.interpolate(diff_curve, curve_dates[inside])
+        curve_rates = parent_curve.get_y() + diff_rates
+
+        curve = self.curves[i]
+        if curve is None or len(curve.get_x()) != len(curve_dates):
+            self.curves[i] = CurveImpl(curve_dates, curve_rates, self.params[i].get_interpolation_method())
+        else:
+            np.copyto(curve.get_x(), curve_dates)
+            np.copyto(curve.get_y(), curve_rates)
+            curve.update()
+
+        self.curve_dirty[i] = False
+        self.recompute_counts[i] += 1
+
+    def get_block_dependencies(self) -> np.ndarray:
+        # [i, j] is True when curve i moves with block j of the adjustment vector
+        mask = np.zeros((len(self.params), len(self.params)), dtype=bool)
+        for j, dependents in enumerate(self.dependents):
+            mask[dependents, j] = True
+        return mask
+
+    def get_jacobian_sparsity(self, instrument_curves: List[int]) -> np.ndarray:
+        """
+        Structural non-zeros of the Jacobian for instruments priced off the given curves.
+        :param instrument_curves: Curve number that each instrument (objective row) depends on.
+        :return: Boolean (number of instruments x dimension) matrix.
+        """
+        block_mask = self.get_block_dependencies()[np.asarray(instrument_curves, dtype=int)]
+        sizes = np.diff(self.offsets)
+        return np.repeat(block_mask, sizes, axis=1)
+
+    def fork(self) -> 'MultiCurveAdjuster':
+        # Independent adjuster sharing the params, saved y arrays and x-grids; see CurveAdjuster.fork
+        forked = copy.copy(self)
+        forked.adjusted_curves = [[self.fork_curve(curve) for curve in built] for built in self.adjusted_curves]
+        forked.curves = [built[0] if parent is None else None
+                         for built, parent in zip(forked.adjusted_curves, self.parents)]
+        forked.curve_dirty = [parent is not None for parent in self.parents]
+        forked.overlap_dirty = [False] * len(self.params)
+        forked.recompute_counts = [0] * len(self.params)
+        forked.grid_index = self.grid_index.fork()
+        return forked
+
+    def get_statistics(self) -> dict:
+        # Number of times each dependent curve has been resolved, by curve index
+        return {f"curve_{params.get_index()}": count for params, count in zip(self.params, self.recompute_counts)}
@@ -0,0 +1,104 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from yield_curve.common.curve.Exception.EngineException import EngineException
+from yield_curve.engine.curve_adjustment.vector_function import VectorFunction
+
+
+class ExecutorMode:
+    SERIAL = "SERIAL"
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+def evaluate_chunk(objective: VectorFunction, args: List[np.ndarray]) -> List[np.ndarray]:
+    """
+    Evaluate one chunk of argument vectors with one objective, in order.
+    Module level so that it can be sent to a process pool.
+    """
+    return [np.asarray(objective.value(arg)) for arg in args]
+
+
+class ParallelEvaluator:
+    """
+    Evaluates many argument vectors of an objective, e.g. the bumped vectors of a finite-difference
+    Jacobian. The vectors are split into contiguous chunks and each chunk is evaluated by its own
+    copy of the objective: a fork() in thread mode, a pickled copy in process mode. Results are
+    returned in argument order whatever the mode, so the Jacobian is identical run to run.
+    """
+
+    def __init__(self, mode: str = ExecutorMode.SERIAL, max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None):
+        """
+        :param mode: ExecutorMode.SERIAL, THREAD or PROCESS.
+        :param max_workers: Pool size; defaults to the number of CPUs.
+        :param chunk_size: Argument vectors per task; defaults to an even split over the workers.
+        """
+        if mode not in (ExecutorMode.SERIAL, ExecutorMode.THREAD, ExecutorMode.PROCESS):
+            raise EngineException(f"Unknown executor mode {mode}")
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = None
+
+    def get_executor(self) -> Executor:
+        # The pool is created on first use and kept until shutdown(), as process start-up is expensive
+        if self.executor is None:
+            if self.mode == ExecutorMode.THREAD:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            else:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    def evaluate(self, objective: VectorFunction, args: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Evaluate the objective at every argument vector.
+        :param objective: Objective to evaluate; left untouched outside serial mode.
+        :param args: Argument vectors.
+        :return: Objective values, in the order of args.
+        """
+        if self.mode == ExecutorMode.SERIAL or len(args) <= 1:
+            return evaluate_chunk(objective, args)
+
+        executor = self.get_executor()
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = -(-len(args) // self.max_workers)
+        chunks = [args[i:i + chunk_size] for i in range(0, len(args), chunk_size)]
+
+        if self.mode == ExecutorMode.THREAD:
+            objectives = [objective.fork() for _ in chunks]
+        else:
+            objectives = [objective] * len(chunks)
+
+        results = []
+        for chunk_result in executor.map(evaluate_chunk, objectives, chunks):
+            results.extend(chunk_result)
+        return results
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -14,6 +14,8 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+import numpy as np
+
 
 class VectorFunction(ABC):
     """
@@ -37,3 +39,48 @@ class VectorFunction(ABC):
         :raises EngineException: If an error occurs during computation.
         """
         pass
+
+    def get_statistics(self) -> dict:
+        """
+        Counters collected while evaluating the function, e.g. derived curve recomputes.
+        :return: A dict of counter names to values; empty by default.
+        """
+        return {}
+
+    def fork(self) -> 'VectorFunction':
+        """
+        Independent copy of the function that can be evaluated concurrently with this one, requested
+        by a THREAD mode ParallelEvaluator. Only the mutable evaluation state needs copying, e.g. with
+        CurveAdjuster.fork() for functions over a CurveAdjuster; read-only inputs can be shared.
+        Functions that are only evaluated serially, or in worker processes, need not override it.
+        :return: The forked function.
+        :raises NotImplementedError: If the function does not support concurrent evaluation.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement fork() and cannot be evaluated "
+                                  "concurrently in one process")
+
+
+class BatchVectorFunction(ABC):
+    """
+    Interface for a family of structurally identical vector functions, e.g. one calibration per
+    scenario, evaluated together.
+    """
+
+    @abstractmethod
+    def dimension(self) -> int:
+        """
+        Gets the dimension of each vector function.
+        :return: The dimension as an integer.
+        """
+        pass
+
+    @abstractmethod
+    def values(self, x: np.ndarray, systems: np.ndarray) -> np.ndarray:
+        """
+        Computes the values of several systems in one call.
+        :param x: (m x n) array, row j is the input vector of system systems[j].
+        :param systems: Array of m system indices; an index may repeat.
+        :return: (m x n) array of function values.
+        :raises EngineException: If an error occurs during computation.
+        """
+        pass
@@ -14,7 +14,10 @@
 from typing import List, Optional
 from datetime import date
 
+import numpy as np
+
 from yield_curve.common.curve.Curve import Curve
+from yield_curve.common.util.date_convert import DateConvert
 from yield_curve.engine.calib_instrument.calibration_context import CalibrationContext
 from yield_curve.engine.date.business_day_convention import BusinessDayConvention
 from yield_curve.engine.date.immutable_holiday_calendar import ImmutableHolidayCalendar
@@ -152,12 +155,11 @@ class BasisSwapPricingFunction:
             discount_curve: Curve,
             spread: float,
     ) -> float:
-        pv = 0.0
-        for payment_date, accrual_factor in zip(payment_dates, accrual_factors):
-            discount_factor = discount_curve.discount(payment_date)
-            forward_rate = curve.forward_rate(payment_date)
+        end_dates = np.array([DateConvert.local_date_to_double(d) for d in payment_dates])
+        start_dates = np.concatenate(([DateConvert.local_date_to_double(self.settle_date)], end_dates[:-1]))
+        accrual_factors = np.asarray(accrual_factors, dtype=float)
 
-            cash_flow = (forward_rate + spread) * accrual_factor * discount_factor
-            pv += cash_flow
+        discount_factors = discount_curve.discount_factors(end_dates)
+        forward_rates = curve.forward_rates(start_dates, end_dates, accrual_factors)
 
-        return pv
+        return float(np.sum((forward_rates + spread) * accrual_factors * discount_factors))
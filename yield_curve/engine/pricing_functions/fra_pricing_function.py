@@ -14,6 +14,8 @@
 from datetime import date
 from typing import Optional
 
+import numpy as np
+
 from yield_curve.common.curve.Curve import Curve
 from yield_curve.common.curve.Exception.EngineException import EngineException
 from yield_curve.engine.curve_adjustment.curve_adjuster import CurveAdjuster
@@ -80,13 +82,13 @@ class FraPricingFunction:
         swap_basis = adjuster.get_anchor_short_mid_basis_curve()
         max_basis_date = swap_basis.get_x()[-1]
 
-        t1 = (self.start_date - self.value_date) / 365.0
-        z1 = curve.interpolate(self.start_date) + swap_basis.interpolate(min(self.start_date, max_basis_date))
-        df1 = pow(2.71828, -z1 * t1)
+        curve_zero = adjuster.interpolate_dates(curve, [self.start_date, self.end_date])
+        basis_zero = adjuster.interpolate_dates(
+            swap_basis, [min(self.start_date, max_basis_date), min(self.end_date, max_basis_date)])
 
-        t2 = (self.end_date - self.value_date) / 365.0
-        z2 = curve.interpolate(self.end_date) + swap_basis.interpolate(min(self.end_date, max_basis_date))
-        df2 = pow(2.71828, -z2 * t2)
+        dates = np.array([self.start_date, self.end_date])
+        discount_factors = np.exp(-(curve_zero + basis_zero) * (dates - self.value_date) / 365.0)
+        df1, df2 = discount_factors
 
         # Calculate the forward rate
         rate = (df1 / df2 - 1.0) / self.accrual_factor
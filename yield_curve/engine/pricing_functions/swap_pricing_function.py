@@ -13,7 +13,6 @@
 
 from datetime import date
 from typing import List, Optional
-import math
 import numpy as np
 
 from yield_curve.common.curve.Curve import Curve
@@ -125,44 +124,31 @@ class SwapPricingFunction(PricingFunction):
             curve = adjuster.anchor_curve
             is_anchor_float_rate = True
         elif adjuster.basis_params.get_index() == self.float_index_cd:
-            curve = adjuster.basis_curve
+            curve = adjuster.get_basis_curve()
             is_anchor_float_rate = False
         else:
             raise EngineException(f"Cannot find curve for index {self.float_index_cd}")
 
-        discount_curve = adjuster.getDiscountCurve()
-        float_pv = 0.0
-        annuity_dv01 = 0.0
+        discount_curve = adjuster.get_discount_curve()
 
-        # Float PV Calculation
-        start_date = self.settle_date
-        start_zero = curve.interpolate(start_date)
-        curve_zero = [curve.interpolate(d) for d in self.float_payment_dates]
-        discount_zero = [discount_curve.interpolate(d) for d in self.float_payment_dates]
+        # Float PV: every period starts where the previous one ends, the first at settlement
+        payment_dates = np.asarray(self.float_payment_dates, dtype=float)
+        accrual_factors = np.asarray(self.float_accrual_factors, dtype=float)
+        curve_dates = np.concatenate(([self.settle_date], payment_dates))
+        projection = np.exp(-adjuster.interpolate_dates(curve, curve_dates) * (curve_dates - self.value_date) / 365.0)
+        discount = np.exp(-adjuster.interpolate_dates(discount_curve, payment_dates)
+                          * (payment_dates - self.value_date) / 365.0)
 
-        for i, payment_date in enumerate(self.float_payment_dates):
-            t1 = (start_date - self.value_date) / 365.0
-            cf1 = math.exp(-start_zero * t1)
-            t2 = (payment_date - self.value_date) / 365.0
-            cf2 = math.exp(-curve_zero[i] * t2)
-            df = math.exp(-discount_zero[i] * t2)
-
-            rate = (cf1 / cf2 - 1.0) / self.float_accrual_factors[i]
-            if i == 0 and is_anchor_float_rate and adjuster.getAnchorFixing() is not None:
-                rate = adjuster.getAnchorFixing()
-
-            accrual = rate * self.float_accrual_factors[i] * df
-            float_pv += accrual
-
-            start_date = payment_date
-            start_zero = curve_zero[i]
+        rates = (projection[:-1] / projection[1:] - 1.0) / accrual_factors
+        if is_anchor_float_rate and adjuster.get_anchor_fixing() is not None:
+            rates[0] = adjuster.get_anchor_fixing()
+        float_pv = float(np.sum(rates * accrual_factors * discount))
 
         # Annuity DV01 Calculation
-        discount_zero = [discount_curve.interpolate(d) for d in self.fixed_payment_dates]
-        for i, payment_date in enumerate(self.fixed_payment_dates):
-            t2 = (payment_date - self.value_date) / 365.0
-            df = math.exp(-discount_zero[i] * t2)
-            annuity_dv01 += self.fixed_accrual_factors[i] * df
+        payment_dates = np.asarray(self.fixed_payment_dates, dtype=float)
+        discount = np.exp(-adjuster.interpolate_dates(discount_curve, payment_dates)
+                          * (payment_dates - self.value_date) / 365.0)
+        annuity_dv01 = float(np.sum(np.asarray(self.fixed_accrual_factors, dtype=float) * discount))
 
         fair_rate = float_pv / annuity_dv01 if annuity_dv01 != 0.0 else float('nan')
 
@@ -0,0 +1,125 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from yield_curve.engine.curve_adjustment.batch_broyden_solver import BatchBroydenSolver
+from yield_curve.engine.curve_adjustment.broyden_solver import BroydenSolver
+from yield_curve.engine.curve_adjustment.vector_function import BatchVectorFunction, VectorFunction
+from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
+
+
+def tridiagonal_value(x: np.ndarray, target: np.ndarray) -> np.ndarray:
+    result = 3.0 * x + x ** 3 - target
+    result[..., 1:] -= x[..., :-1]
+    result[..., :-1] -= x[..., 1:]
+    return result
+
+
+class TridiagonalSystems(BatchVectorFunction):
+    """One banded system per row of targets."""
+
+    def __init__(self, targets: np.ndarray):
+        self.targets = targets
+        self.rows = []
+
+    def dimension(self) -> int:
+        return self.targets.shape[1]
+
+    def values(self, x, systems):
+        self.rows.append(len(systems))
+        return tridiagonal_value(np.asarray(x, dtype=float), self.targets[systems])
+
+
+class DegenerateSystems(TridiagonalSystems):
+    """Like TridiagonalSystems, but system 1 does not depend on x, so its Broyden Jacobian becomes singular."""
+
+    def values(self, x, systems):
+        result = super().values(x, systems)
+        result[systems == 1] = 1.0
+        return result
+
+
+class TridiagonalSystem(VectorFunction):
+    def __init__(self, target: np.ndarray):
+        self.target = target
+
+    def dimension(self) -> int:
+        return len(self.target)
+
+    def value(self, x):
+        return tridiagonal_value(np.asarray(x, dtype=float), self.target)
+
+
+class BatchBroydenSolverTest(unittest.TestCase):
+    def setUp(self):
+        n = 12
+        base = np.linspace(1.0, 2.0, n)
+        self.targets = np.vstack([base, base + 0.01, base - 0.5, 2.0 * base, base])
+        self.guesses = np.zeros((len(self.targets), n))
+
+    def test_matches_sequential_solves(self):
+        objective = TridiagonalSystems(self.targets)
+        solver = BatchBroydenSolver(objective, None, 1e-12, 1e-7, 50)
+        solutions = solver.solve(self.guesses)
+
+        for i, target in enumerate(self.targets):
+            sequential = BroydenSolver(TridiagonalSystem(target), solver.jacobian, 1e-12, 1e-7, 50)
+            np.testing.assert_allclose(sequential.solve_with_polish(self.guesses[i], False), solutions[i],
+                                       atol=1e-12)
+            self.assertEqual(sequential.num_iter, solver.iterations[i])
+        self.assertTrue(np.all(solver.converged))
+
+    def test_retires_converged_systems(self):
+        objective = TridiagonalSystems(self.targets)
+        solver = BatchBroydenSolver(objective, None, 1e-12, 1e-7, 50)
+        solutions = solver.solve(self.guesses)
+
+        statistics = solver.get_statistics()
+        self.assertEqual(statistics["max_iterations"] + 2, statistics["objective_calls"])
+        self.assertEqual(len(self.targets), objective.rows[1])
+        self.assertTrue(all(a >= b for a, b in zip(objective.rows[1:], objective.rows[2:])))
+        self.assertLess(objective.rows[-1], len(self.targets))
+        self.assertEqual(sum(objective.rows), statistics["system_evaluations"])
+        self.assertLess(np.max(np.abs(tridiagonal_value(solutions, self.targets))), 1e-12)
+
+        # A system that starts converged is never stepped
+        guesses = np.array(self.guesses)
+        guesses[0] = solutions[0]
+        solver.solve(guesses)
+        self.assertEqual(0, solver.iterations[0])
+
+    def test_reports_unconverged_systems(self):
+        solver = BatchBroydenSolver(TridiagonalSystems(self.targets), None, 1e-12, 1e-7, 2)
+        with self.assertRaises(ConvergenceException):
+            solver.solve(self.guesses)
+        self.assertFalse(np.any(solver.converged))
+        self.assertEqual(self.guesses.shape, solver.solutions.shape)
+
+    def test_singular_system_fails_alone(self):
+        solver = BatchBroydenSolver(DegenerateSystems(self.targets), None, 1e-12, 1e-7, 50)
+        with self.assertRaises(ConvergenceException):
+            solver.solve(self.guesses)
+
+        np.testing.assert_array_equal([True, False, True, True, True], solver.converged)
+        self.assertEqual(1, solver.iterations[1])
+        converged = solver.converged
+        self.assertLess(np.max(np.abs(tridiagonal_value(solver.solutions[converged], self.targets[converged]))),
+                        1e-12)
+        self.assertIsNone(BatchBroydenSolver.invert(np.ones((3, 3))))
+
+
+if __name__ == '__main__':
+    unittest.main()
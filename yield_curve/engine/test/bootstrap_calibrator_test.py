@@ -0,0 +1,168 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.engine.curve_adjustment.bootstrap_calibrator import BootstrapCalibrator, CalibrationMode
+from yield_curve.engine.curve_adjustment.calibration_objective import CalibrationObjective
+from yield_curve.engine.curve_adjustment.curve_adjuster import CurveAdjuster
+from yield_curve.engine.curve_adjustment.curve_adjuster_parameters import CurveAdjusterParams
+from yield_curve.engine.pricing_functions.abs_pricing_function import PricingFunction
+
+VALUATION_DATE = 44287.0
+MAX_DATE = 47939.0
+
+
+class ParSwapFunction(PricingFunction):
+    """Par rate of an annual fixed leg discounted on the discount curve, less a target rate."""
+
+    def __init__(self, payment_dates, target_rate: float):
+        self.payment_dates = np.asarray(payment_dates, dtype=float)
+        self.target_rate = target_rate
+
+    def value(self, adjuster: CurveAdjuster) -> float:
+        zero = adjuster.interpolate_dates(adjuster.get_discount_curve(), self.payment_dates)
+        df = np.exp(-zero * (self.payment_dates - VALUATION_DATE) / 365.0)
+        accruals = np.diff(np.concatenate(([VALUATION_DATE], self.payment_dates))) / 365.0
+        return (1.0 - df[-1]) / np.dot(accruals, df) - self.target_rate
+
+    def curve_date(self) -> float:
+        return self.payment_dates[-1]
+
+
+class MisdatedSwapFunction(ParSwapFunction):
+    """Par swap reporting a curve date before its last payment, so its dependence reaches past it."""
+
+    def __init__(self, payment_dates, target_rate: float, curve_date: float):
+        super().__init__(payment_dates, target_rate)
+        self.reported_curve_date = curve_date
+
+    def curve_date(self) -> float:
+        return self.reported_curve_date
+
+
+def build_adjuster(interp_method: InterpolationMethod, anchor_is_discount: bool = True) -> CurveAdjuster:
+    dates = np.array([VALUATION_DATE, 44652.0, 45017.0, 45383.0, 45748.0, 46113.0, MAX_DATE])
+    curve = CurveImpl(dates, np.full(len(dates), 0.02), InterpolationMethod.LINEAR_ZERO)
+    anchor_params = CurveAdjusterParams("A", [], [], list(dates[1:-1]), interp_method, False)
+    basis_params = CurveAdjusterParams("B", [], [], [], InterpolationMethod.LINEAR_ZERO, False)
+    return CurveAdjuster(VALUATION_DATE, MAX_DATE, curve, curve, None, anchor_is_discount, anchor_params, basis_params)
+
+
+def build_basis_adjuster(anchor_method: InterpolationMethod, basis_method: InterpolationMethod) -> CurveAdjuster:
+    # Diff nodes between the anchor nodes, swaps discounted on the basis curve
+    dates = np.array([VALUATION_DATE, 44652.0, 45017.0, 45383.0, 45748.0, 46113.0, MAX_DATE])
+    curve = CurveImpl(dates, np.full(len(dates), 0.02), InterpolationMethod.LINEAR_ZERO)
+    anchor_params = CurveAdjusterParams("A", [], [], list(dates[1:-1]), anchor_method, False)
+    basis_params = CurveAdjusterParams("B", [], [], [44800.0, 45600.0], basis_method, False)
+    return CurveAdjuster(VALUATION_DATE, MAX_DATE, curve, curve, None, False, anchor_params, basis_params)
+
+
+def build_swaps():
+    payment_dates = [44652.0, 45017.0, 45383.0, 45748.0, 46113.0]
+    rates = [0.01, 0.015, 0.022, 0.027, 0.03]
+    # Listed out of maturity order on purpose
+    return [ParSwapFunction(payment_dates[:n], rates[n - 1]) for n in (3, 1, 5, 2, 4)]
+
+
+class BootstrapCalibratorTest(unittest.TestCase):
+    def test_bootstrap(self):
+        adjuster = build_adjuster(InterpolationMethod.LINEAR_ZERO)
+        swaps = build_swaps()
+        calibrator = BootstrapCalibrator(adjuster, swaps, 1e-12, 1e-6, 20)
+        self.assertEqual(CalibrationMode.BOOTSTRAP, calibrator.mode)
+        np.testing.assert_array_equal([1, 3, 0, 4, 2], calibrator.instrument_order)
+
+        x = calibrator.calibrate()
+        errors = [swap.value(adjuster) for swap in swaps]
+        self.assertLess(np.max(np.abs(errors)), 1e-12)
+
+        # The incrementally updated curves match a full adjustment with the solution
+        objective = CalibrationObjective(build_adjuster(InterpolationMethod.LINEAR_ZERO), swaps)
+        np.testing.assert_allclose(errors, objective.value(x), atol=1e-15)
+
+        statistics = calibrator.get_statistics()
+        self.assertLessEqual(statistics["max_node_iterations"], 10)
+        # One evaluation per instrument before its node is moved and one in the final residual check
+        self.assertEqual(statistics["pricing_evaluations"], statistics["iterations"] + 2 * len(swaps))
+        self.assertFalse(statistics["broyden_fallback"])
+
+    def test_bootstrap_on_basis_discounting(self):
+        # Swaps discount on the derived basis curve, rebuilt after every move of an anchor node
+        adjuster = build_adjuster(InterpolationMethod.LINEAR_ZERO, anchor_is_discount=False)
+        swaps = build_swaps()
+        calibrator = BootstrapCalibrator(adjuster, swaps, 1e-12, 1e-6, 20)
+        self.assertEqual(CalibrationMode.BOOTSTRAP, calibrator.mode)
+
+        x = calibrator.calibrate()
+        errors = [swap.value(adjuster) for swap in swaps]
+        self.assertLess(np.max(np.abs(errors)), 1e-12)
+        objective = CalibrationObjective(build_adjuster(InterpolationMethod.LINEAR_ZERO, False), swaps)
+        np.testing.assert_allclose(errors, objective.value(x), atol=1e-15)
+
+    def test_residual_check_falls_back_to_broyden(self):
+        # The second swap pays on 45200.0 as well, after the node of its reported curve date
+        swaps = build_swaps()
+        swaps[3] = MisdatedSwapFunction([44652.0, 45017.0, 45200.0], 0.015, 45017.0)
+        adjuster = build_adjuster(InterpolationMethod.LINEAR_ZERO)
+        calibrator = BootstrapCalibrator(adjuster, swaps, 1e-12, 1e-6, 50)
+        self.assertEqual(CalibrationMode.BOOTSTRAP, calibrator.mode)
+
+        calibrator.calibrate()
+        self.assertLess(np.max(np.abs([swap.value(adjuster) for swap in swaps])), 1e-12)
+        statistics = calibrator.get_statistics()
+        self.assertTrue(statistics["broyden_fallback"])
+        self.assertGreater(statistics["broyden_iterations"], 0)
+
+        # The pattern misses the dependence of the misdated swap on the 45383.0 node; the fallback is dense
+        self.assertFalse(calibrator.get_sparsity()[3, 2])
+        self.assertIsNone(calibrator.solver.sparsity)
+        self.assertEqual(len(swaps) + 1, statistics["broyden_jacobian_evaluations"])
+
+    def test_sparsity_covers_basis_dependence(self):
+        payment_dates = [44652.0, 45017.0, 45383.0, 45748.0, 46113.0]
+        swaps = [ParSwapFunction(payment_dates[:n], 0.02) for n in range(1, 6)] \
+            + [ParSwapFunction([44700.0], 0.02), ParSwapFunction([44700.0, 45100.0], 0.02)]
+        methods = [(InterpolationMethod.LINEAR_ZERO, InterpolationMethod.LINEAR_ZERO),
+                   (InterpolationMethod.MONOTONE_CONVEX, InterpolationMethod.LINEAR_ZERO),
+                   (InterpolationMethod.LINEAR_ZERO, InterpolationMethod.MONOTONE_CONVEX),
+                   (InterpolationMethod.FLAT_FORWARD, InterpolationMethod.LINEAR_DF)]
+        for anchor_method, basis_method in methods:
+            adjuster = build_basis_adjuster(anchor_method, basis_method)
+            objective = CalibrationObjective(adjuster, swaps)
+            n = len(adjuster.get_adjustment_targets())
+            base = objective.value(np.zeros(n))
+            jacobian = np.array([(objective.value(1e-5 * np.eye(n)[k]) - base) / 1e-5 for k in range(n)]).T
+
+            sparsity = BootstrapCalibrator(adjuster, swaps, 1e-12, 1e-6, 20).get_sparsity()
+            self.assertEqual(jacobian.shape, sparsity.shape)
+            self.assertFalse(np.any((np.abs(jacobian) > 1e-10) & ~sparsity), msg=f"{anchor_method} {basis_method}")
+
+    def test_broyden_fallback(self):
+        # Monotone convex node forwards reach one node further, so the structure is not triangular
+        adjuster = build_adjuster(InterpolationMethod.MONOTONE_CONVEX)
+        swaps = build_swaps()
+        calibrator = BootstrapCalibrator(adjuster, swaps, 1e-12, 1e-6, 50)
+        self.assertEqual(CalibrationMode.BROYDEN, calibrator.mode)
+
+        calibrator.calibrate()
+        self.assertLess(np.max(np.abs([swap.value(adjuster) for swap in swaps])), 1e-12)
+        self.assertGreater(calibrator.get_statistics()["jacobian_evaluations"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import warnings
+import numpy as np
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from numpy.linalg import LinAlgError
+from yield_curve.engine.curve_adjustment.broyden_solver import BroydenSolver, Globalization, RealMatrix
+from yield_curve.engine.curve_adjustment.jacobian_sparsity import group_columns, interpolation_reach, \
+    maturity_sparsity
+from yield_curve.engine.curve_adjustment.parallel_evaluator import ExecutorMode, ParallelEvaluator
+from yield_curve.engine.curve_adjustment.vector_function import VectorFunction
+from yield_curve.engine.exception.coonvergence_exception import ConvergenceException
+
+
+class TridiagonalFunction(VectorFunction):
+    """F_i(x) = 3 x_i + x_i^3 - x_(i-1) - x_(i+1) - b_i, a banded test system."""
+
+    def __init__(self, target: np.ndarray):
+        self.target = target
+        self.evaluations = 0
+
+    def dimension(self) -> int:
+        return len(self.target)
+
+    def value(self, x):
+        self.evaluations += 1
+        x = np.asarray(x, dtype=float)
+        result = 3.0 * x + x ** 3 - self.target
+        result[1:] -= x[:-1]
+        result[:-1] -= x[1:]
+        return result
+
+    def fork(self):
+        return TridiagonalFunction(self.target)
+
+    @staticmethod
+    def sparsity(n: int) -> np.ndarray:
+        index = np.arange(n)
+        return np.abs(index[:, None] - index[None, :]) <= 1
+
+
+class ArctanFunction(VectorFunction):
+    """F_i(x) = atan(x_i) + 0.1 x_(i-1) / (1 + x_(i-1)^2) - b_i, full Newton steps diverge far from the root."""
+
+    def __init__(self, target: np.ndarray):
+        self.target = target
+
+    def dimension(self) -> int:
+        return len(self.target)
+
+    def value(self, x):
+        x = np.asarray(x, dtype=float)
+        result = np.arctan(x) - self.target
+        result[1:] += 0.1 * x[:-1] / (1.0 + x[:-1] ** 2)
+        return result
+
+
+class ShiftedSquareFunction(VectorFunction):
+    """F_i(x) = x_i^2 + 1, ||F|| has a minimum at 0 without a root."""
+
+    def dimension(self) -> int:
+        return 4
+
+    def value(self, x):
+        return np.asarray(x, dtype=float) ** 2 + 1.0
+
+
+class BroydenSolverTest(unittest.TestCase):
+    def test_group_columns(self):
+        groups = group_columns(TridiagonalFunction.sparsity(10))
+        self.assertEqual(3, len(groups))
+        np.testing.assert_array_equal([0, 3, 6, 9], groups[0])
+        self.assertEqual(10, len(group_columns(np.tril(np.ones((10, 10), dtype=bool)))))
+
+    def test_maturity_sparsity(self):
+        node_dates = [100.0, 200.0, 300.0, 400.0]
+        sparsity = maturity_sparsity([150.0, 300.0, 400.0], node_dates)
+        np.testing.assert_array_equal([[True, True, False, False],
+                                       [True, True, True, False],
+                                       [True, True, True, True]], sparsity)
+        banded = maturity_sparsity([300.0, 400.0], node_dates, start_dates=[250.0, 300.0])
+        np.testing.assert_array_equal([[False, True, True, False], [False, False, True, True]], banded)
+        self.assertEqual(1, interpolation_reach(InterpolationMethod.MONOTONE_CONVEX))
+        self.assertTrue(np.all(maturity_sparsity([150.0], node_dates,
+                                                 interpolation_reach(InterpolationMethod.CUBIC_SPLINE))))
+
+    def test_sparse_jacobian(self):
+        n = 12
+        x = np.linspace(0.1, 0.5, n)
+        dense = BroydenSolver(TridiagonalFunction(np.ones(n)), None, 1e-12, 1e-7, 50)
+        dense.build_jacobian(x)
+        objective = TridiagonalFunction(np.ones(n))
+        sparse = BroydenSolver(objective, None, 1e-12, 1e-7, 50, sparsity=TridiagonalFunction.sparsity(n))
+        sparse.build_jacobian(x)
+
+        np.testing.assert_allclose(dense.jacobian.data, sparse.jacobian.data, atol=1e-6)
+        self.assertEqual(4, objective.evaluations)
+        self.assertEqual(4, sparse.get_statistics()["jacobian_evaluations"])
+
+    def test_solve_with_sparsity(self):
+        n = 12
+        objective = TridiagonalFunction(np.linspace(1.0, 2.0, n))
+        solver = BroydenSolver(objective, None, 1e-12, 1e-7, 50, sparsity=TridiagonalFunction.sparsity(n))
+        x = solver.solve(np.zeros(n))
+        self.assertLess(np.max(np.abs(objective.value(x))), 1e-12)
+
+    def test_sherman_morrison_updates(self):
+        n = 30
+        target = np.linspace(1.0, 2.0, n)
+        refactored = BroydenSolver(TridiagonalFunction(target), None, 1e-12, 1e-7, 50, refactor_interval=1)
+        expected = refactored.solve(np.zeros(n))
+
+        solver = BroydenSolver(TridiagonalFunction(target), None, 1e-12, 1e-7, 50)
+        x = solver.solve(np.zeros(n))
+        np.testing.assert_allclose(expected, x, atol=1e-12)
+        self.assertEqual(refactored.num_iter, solver.num_iter)
+        self.assertEqual(1 + solver.num_iter // solver.refactor_interval, solver.get_statistics()["factorizations"])
+        self.assertEqual(refactored.num_iter + 1, refactored.get_statistics()["factorizations"])
+
+    def test_singular_jacobian(self):
+        n = 4
+        solver = BroydenSolver(TridiagonalFunction(np.ones(n)), RealMatrix(np.ones((n, n))), 1e-12, 1e-7, 50)
+        with self.assertRaises(LinAlgError):
+            solver.solve_with_polish(np.zeros(n), False)
+
+    def test_initial_jacobian_is_not_modified(self):
+        n = 8
+        objective = TridiagonalFunction(np.ones(n))
+        builder = BroydenSolver(objective, None, 1e-12, 1e-7, 50)
+        builder.build_jacobian(np.zeros(n))
+        jacobian = builder.jacobian
+        initial = np.copy(jacobian.data)
+
+        solver = BroydenSolver(objective, jacobian, 1e-12, 1e-7, 50)
+        solver.solve_with_polish(np.zeros(n), False)
+        np.testing.assert_array_equal(initial, jacobian.data)
+
+    def test_polish_is_deterministic(self):
+        n = 10
+        objective = TridiagonalFunction(np.linspace(1.0, 2.0, n))
+        builder = BroydenSolver(objective, None, 1e-12, 1e-7, 50)
+        builder.build_jacobian(np.zeros(n))
+        solution = builder.solve(np.zeros(n))
+
+        results = []
+        for _ in range(2):
+            solver = BroydenSolver(objective, builder.jacobian, 1e-12, 1e-7, 50, polish_probes=3, seed=7)
+            solver.last_step = builder.last_step
+            solver.polish_jacobian(solution)
+            results.append(solver.jacobian.data)
+            self.assertEqual(5, solver.get_statistics()["polish_evaluations"])
+        np.testing.assert_array_equal(results[0], results[1])
+
+        probes = solver.get_probe_directions(n)
+        self.assertIs(probes, solver.get_probe_directions(n))
+        np.testing.assert_allclose(np.eye(3), probes.T @ probes, atol=1e-14)
+
+        # Without probes the polished Jacobian satisfies the secant condition along the previous step
+        solver = BroydenSolver(objective, builder.jacobian, 1e-12, 1e-7, 50)
+        solver.last_step = builder.last_step
+        solver.polish_jacobian(2.0 * solution)
+        delta_x = builder.last_step * (1e-7 / np.linalg.norm(builder.last_step))
+        exact = objective.value(2.0 * solution + delta_x) - objective.value(2.0 * solution)
+        np.testing.assert_allclose(exact, solver.jacobian.operate(delta_x), atol=1e-15)
+
+    def test_line_search(self):
+        n = 8
+        objective = ArctanFunction(np.linspace(0.1, 0.5, n))
+        # Full steps overshoot into the flat tails of arctan, where the Jacobian is singular
+        with warnings.catch_warnings(), self.assertRaises(LinAlgError):
+            warnings.simplefilter("ignore")
+            BroydenSolver(objective, None, 1e-12, 1e-7, 50).solve(np.full(n, 10.0))
+
+        solver = BroydenSolver(objective, None, 1e-12, 1e-7, 50, globalization=Globalization.LINE_SEARCH)
+        x = solver.solve(np.full(n, 10.0))
+        self.assertLess(np.max(np.abs(objective.value(x))), 1e-12)
+
+        statistics = solver.get_statistics()
+        self.assertGreater(statistics["backtracks"], 0)
+        self.assertLess(statistics["min_step_size"], 1.0)
+        self.assertEqual(statistics["iterations"] + 1 + statistics["backtracks"], statistics["function_evaluations"])
+
+    def test_dogleg(self):
+        n = 8
+        objective = ArctanFunction(np.linspace(0.1, 0.5, n))
+        solver = BroydenSolver(objective, None, 1e-12, 1e-7, 50, globalization=Globalization.DOGLEG,
+                               max_backtracks=2)
+        x = solver.solve(np.full(n, 10.0))
+        self.assertLess(np.max(np.abs(objective.value(x))), 1e-12)
+        self.assertGreater(solver.get_statistics()["trust_region_steps"], 0)
+
+        # At a minimum of ||F|| that is not a root no trial step is accepted
+        objective = ShiftedSquareFunction()
+        solver = BroydenSolver(objective, None, 1e-12, 1e-7, 50, globalization=Globalization.DOGLEG,
+                               max_backtracks=3)
+        with self.assertRaises(ConvergenceException):
+            solver.solve(np.zeros(4))
+        self.assertEqual(0, solver.get_statistics()["trust_region_steps"])
+
+        cauchy_step = np.array([1.0, 0.0])
+        newton_step = np.array([2.0, 2.0])
+        self.assertAlmostEqual(2.0, np.linalg.norm(BroydenSolver.dogleg(cauchy_step, newton_step, 2.0)), places=14)
+        np.testing.assert_array_equal([0.5, 0.0], BroydenSolver.dogleg(cauchy_step, newton_step, 0.5))
+        np.testing.assert_array_equal(newton_step, BroydenSolver.dogleg(cauchy_step, newton_step, 3.0))
+
+    def test_parallel_jacobian(self):
+        n = 16
+        x = np.linspace(0.1, 0.5, n)
+        serial = BroydenSolver(TridiagonalFunction(np.ones(n)), None, 1e-12, 1e-7, 50)
+        serial.build_jacobian(x)
+
+        for mode in (ExecutorMode.THREAD, ExecutorMode.PROCESS):
+            with ParallelEvaluator(mode, max_workers=3, chunk_size=5) as evaluator:
+                objective = TridiagonalFunction(np.ones(n))
+                solver = BroydenSolver(objective, None, 1e-12, 1e-7, 50, evaluator=evaluator)
+                solver.build_jacobian(x)
+                np.testing.assert_array_equal(serial.jacobian.data, solver.jacobian.data)
+                self.assertEqual(1, objective.evaluations)
+
+        # A function without fork() is solved serially, but refused by a thread pool
+        objective = ArctanFunction(np.linspace(0.1, 0.5, n))
+        BroydenSolver(objective, None, 1e-12, 1e-7, 50).build_jacobian(x)
+        with ParallelEvaluator(ExecutorMode.THREAD, max_workers=3, chunk_size=5) as evaluator:
+            with self.assertRaises(NotImplementedError):
+                BroydenSolver(objective, None, 1e-12, 1e-7, 50, evaluator=evaluator).build_jacobian(x)
+
+
+if __name__ == '__main__':
+    unittest.main()
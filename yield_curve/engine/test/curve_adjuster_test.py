@@ -0,0 +1,194 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.Exception.EngineException import EngineException
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.engine.curve_adjustment.curve_adjuster import CurveAdjuster
+from yield_curve.engine.curve_adjustment.curve_adjuster_parameters import CurveAdjusterParams
+
+
+class CurveAdjusterTest(unittest.TestCase):
+    def setUp(self):
+        dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0, 45017.0, 45383.0, 46113.0, 47939.0])
+        rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022, 0.025, 0.027, 0.026, 0.025])
+        self.anchor = CurveImpl(dates, rates, InterpolationMethod.LINEAR_ZERO)
+        self.basis = CurveImpl(dates, rates + 0.001 * np.sqrt(np.arange(len(dates))), InterpolationMethod.LINEAR_ZERO)
+        anchor_params = CurveAdjusterParams("A", [44317.0, 44348.0], [44470.0, 44652.0],
+                                            [45017.0, 45383.0, 46113.0], InterpolationMethod.MONOTONE_CONVEX, False)
+        basis_params = CurveAdjusterParams("B", [], [45010.0], [45017.0, 46113.0], InterpolationMethod.LINEAR_ZERO,
+                                           False)
+        self.adjuster = CurveAdjuster(44287.0, 47939.0, self.anchor, self.basis, None, True, anchor_params,
+                                      basis_params)
+
+    def test_adjustment_layout(self):
+        anchor_layout = self.adjuster.anchor_params.get_adjustment_layout(True)
+        self.assertEqual([0, 0, 0], [segment.curve_id for segment in anchor_layout])
+        np.testing.assert_array_equal([1, 2, 3], anchor_layout[2].nodes)
+        self.assertEqual(3, self.adjuster.anchor_params.get_adjustment_size(True))
+
+        basis_layout = self.adjuster.basis_params.get_adjustment_layout(False)
+        self.assertEqual([CurveAdjusterParams.SHORT_MID_CURVE, CurveAdjusterParams.MID_LONG_CURVE,
+                          CurveAdjusterParams.MAIN_CURVE], [segment.curve_id for segment in basis_layout])
+        self.assertEqual((0, 2), (basis_layout[2].start, basis_layout[2].stop))
+        self.assertIs(basis_layout, self.adjuster.basis_params.get_adjustment_layout(False))
+
+        dates = self.adjuster.get_adjustment_dates()
+        self.assertEqual(len(self.adjuster.get_adjustment_targets()), len(dates))
+        self.assertEqual(self.adjuster.anchor_curve.get_x()[1], dates[0])
+
+    def test_merge_nodes(self):
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            a_nodes = np.sort(rng.choice(np.arange(44000.0, 44400.0), 30, replace=False))
+            b_nodes = np.sort(rng.choice(np.arange(44000.0, 44400.0), 25, replace=False)) \
+                + rng.choice([0.0, 0.25, 0.5, 0.75], 25)
+            np.testing.assert_array_equal(CurveAdjuster.merge_nodes_sequential(a_nodes, b_nodes),
+                                          CurveAdjuster.merge_nodes(a_nodes, b_nodes))
+
+    def test_merge_nodes_dense_grid(self):
+        a_nodes = np.array([1.0, 1.5, 3.0])
+        b_nodes = np.array([1.2, 2.0, 2.7])
+        np.testing.assert_array_equal(CurveAdjuster.merge_nodes_sequential(a_nodes, b_nodes),
+                                      CurveAdjuster.merge_nodes(a_nodes, b_nodes))
+
+        # Daily and sub-daily grids, where a node can have two partners within the tolerance
+        rng = np.random.default_rng(11)
+        for step in (1.0, 0.5, 0.25):
+            grid = np.arange(44000.0, 44200.0, step)
+            for _ in range(50):
+                a_nodes = np.sort(rng.choice(grid, 120, replace=False))
+                b_nodes = np.sort(rng.choice(grid, 100, replace=False)) + rng.choice([0.0, 0.1, step / 2.0], 100)
+                b_nodes = np.unique(b_nodes)
+                for tolerance in (0.5, 0.3):
+                    np.testing.assert_array_equal(
+                        CurveAdjuster.merge_nodes_sequential(a_nodes, b_nodes, tolerance),
+                        CurveAdjuster.merge_nodes(a_nodes, b_nodes, tolerance))
+
+    def test_curve_diff(self):
+        diff = self.adjuster.curve_diff(self.anchor, self.basis)
+        expected = [self.basis.interpolate(d) - y for d, y in zip(self.anchor.get_x(), self.anchor.get_y())]
+        np.testing.assert_allclose(diff.get_y(), expected, rtol=1e-14)
+
+    def test_update_basis_curve(self):
+        anchor_curve = self.adjuster.anchor_curve
+        diff_curve = self.adjuster.diff_curve
+        diff_curve.get_y()[-1] = 0.003
+        diff_curve.update()
+        self.adjuster.update_basis_curve()
+
+        diff_max_date = diff_curve.get_x()[-1]
+        expected = [y + (diff_curve.interpolate(d) if d <= diff_max_date else diff_curve.get_y()[-1])
+                    for d, y in zip(anchor_curve.get_x(), anchor_curve.get_y())]
+        np.testing.assert_allclose(self.adjuster.basis_curve.get_y(), expected, rtol=1e-14)
+
+    def test_lazy_derived_curves(self):
+        self.assertEqual(0, self.adjuster.get_statistics()["basis_curve"])
+        self.adjuster.get_discount_curve()
+        basis_curve = self.adjuster.get_basis_curve()
+        self.assertEqual(1, self.adjuster.get_statistics()["basis_curve"])
+
+        adj_vect = np.full(10, 0.0001)
+        self.adjuster.adjust_curves(adj_vect)
+        self.adjuster.adjust_curves(adj_vect)
+        self.adjuster.get_anchor_curve()
+        statistics = self.adjuster.get_statistics()
+        self.assertEqual(1, statistics["basis_curve"])
+        self.assertEqual(0, statistics["high_res_basis_curve"])
+        self.assertEqual(0, statistics["anchor_overlap_curves"])
+
+        self.assertIs(basis_curve, self.adjuster.get_basis_curve())
+        self.adjuster.get_high_res_basis_curve()
+        self.adjuster.get_high_res_basis_curve()
+        self.adjuster.get_anchor_short_mid_basis_curve()
+        self.adjuster.get_anchor_mid_long_basis_curve()
+        statistics = self.adjuster.get_statistics()
+        self.assertEqual(2, statistics["basis_curve"])
+        self.assertEqual(1, statistics["high_res_basis_curve"])
+        self.assertEqual(1, statistics["anchor_overlap_curves"])
+
+        anchor_curve = self.adjuster.get_anchor_curve()
+        expected = anchor_curve.get_y() + self.adjuster.get_diff_curve().interpolate_array(anchor_curve.get_x())
+        np.testing.assert_allclose(basis_curve.get_y(), expected, rtol=1e-14)
+
+    def test_apply_delta(self):
+        adj_vect = np.linspace(-0.001, 0.001, 10)
+        self.adjuster.adjust_curves(adj_vect)
+        base = [np.copy(curve.get_y()) for curve in self.adjuster.get_adjusted_curves()]
+        base_basis = np.copy(self.adjuster.get_basis_curve().get_y())
+        num_targets = len(self.adjuster.get_adjustment_targets())
+
+        for index in range(num_targets):
+            self.adjuster.push_state()
+            self.adjuster.apply_delta(index, 0.0005)
+            bumped = [np.copy(curve.get_y()) for curve in self.adjuster.get_adjusted_curves()]
+            bumped_basis = np.copy(self.adjuster.get_basis_curve().get_y())
+            self.adjuster.pop_state()
+
+            for curve, y in zip(self.adjuster.get_adjusted_curves(), base):
+                np.testing.assert_array_equal(y, curve.get_y())
+            np.testing.assert_allclose(base_basis, self.adjuster.get_basis_curve().get_y(), atol=1e-15)
+
+            bumped_vect = np.copy(adj_vect)
+            bumped_vect[index] += 0.0005
+            self.adjuster.adjust_curves(bumped_vect)
+            for curve, y in zip(self.adjuster.get_adjusted_curves(), bumped):
+                np.testing.assert_allclose(y, curve.get_y(), atol=1e-15)
+            np.testing.assert_allclose(bumped_basis, self.adjuster.get_basis_curve().get_y(), atol=1e-15)
+            self.adjuster.adjust_curves(adj_vect)
+
+    def test_nested_states(self):
+        initial = np.copy(self.adjuster.get_anchor_curve().get_y())
+        self.adjuster.push_state()
+        self.adjuster.adjust_curves(np.full(10, 0.001))
+        self.adjuster.push_state()
+        self.adjuster.apply_delta(1, 0.002)
+        self.adjuster.pop_state()
+        self.adjuster.pop_state()
+        np.testing.assert_array_equal(initial, self.adjuster.get_anchor_curve().get_y())
+        self.assertEqual(0, len(self.adjuster.undo_log))
+        with self.assertRaises(EngineException):
+            self.adjuster.pop_state()
+
+    def test_fork(self):
+        forked = self.adjuster.fork()
+        self.assertIs(self.adjuster.anchor_curve.get_x(), forked.anchor_curve.get_x())
+        self.assertIs(self.adjuster.anchor_curve_y, forked.anchor_curve_y)
+        self.assertIsNot(self.adjuster.anchor_curve.get_y(), forked.anchor_curve.get_y())
+
+        before = np.copy(self.adjuster.get_basis_curve().get_y())
+        forked.adjust_curves(np.full(10, 0.001))
+        np.testing.assert_array_equal(before, self.adjuster.get_basis_curve().get_y())
+
+        self.adjuster.adjust_curves(np.full(10, 0.001))
+        np.testing.assert_array_equal(self.adjuster.get_basis_curve().get_y(), forked.get_basis_curve().get_y())
+
+    def test_concurrent_forks(self):
+        vectors = [np.full(10, 0.0001 * k) for k in range(8)]
+
+        def basis_rates(adjuster, adj_vect):
+            adjuster.adjust_curves(adj_vect)
+            return np.copy(adjuster.get_basis_curve().get_y())
+
+        expected = [basis_rates(self.adjuster, adj_vect) for adj_vect in vectors]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda v: basis_rates(self.adjuster.fork(), v), vectors))
+        for rates, expected_rates in zip(results, expected):
+            np.testing.assert_array_equal(expected_rates, rates)
+
+
+if __name__ == '__main__':
+    unittest.main()
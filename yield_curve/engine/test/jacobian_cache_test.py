@@ -0,0 +1,66 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tempfile
+import unittest
+import numpy as np
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.engine.curve_adjustment.broyden_solver import BroydenSolver
+from yield_curve.engine.curve_adjustment.jacobian_cache import JacobianCache
+from yield_curve.engine.test.broyden_solver_test import TridiagonalFunction
+
+
+class JacobianCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [44317.0, 44348.0, 44470.0]
+        self.key = JacobianCache.fingerprint(["FRA1", "FRA2", "SWAP5Y"], self.nodes, InterpolationMethod.LINEAR_ZERO)
+
+    def test_fingerprint(self):
+        self.assertEqual(self.key, JacobianCache.fingerprint(("FRA1", "FRA2", "SWAP5Y"), np.array(self.nodes),
+                                                             InterpolationMethod.LINEAR_ZERO))
+        self.assertNotEqual(self.key, JacobianCache.fingerprint(["FRA1", "FRA2", "SWAP5Y"], self.nodes,
+                                                                InterpolationMethod.MONOTONE_CONVEX))
+        self.assertNotEqual(self.key, JacobianCache.fingerprint(["FRA1", "SWAP5Y"], self.nodes,
+                                                                InterpolationMethod.LINEAR_ZERO))
+
+    def test_lru_eviction(self):
+        cache = JacobianCache(max_size=2)
+        for k in range(3):
+            cache.put(str(k), np.eye(2) * k)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("0"))
+        np.testing.assert_array_equal(np.eye(2) * 2, cache.get("2"))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            JacobianCache(directory=directory).put(self.key, np.arange(9.0).reshape(3, 3))
+            restored = JacobianCache(directory=directory).get(self.key)
+            np.testing.assert_array_equal(np.arange(9.0).reshape(3, 3), restored)
+
+    def test_warm_start(self):
+        n = 12
+        cache = JacobianCache()
+        cold = BroydenSolver(TridiagonalFunction(np.linspace(1.0, 2.0, n)), None, 1e-12, 1e-7, 50)
+        x = cache.solve(cold, self.key, np.zeros(n))
+        self.assertEqual(n + 1, cold.get_statistics()["jacobian_evaluations"])
+
+        objective = TridiagonalFunction(np.linspace(1.0, 2.0, n) + 0.001)
+        warm = BroydenSolver(objective, None, 1e-12, 1e-7, 50)
+        y = cache.solve(warm, self.key, x)
+        self.assertEqual(0, warm.get_statistics()["jacobian_evaluations"])
+        self.assertLess(warm.num_iter, cold.num_iter)
+        self.assertLess(np.max(np.abs(objective.value(y))), 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Licensed under the Apache License, Version 2.0
+# Copyright 2024 Zahid Hossain <zhossainny@gmail.com>
+#
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from yield_curve.common.curve.CurveImp import CurveImpl
+from yield_curve.common.curve.Exception.EngineException import EngineException
+from yield_curve.common.curve.interpolation_method import InterpolationMethod
+from yield_curve.engine.curve_adjustment.curve_adjuster import CurveAdjuster
+from yield_curve.engine.curve_adjustment.curve_adjuster_parameters import CurveAdjusterParams
+from yield_curve.engine.curve_adjustment.multi_curve_adjuster import MultiCurveAdjuster
+
+
+class MultiCurveAdjusterTest(unittest.TestCase):
+    def setUp(self):
+        dates = np.array([44287.0, 44317.0, 44348.0, 44378.0, 44470.0, 44652.0, 45017.0, 45383.0, 46113.0, 47939.0])
+        rates = np.array([0.02, 0.01, 0.011, 0.012, 0.015, 0.022, 0.025, 0.027, 0.026, 0.025])
+        self.curves = [CurveImpl(dates, rates + 0.001 * k, InterpolationMethod.LINEAR_ZERO) for k in range(3)]
+        self.params = [
+            CurveAdjusterParams("SOFR", [44317.0, 44348.0], [44470.0, 44652.0], [45017.0, 45383.0, 46113.0],
+                                InterpolationMethod.MONOTONE_CONVEX, False),
+            CurveAdjusterParams("TSOFR3M", [], [45010.0], [45017.0, 46113.0], InterpolationMethod.LINEAR_ZERO, False),
+            CurveAdjusterParams("LIBOR3M", [], [45010.0], [45017.0, 45383.0, 46113.0],
+                                InterpolationMethod.LINEAR_ZERO, False),
+        ]
+        self.adjuster = MultiCurveAdjuster(44287.0, 47939.0, self.curves, self.params, [None, 0, 1])
+
+    def test_blocks(self):
+        self.assertEqual(3 + 2 + 3, self.adjuster.get_dimension())
+        self.assertEqual(slice(3, 5), self.adjuster.get_block(1))
+        np.testing.assert_array_equal([[True, False, False], [True, True, False], [True, True, True]],
+                                      self.adjuster.get_block_dependencies())
+        sparsity = self.adjuster.get_jacobian_sparsity([0, 2])
+        np.testing.assert_array_equal([True] * 3 + [False] * 5, sparsity[0])
+        self.assertTrue(np.all(sparsity[1]))
+
+    def test_root_matches_curve_adjuster(self):
+        basis_params = CurveAdjusterParams("B", [], [45010.0], [45017.0, 46113.0], InterpolationMethod.LINEAR_ZERO,
+                                           False)
+        single = CurveAdjuster(44287.0, 47939.0, self.curves[0], self.curves[1], None, True, self.params[0],
+                               basis_params)
+        adj_vect = np.linspace(-0.001, 0.001, self.adjuster.get_dimension())
+        single.adjust_curves(np.concatenate((adj_vect[:3], np.zeros(7))))
+        self.adjuster.adjust_curves(adj_vect)
+        np.testing.assert_array_equal(single.get_anchor_curve().get_y(), self.adjuster.get_curve(0).get_y())
+
+    def test_dependent_curve_matches_curve_adjuster(self):
+        single = CurveAdjuster(44287.0, 47939.0, self.curves[0], self.curves[1], None, True, self.params[0],
+                               self.params[1])
+        adjuster = MultiCurveAdjuster(44287.0, 47939.0, self.curves[:2], self.params[:2], [None, 0])
+        for adj_vect in (np.zeros(adjuster.get_dimension()), np.linspace(-0.001, 0.001, adjuster.get_dimension())):
+            single.adjust_curves(adj_vect)
+            adjuster.adjust_curves(adj_vect)
+            np.testing.assert_allclose(single.get_basis_curve().get_y(), adjuster.get_curve(1).get_y(), rtol=1e-14)
+
+        # With no adjustment the dependent curve reproduces its input on the parent nodes
+        single.adjust_curves(np.zeros(adjuster.get_dimension()))
+        nodes = single.get_basis_curve().get_x()
+        np.testing.assert_allclose(single.get_basis_curve().get_y()[1:-1], self.curves[1].interpolate_array(nodes)[1:-1],
+                                   atol=1e-12)
+
+    def test_dependent_curves(self):
+        adj_vect = np.linspace(-0.001, 0.001, self.adjuster.get_dimension())
+        self.adjuster.adjust_curves(adj_vect)
+        for i in (1, 2):
+            parent = self.adjuster.get_curve(i - 1)
+            diff = self.adjuster.get_diff_curve(i)
+            expected = parent.get_y() + diff.interpolate_array(parent.get_x())
+            np.testing.assert_allclose(expected, self.adjuster.get_curve(i).get_y(), rtol=1e-14)
+        self.assertIs(self.adjuster.get_curve(2), self.adjuster.get_curve_for_index("LIBOR3M"))
+
+    def test_block_isolation(self):
+        adj_vect = np.linspace(-0.001, 0.001, self.adjuster.get_dimension())
+        self.adjuster.adjust_curves(adj_vect)
+        before = [np.copy(self.adjuster.get_curve(i).get_y()) for i in range(3)]
+        counts = dict(self.adjuster.get_statistics())
+
+        block = self.adjuster.get_block(2)
+        self.adjuster.adjust_block(2, adj_vect[block] + 0.0005)
+        for i in (0, 1):
+            np.testing.assert_array_equal(before[i], self.adjuster.get_curve(i).get_y())
+        self.assertFalse(np.array_equal(before[2], self.adjuster.get_curve(2).get_y()))
+        statistics = self.adjuster.get_statistics()
+        self.assertEqual(counts["curve_TSOFR3M"], statistics["curve_TSOFR3M"])
+        self.assertEqual(counts["curve_LIBOR3M"] + 1, statistics["curve_LIBOR3M"])
+
+    def test_fork(self):
+        forked = self.adjuster.fork()
+        forked.adjust_curves(np.full(self.adjuster.get_dimension(), 0.001))
+        self.adjuster.adjust_curves(np.zeros(self.adjuster.get_dimension()))
+        self.assertFalse(np.array_equal(forked.get_curve(2).get_y(), self.adjuster.get_curve(2).get_y()))
+
+    def test_invalid_parent(self):
+        with self.assertRaises(EngineException):
+            MultiCurveAdjuster(44287.0, 47939.0, self.curves, self.params, [None, 2, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()